@@ -44,7 +44,7 @@ from lib.workers import UploadWorker, DownloadLogWorker
 from lib.widgets import ConcheckToolsWidget, CRExecutorWidget, ExcelReaderApp, WorkerThread, CMBulkFileMergeWidget, RehomingScriptToolsWidget
 from lib.before_after_widget import BeforeAfterReportWidget
 from lib.log_checker import check_logs_and_export_to_excel
-from lib.report_generator import process_single_log, CATEGORY_CHECKING, CATEGORY_CHECKING1, write_logs_to_excel
+from lib.report_generator import process_single_log, CATEGORY_CHECKING, CATEGORY_CHECKING1, write_logs_to_excel, shutdown_parse_pool
 from lib.style import (
     TransparentTextEdit, setup_window_style, update_window_style,
     StyledPushButton, StyledLineEdit, StyledProgressBar, StyledLabel,
@@ -379,6 +379,9 @@ class SSHManager(QMainWindow):
         
         # Clean up temporary directories in Temp folder
         self.cleanup_temp_directories()
+
+        # Stop the shared log parsing pool
+        shutdown_parse_pool()
         
         if getattr(self, 'DEBUG_MODE', 'DEBUG') == 'DEBUG':
             debug_print("Accepting close event.")
@@ -0,0 +1,129 @@
+# Benchmark / regression check for report_before_after_KPI.process_kpi_logs
+#
+# Usage:
+#   python benchmarks/bench_kpi_logs.py [NODES] [ROPS]
+#
+# Writes NODES synthetic node logs (default 2000) with GREP_KPI_LTE lines of
+# ROPS 15-minute ROPs (default 96, one day) for 3 cells x 4 KPIs, then parses
+# them with the legacy per-file readlines()/dict loop (kept below as
+# reference) and with the streaming read_kpi_values + pivot_kpi_values. The
+# run fails if the two frames differ (values compared as numbers).
+
+import os
+import sys
+import glob
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+
+from lib.report_before_after_KPI import read_kpi_values, pivot_kpi_values
+
+PATTERN = "GREP_KPI_LTE"
+KPIS = ["Acc_RrcConnSetupSuccRate", "Acc_InitialErabSetupSuccRate", "Ret_ErabDropRate", "Int_DlThroughput"]
+
+
+def write_logs(folder, nodes, rops):
+    rnd = random.Random(0)
+    times = pd.date_range("2025-04-10 00:00", periods=rops, freq="15min").strftime("%Y-%m-%d %H:%M").tolist()
+    for n in range(nodes):
+        lines = [f"NODE{n:05d}> lt all", f"{PATTERN}; Object; Counter; " + "; ".join(times) + ";"]
+        for cell in range(3):
+            for kpi in KPIS:
+                values = [f"{rnd.uniform(90, 100):.2f}" if rnd.random() > 0.01 else "N/A" for _ in times]
+                lines.append(f"{PATTERN}; EUtranCellFDD=C{cell}; {kpi}; " + "; ".join(values) + ";")
+        with open(os.path.join(folder, f"NODE{n:05d}.log"), "w") as f:
+            f.write("\n".join(lines) + "\nBye\n")
+
+
+def legacy_process_kpi_logs(folder, pattern, start_defined):
+    # process_kpi_logs before the streaming parser
+    all_data = []
+    datetime_headers = set()
+    for log_file in sorted(glob.glob(os.path.join(folder, "*.log")), key=os.path.getsize):
+        nodename = os.path.splitext(os.path.basename(log_file))[0]
+        temp_data = []
+        temp_datetime_headers = set()
+        with open(log_file, "r", encoding='utf-8', errors='ignore') as file:
+            for line in file.readlines():
+                if line.startswith(pattern):
+                    parts = line.strip().rstrip(";").split("; ")
+                    if "Object" in parts and "Counter" in parts:
+                        temp_datetime_headers.update(parts[3:])
+                    else:
+                        temp_data.append(parts[1:])
+        if temp_data:
+            datetime_headers.update(temp_datetime_headers)
+            temp_datetime_headers = sorted(temp_datetime_headers)
+            columns = ["NODENAME", "Object", "Counter"] + temp_datetime_headers
+            formatted_data = []
+            for row in temp_data:
+                row_dict = {"NODENAME": nodename, "Object": row[0], "Counter": row[1]}
+                for dt in temp_datetime_headers:
+                    row_dict[dt] = "N/A"
+                for i, dt in enumerate(row[2:]):
+                    if i < len(temp_datetime_headers):
+                        row_dict[temp_datetime_headers[i]] = dt
+                formatted_data.append(row_dict)
+            datetime_mapping = {}
+            temp_df = pd.DataFrame(formatted_data, columns=columns)
+            for col in temp_df.columns:
+                try:
+                    dt = pd.to_datetime(col, format="%Y-%m-%d %H:%M", errors='raise')
+                    datetime_mapping[col] = dt.strftime("%Y-%m-%d %H:%M")
+                except ValueError:
+                    pass
+            temp_df.columns = [datetime_mapping.get(col, col) for col in temp_df.columns]
+            all_data.append(temp_df)
+    datetime_candidates = sorted([
+        col for col in datetime_headers
+        if pd.to_datetime(col, format='%Y-%m-%d %H:%M', errors='coerce') >= pd.Timestamp(start_defined)
+    ])
+    final_columns = ["NODENAME", "Object", "Counter"] + datetime_candidates[:20]
+    if not all_data:
+        return pd.DataFrame(columns=final_columns)
+    df = pd.concat(all_data, ignore_index=True).reindex(columns=final_columns)
+    df.fillna("N/A", inplace=True)
+    return df
+
+
+def same_frames(legacy, streamed):
+    if list(legacy.columns) != list(streamed.columns):
+        return False
+    keys = ["NODENAME", "Object", "Counter"]
+    if legacy[keys].astype(object).values.tolist() != streamed[keys].values.tolist():
+        return False
+    old = legacy.iloc[:, 3:].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    new = streamed.iloc[:, 3:].replace("N/A", np.nan).to_numpy(dtype=float)
+    return np.array_equal(old, new, equal_nan=True)
+
+
+def main(nodes=2000, rops=96):
+    start_defined = "2025-04-10 12:00"
+    with tempfile.TemporaryDirectory() as folder:
+        write_logs(folder, nodes, rops)
+        print(f"{nodes} nodes x {rops} ROPs")
+
+        start = time.perf_counter()
+        legacy = legacy_process_kpi_logs(folder, PATTERN, start_defined)
+        print(f"legacy    : {time.perf_counter() - start:6.2f}s")
+
+        start = time.perf_counter()
+        values = read_kpi_values(folder, PATTERN)
+        parsed = time.perf_counter() - start
+        streamed = pivot_kpi_values(values, start_defined)
+        print(f"streaming : {time.perf_counter() - start:6.2f}s (parse {parsed:.2f}s, {len(values)} values)")
+
+    if not same_frames(legacy, streamed):
+        print("MISMATCH between legacy and streaming frames")
+        return 1
+    print(f"frames match: {streamed.shape}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:3])))
@@ -0,0 +1,83 @@
+# Memory benchmark for the log_checker row accumulators
+#
+# Usage:
+#   python benchmarks/bench_log_checker_rows.py [NODES]
+#
+# Accumulates the alarm and cell status rows of NODES synthetic hygiene logs
+# (default 20000 nodes, 10 alarms and 12 cells each) as the old list of
+# per-row dicts and as ColumnarRows, builds the DataFrames, and prints the
+# time and Python peak memory (tracemalloc) of each.
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import pandas as pd
+
+from lib.log_checker import ColumnarRows, ALARM_COLUMNS
+
+ALARMS_PER_NODE = 10
+CELLS_PER_NODE = 12
+CELL_COLUMNS = ("FILE", "NODENAME", "MO", "administrativestate", "operationalstate")
+
+
+def sample_rows(nodes):
+    for n in range(nodes):
+        fname = f"ENM{n % 12}.zip"
+        nodename = f"NODE{n:06d}"
+        alarms = [
+            (fname, "99_Hygiene_collect", nodename, "2025-05-07", f"10:{a:02d}:00", "Major",
+             "Link failure", f"Cell={a}", "transmission", f"text {a}")
+            for a in range(ALARMS_PER_NODE)
+        ]
+        cells = [
+            (fname, nodename, f"EUtranCellFDD={nodename}_{c}", "1 (UNLOCKED)", "1 (ENABLED)")
+            for c in range(CELLS_PER_NODE)
+        ]
+        yield alarms, cells
+
+
+def run_dicts(nodes):
+    alarm_rows, cell_rows = [], []
+    for alarms, cells in sample_rows(nodes):
+        alarm_rows.extend(dict(zip(ALARM_COLUMNS, values)) for values in alarms)
+        cell_rows.extend(dict(zip(CELL_COLUMNS, values)) for values in cells)
+    return pd.DataFrame(alarm_rows), pd.DataFrame(cell_rows)
+
+
+def run_columnar(nodes):
+    alarm_rows, cell_rows = ColumnarRows(), ColumnarRows()
+    for alarms, cells in sample_rows(nodes):
+        for values in alarms:
+            alarm_rows.add(ALARM_COLUMNS, values)
+        for values in cells:
+            cell_rows.add(CELL_COLUMNS, values)
+    return alarm_rows.to_frame(), cell_rows.to_frame()
+
+
+def measure(name, func, nodes):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df_alarm, df_cell = func(nodes)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    frames_mb = (df_alarm.memory_usage(deep=True).sum() + df_cell.memory_usage(deep=True).sum()) / 2**20
+    print(f"{name:<9}: {elapsed:6.2f}s  peak {peak / 2**20:8.1f} MB  DataFrames {frames_mb:8.1f} MB")
+    return df_alarm, df_cell
+
+
+def main(nodes=20000):
+    print(f"{nodes} nodes, {nodes * ALARMS_PER_NODE} alarm rows, {nodes * CELLS_PER_NODE} cell rows")
+    old = measure("dicts", run_dicts, nodes)
+    new = measure("columnar", run_columnar, nodes)
+    for a, b in zip(old, new):
+        pd.testing.assert_frame_equal(a, b.astype({col: object for col in ("FILE", "FOLDER", "NODENAME") if col in b}), check_dtype=False)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000))
@@ -0,0 +1,246 @@
+# Benchmark / regression check for report_generator.process_single_log
+#
+# Usage:
+#   python benchmarks/bench_process_single_log.py [LOG_FOLDER]
+#
+# LOG_FOLDER is a CR folder with recorded mobatch *.log files. Without it a
+# synthetic corpus (BB and RNC scripts, errors, UNREMOTE nodes) is generated.
+# Every log is parsed by the legacy line loop (kept below as reference) and by
+# the current process_single_log; the run fails if any log_data differs.
+# The ####LOG_x sections collected while streaming are checked against the
+# former second readlines() pass, and the bytes read are reported.
+
+import os
+import re
+import sys
+import time
+import mmap
+import random
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.report_generator import process_single_log, CATEGORY_CHECKING1
+from lib.line_classifier import SectionCollector
+
+
+def legacy_log_data(filename, folder_path, selected_file):
+    # Command pass of process_single_log before the line classifier was introduced
+    filepath = os.path.join(folder_path, filename)
+    node_log = re.search(r"^(.*?).log$", filename, re.IGNORECASE).group(1) if re.search(r"^(.*?).log$", filename, re.IGNORECASE) else filename
+    local_log_data = []
+    pattern_cmd = re.compile(r"^[A-Z0-9\_\-]{4,180}\>(.*?)$", re.IGNORECASE)
+    tag_errs = [
+        re.compile(r"^(ERROR:.*?:.*?)$", re.IGNORECASE),
+        re.compile(r"(!!!!\s+(ERROR|Processing):.*?)$", re.IGNORECASE),
+        re.compile(r"(!!!!\s+Processing.*?)$", re.IGNORECASE),
+        re.compile(r"^(>>>.*?:.*?)$", re.IGNORECASE),
+        re.compile(r"^(Total.*?MOs\s+attempted.*?)$", re.IGNORECASE)
+    ]
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        type_script = "NULL"
+        type_script_rnc = "NULL"
+        line_execute = "NULL"
+        TAG_RESULT = "NULL"
+        truni_script = "NULL"
+        TAG_RESULT_FULL = "NULL"
+        number_tag = 0
+        cmd_get = "NULL"
+        att_list = []
+        for line in iter(mm.readline, b''):
+            line = line.decode(errors='ignore')
+            cmd_match = pattern_cmd.search(line)
+            cmd_get_1 = cmd_match.group(1).strip() if cmd_match else line_execute
+            type_script = re.search(r".*?run\s+.*?\$nodename\_(.*?).mos$", line, re.IGNORECASE).group(1) if re.search(r".*?run\s+.*?\$nodename\_(.*?).mos$", line, re.IGNORECASE) else type_script
+            truni_script = re.search(r".*?(trun|truni)\s+(.*?)$", line, re.IGNORECASE).group(1) if re.search(r".*?(trun|truni)\s+(.*?)$", line, re.IGNORECASE) else truni_script
+            if truni_script != "NULL":
+                type_script_rnc = (m.group(2) if (m := re.search(r".*?trun(i)?\s+(.*?).mo(s)?$", line, re.IGNORECASE)) else type_script_rnc)
+                line_execute = re.search(r"^(CREATE.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(CREATE.*?)$", line, re.IGNORECASE) else line_execute
+                line_execute = re.search(r"^(DELETE.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(DELETE.*?)$", line, re.IGNORECASE) else line_execute
+                line_execute = re.search(r"^(SET\s+.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(SET\s+.*?)$", line, re.IGNORECASE) else line_execute
+                if re.search(r"^!!!!.*?TAG\s+:\"(.*?)\".*?$", line, re.IGNORECASE):
+                    TAG_RESULT = re.search(r"^!!!!.*?TAG\s+:\"(.*?)\".*?$", line, re.IGNORECASE).group(1)
+                    TAG_RESULT_FULL = line.rstrip()
+                if re.search(r"^>>>\s+(\[.*?\]).*?$", line, re.IGNORECASE):
+                    TAG_RESULT = re.search(r"^>>>\s+(\[.*?\]).*?$", line, re.IGNORECASE).group(1)
+                    TAG_RESULT_FULL = line.rstrip()
+                if (len(line.rstrip()) == 0 and line_execute != "NULL"):
+                    if(len(TAG_RESULT_FULL.rstrip()) == 0):
+                        TAG_RESULT = "Executed"
+                    TAG_REPORT, TAG_COLOR = CATEGORY_CHECKING1(TAG_RESULT)
+                    att_list = [TAG_RESULT_FULL.strip()]
+                    local_log_data.append((selected_file, node_log, type_script_rnc, line_execute.strip(), TAG_REPORT, TAG_RESULT, att_list))
+                    line_execute = "NULL"
+                    TAG_RESULT = "NULL"
+                    TAG_RESULT_FULL = ""
+            if truni_script == "NULL":
+                if pattern_cmd.match(line):
+                    if number_tag == 1:
+                        if re.search(r"^(del|rdel|crn|set)", cmd_get.strip(), re.IGNORECASE):
+                            TAG_REPORT, TAG_COLOR = CATEGORY_CHECKING1(TAG_RESULT)
+                            local_log_data.append((selected_file, node_log, type_script, line_execute.strip(), TAG_REPORT.strip(), TAG_RESULT.strip(), att_list))
+                            TAG_RESULT = "NULL"
+                        number_tag = 0
+                    number_tag += 1
+                    cmd_get = cmd_get_1
+                for pattern in tag_errs:
+                    match = pattern.search(line)
+                    if match:
+                        TAG_RESULT = match.group(1)
+                if pattern_cmd.match(line):
+                    att_list = ["", line.strip()]
+                else:
+                    att_list.append(line.strip())
+            if "Checking ip contact...Not OK" in line:
+                local_log_data.append((selected_file, node_log, "", "", "UNREMOTE", line.strip(), ""))
+            if re.search(r"(?i)tbac\s*control\s*-\s*unauthori[sz]ed\s*network\s*element", line):
+                local_log_data.append((selected_file, node_log, "", "", "UNREMOTE", line.strip(), ""))
+    return local_log_data
+
+
+def legacy_sections(filepath):
+    # Second read of the log that collected the ####LOG_x sections
+    log_data_sections = {'LOG_Alarm_bf': [], 'LOG_status_bf': [], 'LOG_Alarm_af': [], 'LOG_status_af': []}
+    mode = None
+    collecting = False
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        lines = f.readlines()
+    for line in lines:
+        stripped = line.strip()
+        if '####LOG_Alarm_bf' in stripped:
+            mode, collecting = 'LOG_Alarm_bf', False
+            continue
+        elif '####LOG_status_bf' in stripped:
+            mode, collecting = 'LOG_status_bf', False
+            continue
+        elif '####LOG_Alarm_af' in stripped:
+            mode, collecting = 'LOG_Alarm_af', False
+            continue
+        elif '####LOG_status_af' in stripped:
+            mode, collecting = 'LOG_status_af', False
+            continue
+        if stripped == "" and collecting:
+            mode, collecting = None, False
+            continue
+        if ';' in stripped and mode:
+            collecting = True
+            log_data_sections[mode].append(stripped)
+    return log_data_sections
+
+
+def streamed_sections(filepath):
+    collector = SectionCollector()
+    with open(filepath, 'rb') as f:
+        for line in f:
+            collector.feed(line.decode(errors='ignore'))
+    return collector.sections
+
+
+PREPOST_BLOCK = [
+    "{node}> ####LOG_Alarm_{when}\n",
+    "Date;Time;Severity;Object;Problem;Cause;AdditionalText\n",
+    "2025-05-07;10:00:00;M;EUtranCellFDD=CELL1;Cell down;x;y\n",
+    "\n",
+    "{node}> ####LOG_status_{when}\n",
+    "MO;administrativeState;operationalState\n",
+    "EUtranCellFDD=CELL1;1 (UNLOCKED);1 (ENABLED)\r\n",
+    "EUtranCellFDD=CELL2;0 (LOCKED);0 (DISABLED)\n",
+    "\n",
+]
+
+BB_BLOCKS = [
+    "{node}> run $nodename_{script}.mos\n",
+    "{node}> lt all\n",
+    "Checking MOM version...RadioNode_R1\n",
+    "{node}> set EUtranCellFDD=CELL{i} qRxLevMin -124\n",
+    "{i} EUtranCellFDD=CELL{i} qRxLevMin -120 --> -124 set.\n",
+    "Total: 1 MOs attempted, 1 MOs set\n",
+    "{node}> crn ENodeBFunction=1,EUtranCellRelation={i}\n",
+    "!!!! Processing failure :  MO already exists\n",
+    "ERROR: crn : Parent MO not found\n",
+    "{node}> rdel EUtranFreqRelation={i}\n",
+    ">>> Total: 0 MOs attempted, 0 MOs deleted\n",
+    "{node}> del UtranCellRelation={i}\n",
+    "!!!! ERROR: operation-failed unknown-attribute\n",
+    "{node}> get . userLabel\n",
+    "\n",
+]
+
+RNC_BLOCKS = [
+    "{node}> truni $nodename_{script}.mos\n",
+    "CREATE\n",
+    "(\n",
+    "   parent \"ManagedElement=1,RncFunction=1\"\n",
+    "   identity \"{i}\"\n",
+    ")\n",
+    "!!!! Processing TAG :\"Proxy ID = {i}\" on line {i}\n",
+    "\n",
+    "SET UtranCell=CELL{i} primaryCpichPower 300\n",
+    ">>> [MoNotFound] UtranCell=CELL{i}\n",
+    "\n",
+    "DELETE UtranRelation={i}\n",
+    "\n",
+    "SET\n",
+    "\n",
+]
+
+UNREMOTE_LINES = [
+    "Checking ip contact...Not OK\n",
+    "Tbac Control - Unauthorized Network Element\n",
+]
+
+
+def write_sample_corpus(folder, nodes=300, blocks=40, seed=1):
+    rnd = random.Random(seed)
+    for n in range(nodes):
+        node = f"NODE{n:05d}"
+        lines = [f"Logging to file {node}.log\n", f"{node}> lt all\n"]
+        lines.extend(t.format(node=node, when="bf") for t in PREPOST_BLOCK)
+        template = RNC_BLOCKS if n % 4 == 0 else BB_BLOCKS
+        for i in range(blocks):
+            lines.extend(t.format(node=node, script="CR_SCRIPT", i=i) for t in template if rnd.random() > 0.1)
+        lines.extend(t.format(node=node, when="af") for t in PREPOST_BLOCK)
+        if n % 25 == 0:
+            lines.append(rnd.choice(UNREMOTE_LINES))
+        lines.append(f"{node}> q\nBye...\n")
+        with open(os.path.join(folder, f"{node}.log"), "w") as f:
+            f.writelines(lines)
+
+
+def main(folder=None):
+    tmp = None
+    if folder is None:
+        tmp = tempfile.TemporaryDirectory()
+        folder = tmp.name
+        write_sample_corpus(folder)
+    log_files = sorted(f for f in os.listdir(folder) if f.lower().endswith('.log'))
+
+    start = time.perf_counter()
+    legacy = [legacy_log_data(f, folder, "CR") for f in log_files]
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [process_single_log((f, folder, "CR")) for f in log_files]
+    current_time = time.perf_counter() - start
+    current = [r["log_data"] for r in results]
+
+    mismatches = [f for f, a, b in zip(log_files, legacy, current) if a != b]
+    mismatches += [f for f in log_files
+                   if legacy_sections(os.path.join(folder, f)) != streamed_sections(os.path.join(folder, f))]
+    rows = sum(len(r) for r in current)
+    file_bytes = sum(os.path.getsize(os.path.join(folder, f)) for f in log_files)
+    bytes_read = sum(r["bytes_read"] for r in results)
+    print(f"{len(log_files)} logs, {rows} rows")
+    print(f"legacy loop          : {legacy_time:.3f}s")
+    print(f"process_single_log   : {current_time:.3f}s (includes section parsing)")
+    print(f"bytes read           : {bytes_read} (two-pass read was {2 * file_bytes})")
+    if mismatches:
+        print(f"MISMATCH in {len(mismatches)} logs, e.g. {mismatches[:5]}")
+        return 1
+    print("log_data and sections identical")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1] if len(sys.argv) > 1 else None))
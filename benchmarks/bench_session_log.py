@@ -0,0 +1,72 @@
+# Benchmark for the interactive session log writer
+#
+# Usage:
+#   python benchmarks/bench_session_log.py [LINES]
+#
+# Appends LINES session log lines (default 10000) in chunks of 20 lines with
+# the legacy per-line open/append/close plus per-line timestamp (kept below as
+# reference) and with SessionLogWriter plus one timestamp per chunk. It prints
+# the wall time and the write() syscalls counted by /proc/self/io (Linux
+# only). The legacy loop also does one open() and one close() per line; the
+# writer opens the file once.
+
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.session_log import SessionLogWriter
+
+CHUNK_LINES = 20
+LINE = "NODE00001  Proxy  MeContext=NODE00001,ManagedElement=1,ENodeBFunction=1  administrativeState=1 (UNLOCKED)"
+
+
+def write_syscalls():
+    try:
+        with open("/proc/self/io") as f:
+            return int(next(line for line in f if line.startswith("syscw")).split()[1])
+    except (OSError, StopIteration):
+        return None
+
+
+def legacy(path, chunks):
+    # InteractiveSSH._write_log before SessionLogWriter
+    for chunk in chunks:
+        for line in chunk:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(f"[{timestamp}]{line}\n")
+
+
+def buffered(path, chunks):
+    writer = SessionLogWriter(path)
+    for chunk in chunks:
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        writer.write_lines([f"[{timestamp}]{line}" for line in chunk])
+    writer.close()
+
+
+def measure(name, write, path, chunks):
+    before = write_syscalls()
+    start = time.perf_counter()
+    write(path, chunks)
+    elapsed = time.perf_counter() - start
+    after = write_syscalls()
+    syscalls = "n/a" if before is None else after - before
+    print(f"{name:<8}: {elapsed:6.3f}s, write syscalls {syscalls}, {os.path.getsize(path)} bytes")
+
+
+def main(lines=10000):
+    chunks = [[f"{LINE} {i + j}" for j in range(CHUNK_LINES)] for i in range(0, lines, CHUNK_LINES)]
+    print(f"{lines} lines in chunks of {CHUNK_LINES}")
+    with tempfile.TemporaryDirectory() as folder:
+        measure("legacy", legacy, os.path.join(folder, "legacy.log"), chunks)
+        measure("writer", buffered, os.path.join(folder, "writer.log"), chunks)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000))
@@ -0,0 +1,150 @@
+# Benchmark for the shared SSH connection pool
+#
+# Usage:
+#   python benchmarks/bench_ssh_pool.py [SESSIONS] [AUTH_DELAY]
+#
+# Starts a local paramiko SSH server, opens SESSIONS interactive shells
+# (default 10, one user each) and then runs an upload-like and a
+# download-like job per session, three exec_command() calls and an SFTP
+# stat each, all sessions in parallel. The jobs connect like the legacy
+# workers (a new SSHClient per job) and through the pool that already holds
+# the connection of the interactive shell. Localhost has no network round
+# trips, so the server waits AUTH_DELAY seconds (default 0.2) per password
+# check to stand in for a remote ENM login.
+
+import os
+import sys
+import time
+import logging
+import socket
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import paramiko
+
+from lib.ssh_pool import SSHConnectionPool
+
+PASSWORD = "bench"
+AUTH_DELAY = 0.2
+
+
+class BenchServer(paramiko.ServerInterface):
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED if kind == "session" else paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_auth_password(self, username, password):
+        time.sleep(AUTH_DELAY)
+        return paramiko.AUTH_SUCCESSFUL if password == PASSWORD else paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_pty_request(self, *args):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        return True
+
+    def check_channel_exec_request(self, channel, command):
+        def reply():
+            # Let the exec request be answered before the channel closes
+            time.sleep(0.02)
+            channel.sendall(b"ok\n")
+            channel.send_exit_status(0)
+            channel.close()
+        threading.Thread(target=reply, daemon=True).start()
+        return True
+
+
+def start_server(host_key):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(100)
+
+    def serve(conn):
+        transport = paramiko.Transport(conn)
+        transport.add_server_key(host_key)
+        transport.set_subsystem_handler("sftp", paramiko.SFTPServer, paramiko.SFTPServerInterface)
+        transport.start_server(server=BenchServer())
+        # Shells stay open and silent; exec channels answer on their own.
+        # Keep the channels referenced, a collected Channel closes itself
+        channels = []
+        while True:
+            channel = transport.accept(60)
+            if channel is None:
+                break
+            channels.append(channel)
+
+    def accept_loop():
+        while True:
+            conn, _ = listener.accept()
+            threading.Thread(target=serve, args=(conn,), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def connect_new(target):
+    # How UploadWorker and DownloadLogWorker connected before the pool
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(target["host"], target["port"], target["username"], target["password"],
+                   look_for_keys=False, allow_agent=False, timeout=30, banner_timeout=30)
+    return client
+
+
+def job(client):
+    for _ in range(3):
+        stdin, stdout, stderr = client.exec_command("true")
+        stdout.read()
+    sftp = client.open_sftp()
+    try:
+        sftp.stat(".")
+    except IOError:
+        pass
+    sftp.close()
+
+
+def run_jobs(targets, acquire, release):
+    def one(target):
+        client = acquire(target)
+        try:
+            job(client)
+        finally:
+            release(client)
+
+    threads = [threading.Thread(target=one, args=(target,)) for target in targets for _ in range(2)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(sessions=10, auth_delay=AUTH_DELAY):
+    global AUTH_DELAY
+    AUTH_DELAY = auth_delay
+    # Legacy clients closing their connections make the server log resets
+    logging.getLogger("paramiko").setLevel(logging.CRITICAL)
+    port = start_server(paramiko.RSAKey.generate(2048))
+    targets = [{"host": "127.0.0.1", "port": port, "username": f"user{n}", "password": PASSWORD}
+               for n in range(sessions)]
+    pool = SSHConnectionPool(connect=connect_new)
+    shells = [pool.acquire(target).invoke_shell() for target in targets]
+
+    legacy = run_jobs(targets, connect_new, lambda client: client.close())
+    pooled = run_jobs(targets, pool.acquire, pool.release)
+    print(f"{sessions} sessions, upload + download jobs each")
+    print(f"  new connection per job {legacy:6.2f} s")
+    print(f"  pooled connections     {pooled:6.2f} s  ({pool.connects} connects, {pool.reuses} reuses)")
+    for shell in shells:
+        shell.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+                  float(sys.argv[2]) if len(sys.argv) > 2 else AUTH_DELAY))
@@ -0,0 +1,191 @@
+# Benchmark for the interactive SSH readers
+#
+# Usage:
+#   python benchmarks/bench_ssh_reader.py [SESSIONS] [MEGABYTES]
+#
+# Starts a local paramiko SSH server and opens SESSIONS interactive shells
+# (default 20). It measures the CPU time the process burns in 5 idle seconds
+# (next to the same without readers), and the MB/s of one shell flooding
+# MEGABYTES (default 50). Each
+# run uses both the legacy 10 ms recv_ready() polling loop (one thread per
+# session, 4 KB reads; kept below as reference) and the shared ChannelReader.
+
+import os
+import sys
+import time
+import socket
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import paramiko
+
+from lib.ssh_reader import ChannelReader
+
+USER, PASSWORD = "bench", "bench"
+IDLE_SECONDS = 5
+BLOCK = b"x" * 1023 + b"\n"
+
+
+class BenchServer(paramiko.ServerInterface):
+    def __init__(self):
+        self.shell_requested = threading.Event()
+
+    def check_channel_request(self, kind, chanid):
+        return paramiko.OPEN_SUCCEEDED if kind == "session" else paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_auth_password(self, username, password):
+        return paramiko.AUTH_SUCCESSFUL if (username, password) == (USER, PASSWORD) else paramiko.AUTH_FAILED
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_channel_pty_request(self, *args):
+        return True
+
+    def check_channel_shell_request(self, channel):
+        self.shell_requested.set()
+        return True
+
+
+def serve_shell(transport, server):
+    channel = transport.accept(20)
+    if channel is None or not server.shell_requested.wait(20):
+        return
+    channel.send(b"[bench@localhost(bench) ~]$ ")
+    command = b""
+    while True:
+        data = channel.recv(1024)
+        if not data:
+            break
+        command += data
+        while b"\n" in command:
+            line, command = command.split(b"\n", 1)
+            if line.startswith(b"flood "):
+                # Megabytes of output, e.g. a mobatch dump
+                for _ in range(int(line.split()[1]) * 1024):
+                    channel.sendall(BLOCK)
+    channel.close()
+
+
+def start_server(host_key):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(100)
+
+    def accept_loop():
+        while True:
+            conn, _ = listener.accept()
+            transport = paramiko.Transport(conn)
+            transport.add_server_key(host_key)
+            server = BenchServer()
+            transport.start_server(server=server)
+            threading.Thread(target=serve_shell, args=(transport, server), daemon=True).start()
+
+    threading.Thread(target=accept_loop, daemon=True).start()
+    return listener.getsockname()[1]
+
+
+def open_shell(port):
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect("127.0.0.1", port, USER, PASSWORD, look_for_keys=False, allow_agent=False)
+    shell = client.invoke_shell()
+    return client, shell
+
+
+class LegacyPoller:
+    # The InteractiveSSH._connect_and_read main loop before ChannelReader
+    def __init__(self, shell, on_data):
+        self.keep_reading = True
+        self.thread = threading.Thread(target=self._run, args=(shell, on_data), daemon=True)
+        self.thread.start()
+
+    def _run(self, shell, on_data):
+        while self.keep_reading:
+            if shell.recv_ready():
+                on_data(shell.recv(4096))
+            else:
+                time.sleep(0.01)
+
+    def stop(self):
+        self.keep_reading = False
+        self.thread.join()
+
+
+class Counter:
+    def __init__(self):
+        self.bytes = 0
+        self.done = threading.Event()
+        self.target = None
+
+    def __call__(self, data):
+        data.decode(errors="ignore")
+        self.bytes += len(data)
+        if self.target is not None and self.bytes >= self.target:
+            self.done.set()
+
+
+def idle_cpu_percent():
+    cpu = time.process_time()
+    time.sleep(IDLE_SECONDS)
+    return (time.process_time() - cpu) / IDLE_SECONDS * 100
+
+
+def run(name, shells, start_reading, stop_reading, megabytes):
+    # The paramiko transports (both ends live in this process) wake up on their own
+    baseline = idle_cpu_percent()
+    counters = [Counter() for _ in shells]
+    handle = start_reading(shells, counters)
+    time.sleep(0.5)  # prompts
+
+    idle_cpu = idle_cpu_percent()
+
+    counter = counters[0]
+    counter.target = counter.bytes + megabytes * 1024 * len(BLOCK)
+    start = time.perf_counter()
+    shells[0].send(f"flood {megabytes}\n")
+    counter.done.wait(300)
+    elapsed = time.perf_counter() - start
+    stop_reading(handle)
+    print(f"{name:<14}: idle CPU {idle_cpu:5.1f}% of a core (transports alone {baseline:4.1f}%), "
+          f"flood {megabytes / elapsed:7.1f} MB/s")
+
+
+def start_legacy(shells, counters):
+    return [LegacyPoller(shell, counter) for shell, counter in zip(shells, counters)]
+
+
+def stop_legacy(pollers):
+    for poller in pollers:
+        poller.stop()
+
+
+def start_reader(shells, counters):
+    reader = ChannelReader()
+    for shell, counter in zip(shells, counters):
+        reader.register(shell, counter)
+    return reader
+
+
+def stop_reader(reader):
+    reader.stop()
+
+
+def main(sessions=20, megabytes=50):
+    port = start_server(paramiko.RSAKey.generate(2048))
+    print(f"{sessions} sessions, {megabytes} MB flood")
+    for name, start_reading, stop_reading in (
+        ("legacy polling", start_legacy, stop_legacy),
+        ("ChannelReader", start_reader, stop_reader),
+    ):
+        connections = [open_shell(port) for _ in range(sessions)]
+        run(name, [shell for _, shell in connections], start_reading, stop_reading, megabytes)
+        for client, _ in connections:
+            client.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:3])))
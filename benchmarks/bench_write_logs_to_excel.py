@@ -0,0 +1,62 @@
+# Benchmark for report_generator.write_logs_to_excel engines
+#
+# Usage:
+#   python benchmarks/bench_write_logs_to_excel.py [ROWS]
+#
+# Writes the same synthetic log_data (default 100000 command rows) with the
+# openpyxl engine and the streaming xlsxwriter engine and prints the time and
+# Python peak memory (tracemalloc) of each.
+
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from lib.report_generator import write_logs_to_excel
+
+TAGS = [
+    "Total: 1 MOs attempted, 1 MOs set",
+    "Total: 0 MOs attempted, 0 MOs deleted",
+    "!!!! Processing failure :  MO already exists",
+    "ERROR: crn : Parent MO not found",
+    "1 MOs created",
+    "Executed",
+]
+
+
+def sample_log_data(rows, seed=1):
+    rnd = random.Random(seed)
+    log_data = []
+    for i in range(rows):
+        node = f"NODE{i // 50:05d}"
+        cmd = f"{node}> set EUtranCellFDD=CELL{i % 6} qRxLevMin -124"
+        log_data.append(("CR", node, "CR_SCRIPT", "NULL", "", rnd.choice(TAGS), ["", cmd, "Total: 1 MOs attempted, 1 MOs set"]))
+    return log_data
+
+
+def run(engine, log_data, folder):
+    filename = os.path.join(folder, f"{engine}.xlsx")
+    tracemalloc.start()
+    start = time.perf_counter()
+    write_logs_to_excel(log_data, filename, "CR", engine=engine)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{engine:<11}: {elapsed:7.2f}s  peak {peak / 2**20:8.1f} MB  ({os.path.getsize(filename)} bytes)")
+
+
+def main(rows=100000):
+    log_data = sample_log_data(rows)
+    print(f"{rows} rows")
+    with tempfile.TemporaryDirectory() as folder:
+        run("xlsxwriter", log_data, folder)
+        run("openpyxl", log_data, folder)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000))
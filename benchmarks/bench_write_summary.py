@@ -0,0 +1,93 @@
+# Benchmark for the Before/After Summary and Alarm sheet writers
+#
+# Usage:
+#   python benchmarks/bench_write_summary.py [NODES]
+#
+# Writes a synthetic Summary sheet of NODES nodes (default 5000) and an
+# Alarm sheet of 3 alarms per node with the old cell-by-cell loops and with
+# write_summary / write_alarm_dataframe_with_format, and prints the time of
+# each writer (workbook save excluded). The old per-node print goes to
+# os.devnull so the terminal does not dominate the old timing.
+
+import os
+import sys
+import time
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+import pandas as pd
+
+from lib.report_before_after import write_summary, write_alarm_dataframe_with_format, count_df_by_nodename
+
+ALARM_HEADERS = ['NODENAME', 'Date', 'Time', 'Severity', 'Problem', 'Object', 'Cause', 'AdditionalText']
+
+
+def sample_frames(nodes):
+    names = [f"NODE{i:05d}" for i in range(nodes)]
+    summary = pd.DataFrame({
+        "NODENAME": names,
+        "Status_Before": np.where(np.arange(nodes) % 7, "OK", "Unremote"),
+        "Status_After": "OK",
+    })
+    cell_before = pd.DataFrame({"NODENAME": names[:-10] * 3, "MO": "EUtranCellFDD=1"})
+    cell_after = pd.DataFrame({"NODENAME": names[5:] * 3, "MO": "EUtranCellFDD=1"})
+    alarms = pd.DataFrame({col: [f"{col}{i}" for i in range(3 * nodes)] for col in ALARM_HEADERS})
+    alarms.loc[::5, "Cause"] = np.nan
+    return summary, cell_before, cell_after, alarms
+
+
+def old_summary_cells(df, sheet_name, writer, cell_bef, cell_after):
+    # The summary table part of the old write_summary
+    df_check_cell = count_df_by_nodename(cell_bef, cell_after, "Cell_COUNT")
+    df_result = pd.merge(df, df_check_cell, on='NODENAME', how='left')
+    df_result.to_excel(writer, sheet_name=sheet_name, index=False)
+    worksheet = writer.sheets[sheet_name]
+    header_format1 = writer.book.add_format({'bold': True, 'bg_color': '#FFFF00', 'border': 1})
+    cell_format = writer.book.add_format({'border': 1})
+    for col_num, value in enumerate(df.columns.values):
+        worksheet.write(0, col_num, value, header_format1)
+    for row in range(1, len(df) + 1):
+        print(f"write NODENAME [{df.iloc[row - 1, 0]}] [{row} of {len(df) + 1}]")
+        for col in range(len(df.columns)):
+            worksheet.write(row, col, df.iloc[row - 1, col], cell_format)
+
+
+def old_alarm_cells(df, sheet_name, writer):
+    worksheet = writer.book.add_worksheet(sheet_name)
+    worksheet.write('A1', len(df))
+    df = df[ALARM_HEADERS]
+    for col_num, header in enumerate(ALARM_HEADERS):
+        worksheet.write(1, col_num, header)
+    for row_num, row_data in enumerate(df.values.tolist(), start=2):
+        for col_num, cell_data in enumerate(row_data):
+            if pd.isna(cell_data):
+                worksheet.write(row_num, col_num, '')
+            else:
+                worksheet.write(row_num, col_num, cell_data)
+
+
+def measure(name, write, folder):
+    with pd.ExcelWriter(os.path.join(folder, f"{name}.xlsx"), engine="xlsxwriter") as writer:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            write(writer)
+            elapsed = time.perf_counter() - start
+    print(f"{name:<12}: {elapsed:6.2f}s")
+
+
+def main(nodes=5000):
+    summary, cell_before, cell_after, alarms = sample_frames(nodes)
+    print(f"{nodes} nodes, {len(alarms)} alarms")
+    with tempfile.TemporaryDirectory() as folder:
+        measure("old summary", lambda w: old_summary_cells(summary, "Summary", w, cell_before, cell_after), folder)
+        measure("summary", lambda w: write_summary(summary, "Summary", w, cell_before, cell_after), folder)
+        measure("old alarm", lambda w: old_alarm_cells(alarms, "Alarm_After", w), folder)
+        measure("alarm", lambda w: write_alarm_dataframe_with_format(alarms, "Alarm_After", w), folder)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -11,12 +11,12 @@
 
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QMessageBox
 from PyQt5.QtCore import QThread, QTimer, Qt, QEvent, pyqtSlot
-from PyQt5.QtGui import QTextCursor
-from lib.style import TransparentTextEdit, StyledPushButton, StyledLineEdit, StyledProgressBar
+from lib.style import TransparentTextEdit, TerminalOutputView, DEFAULT_SCROLLBACK_LINES, StyledPushButton, StyledLineEdit, StyledProgressBar
 from lib.ssh import InteractiveSSH
 from lib.dialogs import ScreenSelectionDialog
 from lib.workers import UploadWorker
-from .utils import debug_print
+from lib.output_coalescer import OutputCoalescer, DEFAULT_MAX_UPDATES_PER_SECOND
+from .utils import debug_print, get_setting
 
 class SSHTab(QWidget):
     def __init__(self, target, ssh_manager):
@@ -34,8 +34,8 @@ class SSHTab(QWidget):
         self.layout = QVBoxLayout()
         
         # Create widgets
-        self.output_box = TransparentTextEdit()
-        self.output_box.setReadOnly(True)
+        # Bounded scrollback; the full history stays in LOG/<session>.log
+        self.output_box = TerminalOutputView(get_setting('TERMINAL_SCROLLBACK_LINES', DEFAULT_SCROLLBACK_LINES))
         
         self.command_batch_RUN = TransparentTextEdit()
         self.command_batch_RUN.setPlaceholderText("Enter batch commands here, one per line...")
@@ -87,10 +87,11 @@ class SSHTab(QWidget):
 
     def _setup_state(self):
         """Initialize state variables"""
-        self._output_buffer = []
-        self._output_batch_size = 20
+        self._output = OutputCoalescer(
+            get_setting('OUTPUT_MAX_UPDATES_PER_SECOND', DEFAULT_MAX_UPDATES_PER_SECOND),
+            max_pending_lines=self.output_box.maximumBlockCount() or None)
         self._output_timer = QTimer(self)
-        self._output_timer.setInterval(100)
+        self._output_timer.setSingleShot(True)
         self._output_timer.timeout.connect(self.flush_output)
         self._waiting_for_prompt = False
         self._command_history = []
@@ -164,6 +165,7 @@ class SSHTab(QWidget):
             self.connected = False
             self.update_button_states()
             self.append_output(f"Disconnected from {self.target['session_name']}.")
+            debug_print(f"Output of {self.target['session_name']}: {self._output.stats()}")
 
     def update_button_states(self):
         """Update button states based on connection status"""
@@ -177,31 +179,24 @@ class SSHTab(QWidget):
             self._clear_waiting_message()
             self._waiting_for_prompt = False
 
-        self._output_buffer.append(text)
-        if len(self._output_buffer) >= self._output_batch_size:
+        if self._output.push(text):
             self.flush_output()
         elif not self._output_timer.isActive():
-            self._output_timer.start()
+            self._output_timer.start(int(self._output.delay() * 1000) + 1)
 
     def _clear_waiting_message(self):
-        """Clear the waiting for prompt message"""
-        cursor = self.output_box.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.output_box.setTextCursor(cursor)
-        content = self.output_box.toPlainText()
-        for suffix in ["Waiting for prompt...\n", "Waiting for prompt..."]:
-            if content.endswith(suffix):
-                self.output_box.setPlainText(content[:-len(suffix)])
-                break
+        """Clear the waiting for prompt message, still buffered or shown"""
+        if not self._output.discard_last("Waiting for prompt..."):
+            self.output_box.remove_last_line("Waiting for prompt...")
 
     def flush_output(self):
-        """Flush buffered output to the output box"""
-        if self._output_buffer:
-            self.output_box.moveCursor(QTextCursor.End)
-            self.output_box.insertPlainText('\n'.join(self._output_buffer) + '\n')
-            self.output_box.moveCursor(QTextCursor.End)
-            self._output_buffer.clear()
+        """Flush coalesced output to the output box"""
         self._output_timer.stop()
+        texts, dropped = self._output.take()
+        if dropped:
+            texts.insert(0, f"[INFO] {dropped} lines skipped on screen, full output in LOG/{self.target['session_name']}.log")
+        if texts:
+            self.output_box.append_lines(texts)
 
     def send_command(self):
         """Send command to SSH session"""
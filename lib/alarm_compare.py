@@ -0,0 +1,77 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Alarm before/after comparison shared by the log checker (ALARM_COMPARE sheet)
+# and the Before/After report (NEW_Alarm sheet).
+#
+# The alarm key columns are hashed into one uint64 per row, so the merge runs
+# on a single integer column and the remark is picked with np.select instead
+# of a Python function per row.
+
+import numpy as np
+import pandas as pd
+
+ALARM_KEY_COLUMNS = ['NODENAME', 'Severity', 'Problem', 'Object']
+
+
+def alarm_keys(df, columns=ALARM_KEY_COLUMNS):
+    """
+    Hash the alarm key columns of df into one uint64 per row.
+
+    Categorical and object columns holding the same text hash the same, so
+    keys from the log checker (categorical NODENAME) match keys read back
+    from BEFORE.xlsx.
+    """
+    return pd.util.hash_pandas_object(df[list(columns)].astype(object), index=False).to_numpy()
+
+
+def match_alarms(df_after, df_before, left_on=ALARM_KEY_COLUMNS, right_on=None, suffixes=('_x', '_y')):
+    """
+    Left-merge the current alarms with the before alarms on the hashed key.
+
+    Args:
+        df_after (DataFrame): Current alarms (left side, row order kept).
+        df_before (DataFrame): Before alarms.
+        left_on (list): Key columns of df_after.
+        right_on (list): Key columns of df_before (default: left_on; the
+            before copies of the key columns are then dropped like merge(on=...)).
+        suffixes (tuple): Suffixes for other overlapping columns.
+
+    Returns:
+        DataFrame: The merge, with merge(indicator=True)'s '_merge' column.
+    """
+    left_on = list(left_on)
+    right_on = list(right_on) if right_on is not None else left_on
+    left = df_after.assign(_alarm_key=alarm_keys(df_after, left_on))
+    right = df_before.assign(_alarm_key=alarm_keys(df_before, right_on))
+    if right_on == left_on:
+        right = right.drop(columns=right_on)
+    merged = pd.merge(left, right, on='_alarm_key', how='left', indicator=True, suffixes=suffixes)
+    return merged.drop(columns='_alarm_key')
+
+
+def alarm_remarks(matched, mobatch_before=None, existing='Alarm Existing', new='NEW Alarm',
+                  unremote='Before Site Unremote', no_data='NO DATA BEFORE'):
+    """
+    Remark per alarm row:
+    existing if the alarm was there before, otherwise by the node's mobatch
+    status before (UNREMOTE -> unremote, OK -> new, anything else -> no_data).
+
+    Args:
+        matched (Series): True where the alarm has a before match ('_merge' == 'both').
+        mobatch_before (Series): Before mobatch status per row (None if unknown).
+
+    Returns:
+        ndarray: The remark per row.
+    """
+    matched = np.asarray(matched, dtype=bool)
+    if mobatch_before is None:
+        return np.where(matched, existing, no_data).astype(object)
+    conditions = [matched, mobatch_before == 'UNREMOTE', mobatch_before == 'OK']
+    return np.select(conditions, [existing, unremote, new], default=no_data).astype(object)
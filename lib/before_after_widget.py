@@ -6,12 +6,12 @@ This widget provides a GUI interface for running Before/After analysis of networ
 import os
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QTextEdit, QMessageBox, QFileDialog,
-    QCheckBox, QGroupBox, QFormLayout, QLabel, QProgressBar, QDateEdit, QTimeEdit, QSlider
+    QCheckBox, QGroupBox, QFormLayout, QLabel, QProgressBar, QDateEdit, QTimeEdit, QSlider, QSpinBox
 )
 from PyQt5.QtCore import QThread, pyqtSignal, QEventLoop, QTimer, QObject
 from PyQt5.QtCore import QDate, QTime, Qt
 from datetime import datetime
-from .report_before_after import run_before_after_analysis
+from .report_before_after import run_before_after_analysis, default_ingest_workers
 from .style import StyledPushButton, StyledLineEdit, StyledProgressBar, StyledContainer, TransparentTextEdit, StyledLabel, StyledDateEdit, StyledSlider
 
 
@@ -224,6 +224,28 @@ class BeforeAfterReportWidget(QWidget):
             }
         """)
         options_layout.addWidget(self.dark_mode_checkbox)
+
+        # Worker processes for reading the Before/After node logs (1 = one by one)
+        workers_layout = QHBoxLayout()
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setRange(1, max(1, os.cpu_count() or 1))
+        self.workers_spinbox.setValue(default_ingest_workers())
+        self.workers_spinbox.setToolTip("Number of processes reading the node logs. "
+                                        "Above 1 the Before and After folders are read at the same time.")
+        self.workers_spinbox.setStyleSheet("""
+            QSpinBox {
+                background-color: rgba(26, 26, 26, 0.8);
+                color: white;
+                font-weight: bold;
+                border: 1px solid rgba(128, 128, 128, 0.3);
+                border-radius: 4px;
+                padding: 3px;
+            }
+        """)
+        workers_layout.addWidget(StyledLabel("Log Reader Workers:"))
+        workers_layout.addWidget(self.workers_spinbox)
+        workers_layout.addStretch()
+        options_layout.addLayout(workers_layout)
         
         options_group.setLayout(options_layout)
         layout.addWidget(options_group)
@@ -276,6 +298,7 @@ class BeforeAfterReportWidget(QWidget):
         after_path = os.path.join(parent_path, "After")
         
         include_kpi = self.kpi_checkbox.isChecked()
+        workers = self.workers_spinbox.value()
         
         # Get the selected date and time
         before_date = self.date_before.date().toString('yyyy-MM-dd')
@@ -303,7 +326,7 @@ class BeforeAfterReportWidget(QWidget):
         self.run_button.setEnabled(False)
         
         # Run analysis in background thread
-        self.analysis_worker = AnalysisWorker(before_path, after_path, include_kpi, before_datetime, after_datetime)
+        self.analysis_worker = AnalysisWorker(before_path, after_path, include_kpi, before_datetime, after_datetime, workers)
         self.analysis_thread = QThread()
         self.analysis_worker.moveToThread(self.analysis_thread)
         
@@ -370,13 +393,14 @@ class AnalysisWorker(QObject):
     log_message = pyqtSignal(str)
     progress_update = pyqtSignal(int, str)  # progress value and message
     
-    def __init__(self, before_path, after_path, include_kpi, before_time, after_time):
+    def __init__(self, before_path, after_path, include_kpi, before_time, after_time, workers=1):
         super().__init__()
         self.before_path = before_path
         self.after_path = after_path
         self.include_kpi = include_kpi
         self.before_time = before_time
         self.after_time = after_time
+        self.workers = workers
         self._is_stopped = False
 
     def run_analysis(self):
@@ -401,7 +425,8 @@ class AnalysisWorker(QObject):
                 self.include_kpi,
                 self.before_time,
                 self.after_time,
-                progress_callback
+                progress_callback,
+                workers=self.workers
             )
             
             if not self._is_stopped:
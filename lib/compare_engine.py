@@ -0,0 +1,156 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Before/After parameter sheet comparison for the Before/After report.
+#
+# NODENAME and MO of every sheet are factorized once into sorted integer codes
+# shared by all sheets. Each sheet is then outer-merged on one int64 key built
+# from those codes instead of on the string columns, and all of its
+# _Before/_After pairs are compared in one vectorized step.
+
+import numpy as np
+import pandas as pd
+
+LOOKUP_COLUMNS = ['NODENAME', 'MO']
+
+
+def select_columns(df, column_order):
+    """Columns of df in column_order; columns df does not have are added as NA."""
+    df = df.assign(**{col: pd.NA for col in column_order if col not in df.columns})
+    return df[column_order]
+
+
+class CompareEngine:
+    """
+    Compare the Before/After frames of the report sheets on shared integer keys.
+
+    The codes are assigned in sorted value order (missing values last), so
+    the merged rows come out in the same order as a merge(how='outer') on
+    the string columns.
+
+    Args:
+        data_before (dict): Sheet key -> Before DataFrame.
+        data_after (dict): Sheet key -> After DataFrame.
+        key_columns (list): Columns factorized up front for all sheets.
+    """
+
+    def __init__(self, data_before, data_after, key_columns=LOOKUP_COLUMNS):
+        self.categories = {}
+        # (id(frame), column) -> (frame, codes); the frame is kept so its id stays unique
+        self._codes = {}
+        # Sheet key -> {compare column: number of rows where Before != After}
+        self.mismatches = {}
+
+        frames = [df for data in (data_before, data_after) for df in data.values() if isinstance(df, pd.DataFrame)]
+        for col in key_columns:
+            # Factorize each frame, then map its (few) uniques onto the sorted union
+            factorized = [(df, pd.factorize(df[col])) for df in frames if col in df.columns]
+            uniques = [np.asarray(u, dtype=object) for _, (_, u) in factorized]
+            self.categories[col] = pd.Index(pd.unique(np.concatenate(uniques)) if uniques else [], dtype=object).sort_values()
+            for df, (codes, frame_uniques) in factorized:
+                mapping = np.append(self.categories[col].get_indexer(np.asarray(frame_uniques, dtype=object)), -1)
+                self._codes[(id(df), col)] = (df, mapping[codes])
+
+    def _column_codes(self, df, col):
+        # Codes of df[col] (-1 = missing), coded at construction or looked up now
+        cached = self._codes.get((id(df), col))
+        if cached is not None and cached[0] is df and len(cached[1]) == len(df):
+            return cached[1]
+        categories = self.categories.get(col, pd.Index([], dtype=object))
+        values = df[col].to_numpy(dtype=object)
+        codes = categories.get_indexer(values)
+        unseen = (codes < 0) & pd.notna(values)
+        if unseen.any():
+            # New values (e.g. an extra lookup column): recode in sorted order,
+            # which invalidates the codes cached so far
+            self.categories[col] = categories.append(pd.Index(pd.unique(values[unseen]), dtype=object)).sort_values()
+            self._codes = {k: v for k, v in self._codes.items() if k[1] != col}
+            codes = self.categories[col].get_indexer(values)
+        return codes
+
+    def _keys(self, df, col_lookup, sizes):
+        # One int64 per row: the lookup codes as digits of a mixed-radix number,
+        # missing values coded as the last digit so they sort last
+        keys = np.zeros(len(df), dtype=np.int64)
+        for col, size in zip(col_lookup, sizes):
+            if col in df.columns:
+                codes = self._column_codes(df, col).astype(np.int64)
+                codes[codes < 0] = size - 1
+            else:
+                codes = np.full(len(df), size - 1, dtype=np.int64)
+            keys = keys * size + codes
+        return keys
+
+    def compare(self, df_before, df_after, col_lookup=LOOKUP_COLUMNS, sheet=None):
+        """
+        Outer-merge df_before and df_after on col_lookup and compare every
+        column of df_before.
+
+        Returns:
+            DataFrame: col_lookup, then all <col>_Before, all <col>_After and
+            all <col>_Compare columns (True where both sides are equal and not
+            empty); rows whose MO is the literal 'MO' header are dropped.
+            With sheet given, the mismatch count per _Compare column is kept
+            in self.mismatches[sheet].
+        """
+        col_lookup = list(col_lookup)
+        # Code both sides first: unseen values may still grow the categories
+        for col in col_lookup:
+            for df in (df_before, df_after):
+                if col in df.columns:
+                    self._column_codes(df, col)
+        sizes = [len(self.categories.get(col, ())) + 1 for col in col_lookup]
+
+        left = df_before.drop(columns=[c for c in col_lookup if c in df_before.columns])
+        right = df_after.drop(columns=[c for c in col_lookup if c in df_after.columns])
+        left['_key'] = self._keys(df_before, col_lookup, sizes)
+        right['_key'] = self._keys(df_after, col_lookup, sizes)
+        merged = pd.merge(left, right, on='_key', how='outer', suffixes=('_Before', '_After'))
+
+        # Decode the key back into the lookup columns
+        keys = merged.pop('_key').to_numpy()
+        lookup_codes = {}
+        for col, size in reversed(list(zip(col_lookup, sizes))):
+            keys, lookup_codes[col] = np.divmod(keys, size)
+        columns = {}
+        for col, size in zip(col_lookup, sizes):
+            codes = np.where(lookup_codes[col] == size - 1, -1, lookup_codes[col])
+            columns[col] = np.asarray(pd.Categorical.from_codes(codes, self.categories.get(col, pd.Index([], dtype=object))), dtype=object)
+
+        before_columns, after_columns, compare_columns = [], [], []
+        for column in df_before.columns:
+            if column not in col_lookup:
+                before_columns.append(f'{column}_Before')
+                after_columns.append(f'{column}_After')
+                compare_columns.append(f'{column}_Compare')
+        for col in before_columns + after_columns:
+            if col not in merged.columns:
+                merged[col] = None
+
+        # Equal where both sides hold the same value; empty never equals
+        equal = np.column_stack(
+            [(merged[b] == merged[a]).to_numpy(dtype=bool) for b, a in zip(before_columns, after_columns)]
+        ) if before_columns else np.zeros((len(merged), 0), dtype=bool)
+
+        result = pd.concat([
+            pd.DataFrame(columns),
+            merged[before_columns + after_columns],
+            pd.DataFrame(equal, columns=compare_columns),
+        ], axis=1)
+
+        # Remove unwanted rows
+        mo = result['MO'] if 'MO' in result.columns else merged.get('MO')
+        if mo is not None:
+            keep = (mo != 'MO').to_numpy()
+            result = result[keep]
+            equal = equal[keep]
+
+        if sheet is not None:
+            self.mismatches[sheet] = dict(zip(compare_columns, (~equal).sum(axis=0).tolist()))
+        return result
@@ -0,0 +1,180 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Line classifier for mobatch node logs (used by report_generator.process_single_log)
+#
+# Every line is looked at once: cheap prefix / substring checks decide which
+# (precompiled) regex is worth running, and the result comes back as a single
+# LineEvent instead of the caller re-running the same regex several times.
+
+import re
+from collections import namedtuple
+
+# Event kinds
+LINE_TEXT = "TEXT"          # Nothing interesting for the current mode
+LINE_BLANK = "BLANK"        # Empty line (closes an RNC command block)
+LINE_PROMPT = "PROMPT"      # "NODENAME> command" prompt line (BB script)
+LINE_TAG = "TAG"            # '!!!! ... TAG :"..."' result line (RNC script)
+LINE_ALT_TAG = "ALT_TAG"    # '>>> [...]' result line (RNC script)
+LINE_EXECUTE = "EXECUTE"    # CREATE / DELETE / SET command line (RNC script)
+
+# kind/value : main classification of the line for the current mode
+# tag_err    : error / result text for BB scripts (None if no match)
+# script     : "$nodename_<script>.mos" name from a run line (None if no match)
+# trun       : True if the line is a trun/truni call (switches to RNC mode)
+# rnc_script : script name from a trun/truni line (None if no match)
+# unremote   : number of UNREMOTE markers found on the line (0, 1 or 2)
+LineEvent = namedtuple("LineEvent", "kind value tag_err script trun rnc_script unremote")
+
+PATTERN_PROMPT = re.compile(r"^[A-Z0-9\_\-]{4,180}\>(.*?)$", re.IGNORECASE)
+PATTERN_RUN_SCRIPT = re.compile(r".*?run\s+.*?\$nodename\_(.*?).mos$", re.IGNORECASE)
+PATTERN_TRUNI = re.compile(r".*?(trun|truni)\s+(.*?)$", re.IGNORECASE)
+PATTERN_RNC_SCRIPT = re.compile(r".*?trun(i)?\s+(.*?).mo(s)?$", re.IGNORECASE)
+PATTERN_TBAC = re.compile(r"(?i)tbac\s*control\s*-\s*unauthori[sz]ed\s*network\s*element")
+
+# RNC result/command lines, all anchored on a distinct prefix ("!!!!", ">>>", CREATE/DELETE/SET)
+PATTERN_RNC_LINE = re.compile(
+    r'^(?:!!!!.*?TAG\s+:"(?P<tag>.*?)".*?'
+    r"|>>>\s+(?P<alt_tag>\[.*?\]).*?"
+    r"|(?P<execute>CREATE.*?|DELETE.*?|SET\s+.*?))$",
+    re.IGNORECASE,
+)
+
+# BB result lines anchored on a distinct prefix (ERROR:, >>>, Total)
+PATTERN_BB_RESULT = re.compile(
+    r"^(?:(?P<error>ERROR:.*?:.*?)"
+    r"|(?P<result>>>>.*?:.*?)"
+    r"|(?P<total>Total.*?MOs\s+attempted.*?))$",
+    re.IGNORECASE,
+)
+# BB result lines that may appear anywhere in the line
+PATTERN_BB_PROCESSING = re.compile(r"(!!!!\s+Processing.*?)$", re.IGNORECASE)
+PATTERN_BB_ERROR = re.compile(r"(!!!!\s+(ERROR|Processing):.*?)$", re.IGNORECASE)
+
+UNREMOTE_IP_CONTACT = "Checking ip contact...Not OK"
+
+_RNC_FIRST_CHARS = frozenset("!>cds")
+_BB_FIRST_CHARS = frozenset(">et")
+
+
+def _bb_result(line, low):
+    # Same precedence as evaluating ERROR:, !!!! ERROR|Processing:, !!!! Processing,
+    # >>> and Total in order and keeping the last match.
+    anchored = PATTERN_BB_RESULT.match(line) if low[:1] in _BB_FIRST_CHARS else None
+    if anchored and anchored.lastgroup != "error":
+        return anchored.group(anchored.lastgroup)
+    if "!!!!" in line:
+        m = PATTERN_BB_PROCESSING.search(line) or PATTERN_BB_ERROR.search(line)
+        if m:
+            return m.group(1)
+    if anchored:
+        return anchored.group("error")
+    return None
+
+
+def classify_line(line, rnc=False):
+    """
+    Classify one decoded log line.
+
+    Args:
+        line (str): The line as read from the log (trailing newline included).
+        rnc (bool): True once a trun/truni call was seen earlier in the log.
+
+    Returns:
+        LineEvent: The classification of the line.
+    """
+    low = line.casefold()
+
+    script = None
+    if "$nodename_" in low:
+        m = PATTERN_RUN_SCRIPT.search(line)
+        if m:
+            script = m.group(1)
+
+    has_trun = "trun" in low
+    trun = has_trun and PATTERN_TRUNI.search(line) is not None
+
+    unremote = 0
+    if UNREMOTE_IP_CONTACT in line:
+        unremote += 1
+    if "tbac" in low and PATTERN_TBAC.search(line):
+        unremote += 1
+
+    if rnc or trun:
+        rnc_script = None
+        if has_trun:
+            m = PATTERN_RNC_SCRIPT.search(line)
+            if m:
+                rnc_script = m.group(2)
+
+        kind, value = LINE_TEXT, None
+        if not line.rstrip():
+            kind = LINE_BLANK
+        elif low[:1] in _RNC_FIRST_CHARS:
+            m = PATTERN_RNC_LINE.match(line)
+            if m:
+                name = m.lastgroup
+                value = m.group(name)
+                kind = LINE_TAG if name == "tag" else LINE_ALT_TAG if name == "alt_tag" else LINE_EXECUTE
+        return LineEvent(kind, value, None, script, trun, rnc_script, unremote)
+
+    kind, value = LINE_TEXT, None
+    if ">" in line:
+        m = PATTERN_PROMPT.match(line)
+        if m:
+            kind, value = LINE_PROMPT, m.group(1).strip()
+    return LineEvent(kind, value, _bb_result(line, low), script, trun, None, unremote)
+
+
+# Pre/post check sections written by the "collect pre/post" upload mode
+LOG_SECTIONS = ("LOG_Alarm_bf", "LOG_status_bf", "LOG_Alarm_af", "LOG_status_af")
+
+
+class SectionCollector:
+    """
+    Collects the ';' separated rows of the ####LOG_x sections while the log is
+    streamed, so the sections do not need a second read of the file.
+
+    A section starts at its ####LOG_x marker and ends at the first empty line
+    after its first data row.
+    """
+
+    def __init__(self, names=LOG_SECTIONS):
+        self.sections = {name: [] for name in names}
+        self._markers = [("####" + name, name) for name in names]
+        self._mode = None
+        self._collecting = False
+
+    def feed(self, line):
+        # Lines come from mmap.readline (split on \n only); split lone \r the
+        # same way text-mode universal newlines would.
+        if "\r" in line:
+            parts = line.replace("\r\n", "\n").split("\r")
+            if parts[-1] == "":
+                parts.pop()
+            for part in parts:
+                self._feed_one(part)
+        else:
+            self._feed_one(line)
+
+    def _feed_one(self, line):
+        stripped = line.strip()
+        if "####" in stripped:
+            for marker, name in self._markers:
+                if marker in stripped:
+                    self._mode, self._collecting = name, False
+                    return
+
+        if stripped == "" and self._collecting:
+            self._mode, self._collecting = None, False
+            return
+
+        if ";" in stripped and self._mode:
+            self._collecting = True
+            self.sections[self._mode].append(stripped)
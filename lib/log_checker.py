@@ -9,15 +9,486 @@
 
 import os
 import pandas as pd
+import numpy as np
 import zipfile
 import re
 import time
 import subprocess
+from array import array
 from PyQt5.QtWidgets import QApplication, QProgressDialog, QMessageBox # Needed for UI elements
-from PyQt5.QtCore import QTimer
-import openpyxl
-from openpyxl.styles import PatternFill
+from PyQt5.QtCore import QTimer, QObject, QThread, QEventLoop, pyqtSignal
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xlsxwriter.utility import xl_col_to_name
 from .utils import debug_print
+from .alarm_compare import match_alarms, alarm_remarks
+
+
+# Sections collected from the 99_Hygiene_collect logs
+ITEM_CHECK_LIST = [
+    {
+        'name': 'cellstatus',
+        'start_marker': '####LOG_cellstatus',
+        'end_marker': '####END_LOG_cellstatus',
+        'sheet_name': 'Cell_Status',
+    },
+    {
+        'name': 'LTE_data',
+        'start_marker': '####LOG_bandwidth',
+        'end_marker': '####END_LOG_bandwidth',
+        'sheet_name': 'LTE_data',
+    },
+    {
+        'name': 'NR_data',
+        'start_marker': '####LOG_BAND_NR_SECTOR',
+        'end_marker': '####END_LOG_BAND_NR_SECTOR',
+        'sheet_name': 'NR_data',
+    },
+    {
+        'name': 'RNC_celldata',
+        'start_marker': '####LOG_CELL_3G',
+        'end_marker': '####END_LOG_CELL_3G',
+        'sheet_name': 'RNC_celldata',
+    },
+    {
+        'name': 'RNC_IUBdata',
+        'start_marker': '####LOG_IUB_RNC_3G',
+        'end_marker': '####END_LOG_IUB_RNC_3G',
+        'sheet_name': 'RNC_IUBdata',
+    },
+]
+
+HYGIENE_FOLDER = '99_Hygiene_collect'
+
+# A node is UNREMOTE if any of these show up in its log
+UNREMOTE_IP_CONTACT = 'Checking ip contact...Not OK'
+UNREMOTE_CONNECT_PREFIX = 'Unable to connect to '
+UNREMOTE_TBAC = 'tbac control - unauthorised network element'
+
+
+CONNECTION_COLUMNS = ('FILE', 'FOLDER', 'NODENAME', 'REMARK', 'Count')
+ALARM_COLUMNS = ('FILE', 'FOLDER', 'NODENAME', 'Date', 'Time', 'Severity', 'Problem', 'Object', 'Cause', 'AdditionalText')
+# Columns repeated on every row of a node log; stored as integer codes
+CATEGORICAL_COLUMNS = ('FILE', 'FOLDER', 'NODENAME')
+
+
+class ColumnarRows:
+    """
+    Row accumulator keeping one list per column instead of one dict per row.
+    FILE / FOLDER / NODENAME are stored as int codes into a category table and
+    come out of to_frame() as pandas categoricals. Columns missing from a row
+    are NaN, like pd.DataFrame(list_of_dicts).
+    """
+
+    def __init__(self, categorical=CATEGORICAL_COLUMNS):
+        self.categorical = frozenset(categorical)
+        self.data = {}        # column -> list of values (array of codes for categoricals)
+        self.categories = {}  # categorical column -> {value: code}
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def _new_column(self, name):
+        if name in self.categorical:
+            self.categories[name] = {}
+            column = array('i', [-1]) * self.length
+        else:
+            column = [np.nan] * self.length
+        self.data[name] = column
+        return column
+
+    def add(self, names, values):
+        """Append one row given as parallel column names / values."""
+        data = self.data
+        for name, value in zip(names, values):
+            column = data.get(name)
+            if column is None:
+                column = self._new_column(name)
+            if name in self.categorical:
+                codes = self.categories[name]
+                value = codes.setdefault(value, len(codes))
+            column.append(value)
+        self.length += 1
+        if len(names) != len(data):
+            self._pad()
+
+    def _pad(self):
+        for name, column in self.data.items():
+            if len(column) < self.length:
+                column.append(-1 if name in self.categorical else np.nan)
+
+    def extend(self, other):
+        """Append all rows of another ColumnarRows (e.g. one returned by a worker)."""
+        if not other.length:
+            return
+        for name in other.data:
+            if name not in self.data:
+                self._new_column(name)
+        for name, column in self.data.items():
+            values = other.data.get(name)
+            if name in self.categorical:
+                if values is None:
+                    column.extend(array('i', [-1]) * other.length)
+                    continue
+                codes = self.categories[name]
+                remap = {code: codes.setdefault(value, len(codes)) for value, code in other.categories[name].items()}
+                remap[-1] = -1
+                column.extend(array('i', [remap[code] for code in values]))
+            else:
+                column.extend(values if values is not None else [np.nan] * other.length)
+        self.length += other.length
+
+    def to_frame(self, columns=None):
+        """Build the DataFrame (columns: optional explicit column order)."""
+        frame = {}
+        for name in (columns or self.data):
+            column = self.data.get(name)
+            if column is None:
+                frame[name] = [np.nan] * self.length
+            elif name in self.categorical:
+                categories = list(self.categories[name])
+                frame[name] = pd.Categorical.from_codes(np.frombuffer(column, dtype=np.int32) if self.length else [], categories=categories)
+            else:
+                frame[name] = column
+        return pd.DataFrame(frame, columns=list(columns) if columns else None)
+
+
+def _is_unremote(line):
+    return UNREMOTE_IP_CONTACT in line or line.startswith(UNREMOTE_CONNECT_PREFIX) or UNREMOTE_TBAC in line
+
+
+def _connection_values(fname, folder, nodename, unremote, count):
+    # Values in CONNECTION_COLUMNS order
+    return (fname, folder, nodename, 'UNREMOTE' if unremote else 'OK', count)
+
+
+def scan_member_lines(lines, fname, folder, nodename):
+    """
+    Build the connection check row from the (stripped) lines of one node log.
+
+    Returns:
+        tuple: FILE, FOLDER, NODENAME, REMARK (OK / UNREMOTE) and Count (lines)
+    """
+    count = 0
+    unremote = False
+    for line in lines:
+        count += 1
+        if not unremote and _is_unremote(line):
+            unremote = True
+    return _connection_values(fname, folder, nodename, unremote, count)
+
+
+# ####LOG_x / ####END_LOG_x marker -> (section name, is start marker)
+ALARM_SECTION = 'Alarm'
+HYGIENE_MARKERS = {'####LOG_Alarm': (ALARM_SECTION, True), '####END_LOG_Alarm': (ALARM_SECTION, False)}
+for _item in ITEM_CHECK_LIST:
+    HYGIENE_MARKERS[_item['start_marker']] = (_item['name'], True)
+    HYGIENE_MARKERS[_item['end_marker']] = (_item['name'], False)
+PATTERN_HYGIENE_MARKER = re.compile(
+    '|'.join(re.escape(marker) for marker in sorted(HYGIENE_MARKERS, key=len, reverse=True))
+)
+
+
+def find_section_spans(text):
+    """
+    Locate every ####LOG_x ... ####END_LOG_x section in a log with one regex pass.
+
+    Returns:
+        dict: section name -> list of (first line, end line) indexes into
+        text.split('\n'); end is None for a section left open at end of file.
+    """
+    spans = {}
+    open_at = {}
+    line_no = 0
+    pos = 0
+    for m in PATTERN_HYGIENE_MARKER.finditer(text):
+        line_no += text.count('\n', pos, m.start())
+        pos = m.start()
+        name, is_start = HYGIENE_MARKERS[m.group()]
+        if is_start:
+            open_at.setdefault(name, line_no + 1)
+        elif name in open_at:
+            spans.setdefault(name, []).append((open_at.pop(name), line_no))
+    for name, first in open_at.items():
+        spans.setdefault(name, []).append((first, None))
+    return spans
+
+
+def _section_rows(lines, section_spans):
+    # ';' separated rows of the given spans, split and stripped
+    for first, end in section_spans:
+        for line in lines[first:end]:
+            if ';' in line:
+                yield [part.strip() for part in line.split(';')]
+
+
+def parse_alarm_section(lines, section_spans, fname, folder, nodename, alarms):
+    """Append the alarm rows of the spans to alarms (ColumnarRows, ALARM_COLUMNS)."""
+    for parts in _section_rows(lines, section_spans):
+        if len(parts) >= 7 and parts[0] != "Date" and parts[1] != "Time":  # Skip header row and ensure we have all required fields
+            alarms.add(ALARM_COLUMNS, (
+                fname, folder, nodename,
+                parts[0],  # Date
+                parts[1],  # Time
+                parts[2],  # Severity
+                parts[4],  # Problem
+                parts[3],  # Object
+                parts[5],  # Cause
+                parts[6],  # AdditionalText
+            ))
+
+
+def parse_mo_section(lines, section_spans, fname, nodename, rows):
+    """
+    Column parser for MO;attr;... sections: the "MO" header row gives the
+    (lower case) column names of the rows that follow it. Rows are appended
+    to rows (ColumnarRows) as FILE, NODENAME, MO, <other columns>.
+    """
+    names = None
+    indexes = None
+    for parts in _section_rows(lines, section_spans):
+        # If this is the header row, store the column mapping
+        if parts[0].lower() == "mo":
+            header_mapping = {col.lower(): idx for idx, col in enumerate(parts)}
+            others = [(col, idx) for col, idx in header_mapping.items() if col != 'mo']
+            names = ('FILE', 'NODENAME', 'MO') + tuple(col for col, _ in others)
+            indexes = [header_mapping.get('mo', 0)] + [idx for _, idx in others]
+            continue
+
+        # Skip empty lines and rows before any header
+        if not parts[0] or names is None:
+            continue
+
+        try:
+            values = [parts[idx] for idx in indexes]
+        except IndexError:
+            debug_print(f"Skipping short row in {fname}/{nodename}: {';'.join(parts)}")
+            continue
+        rows.add(names, [fname, nodename] + values)
+
+
+def scan_hygiene_text(text, fname, folder, nodename, alarms, items):
+    """
+    Scan a 99_Hygiene_collect node log held in memory: the section markers are
+    indexed once and each section is sliced straight into its parser. Alarm
+    and section rows are appended to alarms / items[name] (ColumnarRows).
+
+    Returns:
+        tuple: the connection row values (CONNECTION_COLUMNS order)
+    """
+    lines = text.split('\n')
+    if lines[-1] == '':
+        lines.pop()  # Nothing after the last newline (same count as line iteration)
+    lines = [line.strip() for line in lines]
+
+    # Cheap substring checks on the whole buffer before looking at lines
+    unremote = UNREMOTE_IP_CONTACT in text or UNREMOTE_TBAC in text
+    if not unremote and UNREMOTE_CONNECT_PREFIX in text:
+        unremote = any(line.startswith(UNREMOTE_CONNECT_PREFIX) for line in lines)
+    row = _connection_values(fname, folder, nodename, unremote, len(lines))
+
+    spans = find_section_spans(text)
+    parse_alarm_section(lines, spans.get(ALARM_SECTION, []), fname, folder, nodename, alarms)
+    for item in ITEM_CHECK_LIST:
+        parse_mo_section(lines, spans.get(item['name'], []), fname, nodename, items[item['name']])
+    return row
+
+
+def _member_lines(zf, member):
+    # Stream the member line by line instead of materializing readlines()
+    with zf.open(member) as f:
+        for raw in f:
+            yield raw.decode(errors='ignore').strip()
+
+
+def scan_zip(zip_path):
+    """
+    Validate one downloaded zip and scan its LOG/<FOLDER>/<NODENAME>.log members.
+    Runs in a worker process; rows come back as ColumnarRows.
+
+    Returns:
+        dict: file, status ('ok', 'empty', 'bad' or 'error'), error, rows, alarms, items
+    """
+    fname = os.path.basename(zip_path)
+    result = {
+        'file': fname,
+        'status': 'ok',
+        'error': None,
+        'rows': ColumnarRows(),
+        'alarms': ColumnarRows(),
+        'items': {item['name']: ColumnarRows() for item in ITEM_CHECK_LIST},
+    }
+    try:
+        with zipfile.ZipFile(zip_path, 'r') as zf:
+            members = zf.namelist()
+            if not members:
+                result['status'] = 'empty'
+                return result
+            for member in members:
+                # Looking for LOG/<ANY_FOLDER>/<NODENAME>.log
+                parts = member.split('/')
+                if not (len(parts) == 3 and parts[0] == 'LOG' and parts[2].endswith('.log')):
+                    continue
+                folder = parts[1]
+                nodename = parts[2][:-4]  # remove .log
+                try:
+                    if folder == HYGIENE_FOLDER:
+                        text = zf.read(member).decode(errors='ignore')
+                        row = scan_hygiene_text(text, fname, folder, nodename, result['alarms'], result['items'])
+                    else:
+                        row = scan_member_lines(_member_lines(zf, member), fname, folder, nodename)
+                except Exception as read_err:
+                    debug_print(f"Error reading {member} in {fname}: {read_err}")
+                    continue
+                result['rows'].add(CONNECTION_COLUMNS, row)
+    except zipfile.BadZipFile as e:
+        result['status'], result['error'] = 'bad', f"bad zip file: {e}"
+    except Exception as e:
+        result['status'], result['error'] = 'error', str(e)
+    return result
+
+
+def scan_zip_files(zip_paths, progress_callback=None):
+    """
+    Scan every zip in a process pool.
+
+    Args:
+        zip_paths (list): Zip files to scan.
+        progress_callback (callable): Called as (done, total, file name) per finished zip.
+
+    Returns:
+        list: scan_zip results in the order of zip_paths.
+    """
+    results = [None] * len(zip_paths)
+    if not zip_paths:
+        return results
+    workers = max(1, min(len(zip_paths), os.cpu_count() or 1))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(scan_zip, path): idx for idx, path in enumerate(zip_paths)}
+        for done, future in enumerate(as_completed(futures), 1):
+            idx = futures[future]
+            try:
+                results[idx] = future.result()
+            except Exception as e:
+                # Worker crashed on this zip; report it like any other unreadable zip
+                results[idx] = {'file': os.path.basename(zip_paths[idx]), 'status': 'error', 'error': str(e),
+                                'rows': ColumnarRows(), 'alarms': ColumnarRows(), 'items': {}}
+            if progress_callback:
+                progress_callback(done, len(zip_paths), results[idx]['file'])
+    return results
+
+
+class LogScanWorker(QObject):
+    progress = pyqtSignal(int, int, str)  # done, total, zip file name
+    finished = pyqtSignal(object)  # object: passes the scan results (ColumnarRows) without a QVariant conversion
+    error = pyqtSignal(str)
+
+    def __init__(self, zip_paths):
+        super().__init__()
+        self.zip_paths = zip_paths
+
+    def run(self):
+        try:
+            results = scan_zip_files(self.zip_paths, progress_callback=self.progress.emit)
+        except Exception as e:
+            debug_print(f"LogScanWorker error: {e}")
+            self.error.emit(str(e))
+            results = []
+        self.finished.emit(results)
+
+
+def run_log_scan(zip_paths, parent=None):
+    """
+    Scan zip_paths and return the scan_zip results. With a running GUI the scan
+    runs on a QThread and a local event loop keeps the window responsive.
+    """
+    if QApplication.instance() is None:
+        return scan_zip_files(zip_paths)
+
+    progress = QProgressDialog("Checking logs and exporting...", None, 0, max(1, len(zip_paths)), parent)
+    progress.setWindowTitle("Checking Logs")
+    progress.setMinimumDuration(0)
+    progress.setValue(0)
+    progress.setCancelButton(None)
+    progress.show()
+
+    results = []
+    loop = QEventLoop()
+    worker = LogScanWorker(zip_paths)
+    thread = QThread()
+    worker.moveToThread(thread)
+
+    def on_progress(done, total, fname):
+        progress.setLabelText(f"Checking logs: {fname} ({done}/{total})")
+        progress.setValue(done)
+
+    def on_finished(scan_results):
+        results.extend(scan_results)
+        thread.quit()
+
+    worker.progress.connect(on_progress)
+    worker.finished.connect(on_finished)
+    thread.started.connect(worker.run)
+    thread.finished.connect(loop.quit)
+    thread.start()
+    loop.exec_()
+    thread.wait()
+    progress.close()
+    return results
+
+
+# MOBATCH_Check.xlsx layout
+SHEET_ORDER = ['Connection_Check', '3G_MOCN_CELL_LTE', 'Cell_Status']  # First sheets, the rest keep their order
+TAB_COLORS = {'3G_MOCN_CELL_LTE': '#FFFF00'}
+MAX_COLUMN_WIDTH = 25
+NEW_ALARM_COLOR = '#FFFF00'
+
+
+def column_widths(df):
+    """
+    Excel column widths from the DataFrame itself: longest header/value text
+    + 2, capped at MAX_COLUMN_WIDTH. Empty cells count as 4 ('None'), as the
+    old cell by cell autosize did.
+    """
+    widths = []
+    for idx, name in enumerate(df.columns):
+        column = df.iloc[:, idx]
+        longest = len(str(name))
+        if len(column):
+            lengths = column.astype(str).str.len().where(column.notna(), 4)
+            longest = max(longest, int(lengths.max()))
+        widths.append(min(longest + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+def export_check_sheets(out_path, sheets):
+    """
+    Write the log check sheets to out_path with xlsxwriter in one pass:
+    SHEET_ORDER sheets first, widths from the DataFrames, NEW Alarm rows of
+    ALARM_COMPARE highlighted with a conditional format.
+
+    Args:
+        out_path (str): Output workbook.
+        sheets (dict): Sheet name -> DataFrame, in creation order.
+    """
+    order = [name for name in SHEET_ORDER if name in sheets] + [name for name in sheets if name not in SHEET_ORDER]
+    with pd.ExcelWriter(out_path, engine='xlsxwriter') as writer:
+        new_alarm_format = writer.book.add_format({'bg_color': NEW_ALARM_COLOR})
+        for name in order:
+            df = sheets[name]
+            df.to_excel(writer, sheet_name=name, index=False)
+            worksheet = writer.sheets[name]
+            for idx, width in enumerate(column_widths(df)):
+                worksheet.set_column(idx, idx, width)
+            if name in TAB_COLORS:
+                worksheet.set_tab_color(TAB_COLORS[name])
+            if name == 'ALARM_COMPARE' and 'REMARK_COMPARE' in df.columns and len(df):
+                remark_col = xl_col_to_name(df.columns.get_loc('REMARK_COMPARE'))
+                worksheet.conditional_format(1, 0, len(df), len(df.columns) - 1, {
+                    'type': 'formula',
+                    'criteria': f'=${remark_col}2="NEW Alarm"',
+                    'format': new_alarm_format,
+                })
 
 
 def check_logs_and_export_to_excel(parent=None, log_check_mode="Normal Log Checking"):
@@ -27,11 +498,8 @@ def check_logs_and_export_to_excel(parent=None, log_check_mode="Normal Log Check
 
     download_dir = os.path.join(os.path.dirname(__file__), '..', '02_DOWNLOAD') # Adjust path to 02_DOWNLOAD
     zip_files = [fname for fname in os.listdir(download_dir) if fname.lower().endswith('.zip')]
-    result_rows = []
-    result_alarm_check = []  # New list for alarm data
-    result_cellstatus_check = []  # New list for cell status data
-    result_lte_check = []  # New list for LTE data
-    result_nr_check = []  # New list for NR data
+    result_rows = ColumnarRows()
+    result_alarm_check = ColumnarRows()  # Alarm data
     progress = None
 
     # Determine logic based on log_check_mode
@@ -71,507 +539,256 @@ def check_logs_and_export_to_excel(parent=None, log_check_mode="Normal Log Check
                 QMessageBox.warning(parent, "Warning", f"Could not load BEFORE.xlsx: {e}")
 
 
-    # Identify non-empty zip files
-    loop_zip_ok_file = []
-    total_zips = len(zip_files)
-    if QApplication.instance() is not None:
-        progress = QProgressDialog("Checking zip files...", None, 0, total_zips, parent)
-        progress.setWindowTitle("Checking Zips")
-        progress.setMinimumDuration(0)
-        progress.setValue(0)
-        progress.setCancelButton(None)
-        progress.show()
-
-    for idx, fname in enumerate(zip_files):
-        zip_path = os.path.join(download_dir, fname)
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                # Check if the zip file is empty
-                if zf.namelist(): # Check if namelist is NOT empty
-                    loop_zip_ok_file.append(zip_path)
-                else:
-                    debug_print(f"[INFO] Skipping empty zip file: {fname}")
-        except zipfile.BadZipFile:
-            debug_print(f"Skipping bad zip file: {fname}")
-        except Exception as e:
-            debug_print(f"Error processing zip file {fname} during check: {e}")
-
-        if progress is not None:
-            progress.setValue(idx + 1)
-            QApplication.processEvents()
-
-    if progress is not None:
-        progress.close()
-
-    # Now process the non-empty zip files
-    if QApplication.instance() is not None:
-        progress = QProgressDialog("Checking logs and exporting...", None, 0, len(loop_zip_ok_file), parent)
-        progress.setWindowTitle("Checking Logs")
-        progress.setMinimumDuration(0)
-        progress.setValue(0)
-        progress.setCancelButton(None)
-        progress.show() # This might block the UI update, consider using a timer or worker for heavy tasks
-
-
-    result_rows = []
-
-    # Define check patterns for different data types
-    item_check_list = [
-        {
-            'name': 'cellstatus',
-            'start_marker': '####LOG_cellstatus',
-            'end_marker': '####END_LOG_cellstatus',
-            'sheet_name': 'Cell_Status',
-            'result_list': []
-        },
-        {
-            'name': 'LTE_data',
-            'start_marker': '####LOG_bandwidth',
-            'end_marker': '####END_LOG_bandwidth',
-            'sheet_name': 'LTE_data',
-            'result_list': []
-        },
-        {
-            'name': 'NR_data',
-            'start_marker': '####LOG_BAND_NR_SECTOR',
-            'end_marker': '####END_LOG_BAND_NR_SECTOR',
-            'sheet_name': 'NR_data',
-            'result_list': []
-        },
-        {
-            'name': 'RNC_celldata',
-            'start_marker': '####LOG_CELL_3G',
-            'end_marker': '####END_LOG_CELL_3G',
-            'sheet_name': 'RNC_celldata',
-            'result_list': []
-        },
-        {
-            'name': 'RNC_IUBdata',
-            'start_marker': '####LOG_IUB_RNC_3G',
-            'end_marker': '####END_LOG_IUB_RNC_3G',
-            'sheet_name': 'RNC_IUBdata',
-            'result_list': []
-        }        
-        
-    ]
-
-    for idx, zip_path in enumerate(loop_zip_ok_file):
-        fname = os.path.basename(zip_path)
-        try:
-            with zipfile.ZipFile(zip_path, 'r') as zf:
-                for member in zf.namelist():
-                    # Looking for LOG/<ANY_FOLDER>/<NODENAME>.log
-                    parts = member.split('/')
-                    if len(parts) == 3 and parts[0] == 'LOG' and parts[2].endswith('.log'):
-                        folder = parts[1]
-                        nodename = parts[2][:-4]  # remove .log
-                        try:
-                            with zf.open(member) as f:
-                                # Read lines safely, handle potential errors
-                                try:
-                                    # Added 'rb' mode for reading binary, and decode
-                                    lines = [line.decode(errors='ignore').strip() for line in f.readlines()]
-                                except Exception as read_err:
-                                     debug_print(f"Error reading {member} in {fname}: {read_err}")
-                                     lines = [] # Assign empty list on error
-
-                            error1 = any('Checking ip contact...Not OK' in line for line in lines)
-                            error2 = any(line.startswith('Unable to connect to ') for line in lines)
-                            error3 = any('tbac control - unauthorised network element' in line for line in lines)
-
-                            # Update: UNREMOTE if either condition is met
-                            ###if any('Checking ip contact...Not OK' in line for line in lines) or any(line.startswith('Unable to connect to ') for line in lines):
-                            if error1 or error2 or error3:
-                                remark = 'UNREMOTE'
-                            else:
-                                remark = 'OK'
-                            result_rows.append({
-                                'FILE': fname,
-                                'FOLDER': folder,
-                                'NODENAME': nodename,
-                                'REMARK': remark,
-                                'Count': len(lines)
-                            })
-
-                            # Check for alarm logs in 99_CONCEK2 folder
-                            if len(parts) == 3 and parts[0] == 'LOG' and folder == '99_Hygiene_collect' and parts[2].endswith('.log'):
-                                alarm_section = False
-                                # Initialize section flags for all check patterns
-                                section_flags = {item['name']: False for item in item_check_list}
-                                
-                                for line in lines:
-                                    if '####LOG_Alarm' in line:
-                                        alarm_section = True
-                                        continue
-                                    elif '####END_LOG_Alarm' in line:
-                                        alarm_section = False
-                                        continue
-                                    
-                                    # Check for start/end markers for each pattern
-                                    for item in item_check_list:
-                                        if item['start_marker'] in line:
-                                            section_flags[item['name']] = True
-                                            continue
-                                        elif item['end_marker'] in line:
-                                            section_flags[item['name']] = False
-                                            continue
-                                    
-                                    if alarm_section and line.strip() and ';' in line:
-                                        try:
-                                            # Split line by semicolon and strip whitespace from each part
-                                            parts = [part.strip() for part in line.split(';')]
-                                            if len(parts) >= 7 and parts[0] != "Date" and parts[1] != "Time":  # Skip header row and ensure we have all required fields
-                                                result_alarm_check.append({
-                                                    'FILE': fname,
-                                                    'FOLDER': folder,
-                                                    'NODENAME': nodename,
-                                                    'Date': parts[0],
-                                                    'Time': parts[1],
-                                                    'Severity': parts[2],
-                                                    'Problem': parts[4],
-                                                    'Object': parts[3],
-                                                    'Cause': parts[5],
-                                                    'AdditionalText': parts[6]
-                                                })
-                                        except Exception as alarm_err:
-                                            debug_print(f"Error processing alarm line in {member}: {alarm_err}")
-
-                                    # Process data for each active section
-                                    for item in item_check_list:
-                                        if section_flags[item['name']] and line.strip() and ';' in line:
-                                            try:
-                                                # Split line by semicolon and strip whitespace from each part
-                                                parts = [part.strip() for part in line.split(';')]
-                                                
-                                                # If this is the header row, store the column mapping
-                                                if parts[0].lower() == "mo":
-                                                    header_mapping = {col.lower(): idx for idx, col in enumerate(parts)}
-                                                    continue
-                                                
-                                                # Skip empty lines
-                                                if not parts[0]:
-                                                    continue
-                                                    
-                                                # Create data entry with MO as special column
-                                                data_entry = {
-                                                    'FILE': fname,
-                                                    'NODENAME': nodename,
-                                                    'MO': parts[header_mapping.get('mo', 0)]
-                                                }
-                                                
-                                                # Add all other columns from the header mapping
-                                                for col_name, idx in header_mapping.items():
-                                                    if col_name != 'mo':  # Skip MO as it's already added
-                                                        data_entry[col_name] = parts[idx]
-                                                
-                                                item['result_list'].append(data_entry)
-                                                
-                                            except Exception as data_err:
-                                                debug_print(f"Error processing {item['name']} line in {member}: {data_err}")
-
-                        except Exception as open_err:
-                            debug_print(f"Error opening {member} in {fname}: {open_err}")
-        except zipfile.BadZipFile:
-            # This should ideally not happen if we checked in the first loop,
-            # but keeping for robustness.
-            debug_print(f"Skipping bad zip file during processing: {fname}")
-        except Exception as e:
-            debug_print(f"Error processing zip file {fname}: {e}")
-
-        if progress is not None:
-            progress.setValue(idx + 1)
-            QApplication.processEvents() # Allow UI updates
-
-    if progress is not None:
-        progress.close()
+    # Validate and scan the zips in worker processes (one task per zip); the
+    # window keeps painting while the results come in through signals.
+    zip_paths = [os.path.join(download_dir, fname) for fname in zip_files]
+    item_check_list = [dict(item, result_list=ColumnarRows()) for item in ITEM_CHECK_LIST]
+    scan_results = run_log_scan(zip_paths, parent)
+
+    for scan in scan_results:
+        if scan['status'] == 'empty':
+            debug_print(f"[INFO] Skipping empty zip file: {scan['file']}")
+            continue
+        if scan['status'] != 'ok':
+            debug_print(f"Skipping zip file {scan['file']}: {scan['error']}")
+            continue
+        result_rows.extend(scan['rows'])
+        result_alarm_check.extend(scan['alarms'])
+        for item in item_check_list:
+            item['result_list'].extend(scan['items'][item['name']])
+    del scan_results  # Worker results are merged; free them before building DataFrames
 
     # Create DataFrames
-    df = pd.DataFrame(result_rows, columns=['FILE', 'FOLDER', 'NODENAME', 'REMARK', 'Count'])
+    df = result_rows.to_frame(columns=CONNECTION_COLUMNS)
     df_connection_check = df.copy()
     out_path = os.path.join(download_dir, 'MOBATCH_Check.xlsx')
     
-    # Export to Excel with multiple sheets
+    # Export to Excel with multiple sheets (collected first, written once)
+    sheets = {}
     try:
-        with pd.ExcelWriter(out_path, engine='openpyxl') as writer:
-            # Check if df is not empty before writing
-            if not df.empty:
-                df.to_excel(writer, sheet_name='Connection_Check', index=False)
+        # Check if df is not empty before writing
+        if not df.empty:
+            sheets['Connection_Check'] = df
+        
+        if result_alarm_check:
+            df_alarm = result_alarm_check.to_frame()
+            if not df_alarm.empty:
+                debug_print("SKIP EXPORT")
+                sheets['ALARM'] = df_alarm
             
-            if result_alarm_check:
-                df_alarm = pd.DataFrame(result_alarm_check)
-                if not df_alarm.empty:
-                    debug_print("SKIP EXPORT")
-                    df_alarm.to_excel(writer, sheet_name='ALARM', index=False)
-                
-                # Compare with before data if available
-                if df_alarm_before is not None and not df_alarm_before.empty:
-                    try:
-                        # Rename columns in df_alarm_before to add _BEFORE suffix
-                        df_mobatch_status = df_mobatch_status.rename(columns={'REMARK': 'Mobatch_Before'})
-                        df_mobatch_status = df_mobatch_status.drop(columns=['FILE', 'FOLDER','Count'])
-                        df_alarm_before = df_alarm_before.drop(columns=['FILE', 'FOLDER'])
-                        df_alarm_before = df_alarm_before.add_suffix('_BEFORE')
+            # Compare with before data if available
+            if df_alarm_before is not None and not df_alarm_before.empty:
+                try:
+                    # Rename columns in df_alarm_before to add _BEFORE suffix
+                    df_mobatch_status = df_mobatch_status.rename(columns={'REMARK': 'Mobatch_Before'})
+                    df_mobatch_status = df_mobatch_status.drop(columns=['FILE', 'FOLDER','Count'])
+                    df_alarm_before = df_alarm_before.drop(columns=['FILE', 'FOLDER'])
+                    df_alarm_before = df_alarm_before.add_suffix('_BEFORE')
+                    
+                    # Verify required columns exist before merge
+                    required_columns = ['NODENAME', 'Severity', 'Problem', 'Object']
+                    if all(col in df_alarm.columns for col in required_columns) and \
+                       all(col in df_alarm_before.columns for col in [f"{col}_BEFORE" for col in required_columns]):
                         
-                        # Verify required columns exist before merge
-                        required_columns = ['NODENAME', 'Severity', 'Problem', 'Object']
-                        if all(col in df_alarm.columns for col in required_columns) and \
-                           all(col in df_alarm_before.columns for col in [f"{col}_BEFORE" for col in required_columns]):
-                            
-                            # Merge the dataframes on the specified keys
+                        # Merge the dataframes on the hashed alarm key
+                        df_compare_alarm = match_alarms(
+                            df_alarm,
+                            df_alarm_before,
+                            left_on=required_columns,
+                            right_on=[f"{col}_BEFORE" for col in required_columns]
+                        )
+                        
+                        # Check if df_mobatch_status exists and has required columns
+                        if 'df_mobatch_status' in locals() and df_mobatch_status is not None and not df_mobatch_status.empty and 'NODENAME' in df_mobatch_status.columns:
+                            # Merge the dataframes on df mobatch
                             df_compare_alarm = pd.merge(
-                                df_alarm,
-                                df_alarm_before,
-                                left_on=['NODENAME', 'Severity', 'Problem', 'Object'],
-                                right_on=['NODENAME_BEFORE', 'Severity_BEFORE', 'Problem_BEFORE', 'Object_BEFORE'],
+                                df_compare_alarm,
+                                df_mobatch_status,
+                                left_on=['NODENAME'],
+                                right_on=['NODENAME'],
                                 how='left'
                             )
-                            
-                            # Initialize REMARK column if it doesn't exist
-                            ##if 'REMARK_COMPARE' not in df_compare_alarm.columns:
-                               ##df_compare_alarm['REMARK_COMPARE'] = 'NO DATA BEFORE'
-                            
-                            # Check if df_mobatch_status exists and has required columns
-                            if 'df_mobatch_status' in locals() and df_mobatch_status is not None and not df_mobatch_status.empty and 'NODENAME' in df_mobatch_status.columns:
-                                # Merge the dataframes on df mobatch
-                                df_compare_alarm = pd.merge(
-                                    df_compare_alarm,
-                                    df_mobatch_status,
-                                    left_on=['NODENAME'],
-                                    right_on=['NODENAME'],
-                                    how='left'
-                                )
-
-                            # Remove specific _BEFORE columns
-                            columns_to_drop = ['NODENAME_BEFORE', 'Severity_BEFORE',
-                            'Object_BEFORE','Cause_BEFORE','AdditionalText_BEFORE']
-                            df_compare_alarm = df_compare_alarm.drop(columns=[col for col in columns_to_drop if col in df_compare_alarm.columns])
-                            
-                            # Add REMARK column based on whether the row exists in before data and Status_Before
-                            def get_remark(row):
-                                try:
-                                    if pd.notna(row['Problem_BEFORE']):
-                                        return 'Alarm Existing'
-                                    elif pd.isna(row['Mobatch_Before']):
-                                        return 'NO DATA BEFORE'
-                                    elif row['Mobatch_Before'] == 'UNREMOTE':
-                                        return 'Before Site Unremote'
-                                    elif row['Mobatch_Before'] == 'OK':
-                                        return 'NEW Alarm'
-                                    else:
-                                        return 'NO DATA BEFORE'
-                                except KeyError:
-                                    return 'NO DATA BEFORE'
-
-                            df_compare_alarm['REMARK_COMPARE'] = df_compare_alarm.apply(get_remark, axis=1)
-                            
-                            # Export the comparison data
-                            df_compare_alarm.to_excel(writer, sheet_name='ALARM_COMPARE', index=False)
-                            
-                            try:
-                                # Create yellow fill pattern
-                                yellow_fill = PatternFill(start_color='FFFF00',
-                                                        end_color='FFFF00',
-                                                        fill_type='solid')
-                                
-                                # Get the worksheet and apply highlighting
-                                worksheet = writer.sheets['ALARM_COMPARE']
-                                
-                                # Highlight NEW Alarm rows in yellow
-                                for idx, row in enumerate(df_compare_alarm['REMARK_COMPARE'], start=2):
-                                    if row == 'NEW Alarm':
-                                        for cell in worksheet[idx]:
-                                            cell.fill = yellow_fill
-                                
-                                debug_print("Successfully highlighted NEW Alarm rows")
-                            except Exception as e:
-                                debug_print(f"Warning: Could not highlight cells: {str(e)}")
-                                import traceback
-                                debug_print(traceback.format_exc())
-                            
-                            # Export the before data
-                            ##df_alarm_before.to_excel(writer, sheet_name='ALARM_BEFORE', index=False)
-                        else:
-                            debug_print("Warning: Required columns missing for alarm comparison")
-                            debug_print(f"Available columns in df_alarm: {df_alarm.columns.tolist()}")
-                            debug_print(f"Available columns in df_alarm_before: {df_alarm_before.columns.tolist()}")
-                    except Exception as e:
-                        debug_print(f"Error during alarm comparison: {str(e)}")
-                        import traceback
-                        debug_print(traceback.format_exc())
-            
-            # Export data for each check pattern if available
-            for item in item_check_list:
-                if item['result_list']:
-                    df_data = pd.DataFrame(item['result_list'])
-                    if log_check_mode == "collect data Hygiene":
-                        df_data.to_excel(writer, sheet_name=item['sheet_name'], index=False)
-                    ##Cell_Status
-                    if item['sheet_name'] == 'Cell_Status':
-                        column_order = ['NODENAME','MO',                      
-                            'administrativestate',
-                            'operationalstate' ]
-                        df_data = df_data.assign(**{col: pd.NA for col in column_order if col not in df_data.columns})
-                        df_data = df_data[column_order]
-                        df_data.to_excel(writer, sheet_name=item['sheet_name'], index=False)
-
-                    elif (item['sheet_name'] == 'LTE_data' and 
-                        'earfcndl' in df_data.columns and 'earfcnul' in df_data.columns and log_check_mode == "3G_MOCN_CELL_LTE_Checking"):
-
-                        df_mob_check = df_connection_check.copy()
-                        column_order = ['NODENAME','REMARK']                    
-                        df_mob_check = df_mob_check[column_order]
-                        df_mob_check = df_mob_check.rename(columns={'REMARK': 'REMARK_MOBATCH'})
-                        df_3GMOCN_cell_activity = pd.merge(df_3GMOCN_cell_activity, df_mob_check, left_on=['NODENAME'], right_on=['NODENAME'], how='left')
-
-
-                        df_lte_data = df_data.copy()
-                        df_lte_data['MO'] = df_lte_data['MO'].str.replace('EUtranCell(FDD|TDD)=', '', case=False, regex=True)
-
-                        column_order = ['NODENAME','MO',
-                            'earfcndl',
-                            'earfcnul',                        
-                            'administrativestate',
-                            'operationalstate' ]
-                        df_lte_data = df_lte_data.assign(**{col: pd.NA for col in column_order if col not in df_lte_data.columns})
-                        df_lte_data = df_lte_data[column_order]
-
-                        df_source = df_lte_data.rename(columns={'MO': 'SOURCE_MO_CELL'})
-                        df_target = df_lte_data.rename(columns={'MO': 'TARGET_MO_CELL'})
-
-                        # Single merge operation for both source and target
-                        df_merged = pd.merge(
-                            pd.merge(df_3GMOCN_cell_activity, df_source, left_on=['NODENAME', 'CELLNAME SOURCE'], right_on=['NODENAME', 'SOURCE_MO_CELL'], how='left', suffixes=('', '_SOURCE')),
-                            df_target,
-                            left_on=['NODENAME', 'CELLNAME TARGET'],
-                            right_on=['NODENAME', 'TARGET_MO_CELL'],
-                            how='left',
-                            suffixes=('_SOURCE', '_TARGET')
-                        )
-
-                        df_merged = df_merged.drop(columns=['SOURCE_MO_CELL', 'TARGET_MO_CELL'])
-
-                        # Remove duplicates based on specified columns for LTE_data
-                        df_merged = df_merged.drop_duplicates(subset=['NODENAME', 'CELLNAME SOURCE', 'CELLNAME TARGET'], keep='first')
-                        
-                        # Print information about removed duplicates
-                        removed_count = len(df_3GMOCN_cell_activity) - len(df_merged)
-                        if removed_count > 0:
-                            debug_print(f"Removed {removed_count} duplicate entries from LTE_data")
-                        
-                        # Export merged data to 3G_MOCN_CELL_LTE sheet
-                        df_merged.to_excel(writer, sheet_name='3G_MOCN_CELL_LTE', index=False)
-
-
-
-                    elif item['sheet_name'] == 'RNC_celldata' and 'iublinkref' in df_data.columns and log_check_mode == "RNC_Rehoming_Checking":
-                        # Remove 'UtranCell=' from MO column (case-insensitive)                    
-                        df_rnc_dump = df_data.copy()
-                        df_rnc_dump = df_rnc_dump[['NODENAME', 'MO']]  # Keep only NODENAME and MO columns
-                        df_rnc_dump['MO'] = df_rnc_dump['MO'].str.replace('UtranCell=', '', case=False)
 
-                        cell_status_data = pd.DataFrame(next(item['result_list'] for item in item_check_list if item['sheet_name'] == 'Cell_Status'))
-                        cell_status_data['STATE'] = cell_status_data['administrativestate'].astype(str) + ' ' + cell_status_data['operationalstate'].astype(str)
-                        cell_status_data['MO'] = cell_status_data['MO'].str.replace('UtranCell=', '', case=False)
-                        column_order = ['NODENAME','MO','STATE']
-                        cell_status_data = cell_status_data[column_order]
-                        ##df_merged = pd.merge(df_merged, cell_status_data, left_on=['RNC_SOURCE', 'CELLNAME'], right_on=['SOURCE_NODE', 'IUB_SOURCE'], how='left')
+                        # Remove specific _BEFORE columns
+                        columns_to_drop = ['NODENAME_BEFORE', 'Severity_BEFORE',
+                        'Object_BEFORE','Cause_BEFORE','AdditionalText_BEFORE']
+                        df_compare_alarm = df_compare_alarm.drop(columns=[col for col in columns_to_drop if col in df_compare_alarm.columns])
                         
-                        
-                        # Create source and target copies of df_rnc_dump for merging ##asli nya nanti kita skip kalau udah aman
-                        ##df_source = df_rnc_dump.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO'})
-                        ##df_target = df_rnc_dump.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO'})
-
-                        # Create source and target copies of df_rnc_dump for merging
-                        df_source = cell_status_data.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO', 'STATE': 'SOURCE_STATE'})
-                        df_target = cell_status_data.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO', 'STATE': 'TARGET_STATE'})
-
-
-                        # Single merge operation for both source and target
-                        df_merged = pd.merge(
-                            pd.merge(df_rnc_cell_activity, df_source, left_on=['RNC_SOURCE', 'CELLNAME'], right_on=['SOURCE_NODE', 'SOURCE_MO'], how='left'),
-                            df_target,
-                            left_on=['RNC_TARGET', 'CELLNAME'],
-                            right_on=['TARGET_NODE', 'TARGET_MO'],
-                            how='left'
+                        # Add REMARK column based on whether the row exists in before data and Status_Before
+                        matched = df_compare_alarm.pop('_merge').to_numpy() == 'both'
+                        df_compare_alarm['REMARK_COMPARE'] = alarm_remarks(
+                            matched, df_compare_alarm.get('Mobatch_Before')
                         )
                         
-                        # Add remarks based on merge results
-                        ##df_merged['REMARK_SOURCE'] = df_merged['SOURCE_NODE'].notna().map({True: 'DEFINED', False: 'N/A'})
-                        ##df_merged['REMARK_TARGET'] = df_merged['TARGET_NODE'].notna().map({True: 'DEFINED', False: 'N/A'})
+                        # Export the comparison data
+                        sheets['ALARM_COMPARE'] = df_compare_alarm
                         
-                        # Drop temporary columns
-                        df_merged = df_merged.drop(columns=['SOURCE_NODE', 'SOURCE_MO', 'TARGET_NODE', 'TARGET_MO'])
-
-
-                        # Create source and target copies of df_rnc_dump for merging 
-                        ### IUBLINK CHECK
-                        df_rnc_dump = df_data.copy()
-                        df_rnc_dump = df_rnc_dump[['NODENAME', 'iublinkref']]    
-                        df_rnc_dump['iublinkref'] = df_rnc_dump['iublinkref'].str.replace('IubLink=', '', case=False)                 
-                        df_source = df_rnc_dump.rename(columns={'NODENAME': 'SOURCE_NODE', 'iublinkref': 'IUB_SOURCE'})
-                        df_target = df_rnc_dump.rename(columns={'NODENAME': 'TARGET_NODE', 'iublinkref': 'IUB_TARGET'})
-
-                        ###RNC_IUBdata
-                        cell_IUB_data = pd.DataFrame(next(item['result_list'] for item in item_check_list if item['sheet_name'] == 'RNC_IUBdata'))
-                        cell_IUB_data['STATE'] = cell_IUB_data['administrativestate'].astype(str) + ' ' + cell_IUB_data['operationalstate'].astype(str)
-                        cell_IUB_data['MO'] = cell_IUB_data['MO'].str.replace('IubLink=', '', case=False)
-                        column_order = ['NODENAME','MO','STATE']
-                        cell_IUB_data = cell_IUB_data[column_order] 
-                        # Create source and target copies of df_rnc_dump for merging
-                        df_source = cell_IUB_data.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO', 'STATE': 'SOURCE_IUB_STATE'})
-                        df_target = cell_IUB_data.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO', 'STATE': 'TARGET_IUB_STATE'})
-
-
-                        # Single merge operation for both source and target
-                        df_merged = pd.merge(
-                            pd.merge(df_merged, df_source, left_on=['RNC_SOURCE', 'IUBLINK'], right_on=['SOURCE_NODE', 'SOURCE_MO'], how='left'),
-                            df_target,
-                            left_on=['RNC_TARGET', 'IUBLINK'],
-                            right_on=['TARGET_NODE', 'TARGET_MO'],
-                            how='left'
-                        )
-                        df_merged = df_merged.drop(columns=['SOURCE_NODE', 'SOURCE_MO', 'TARGET_NODE', 'TARGET_MO'])
-                        for col in ['SOURCE_STATE', 'TARGET_STATE', 'SOURCE_IUB_STATE','TARGET_IUB_STATE']: df_merged[col] = df_merged[col].fillna("N/A") if col in df_merged.columns else df_merged.get(col)
-
-                        # Add remarks based on merge results
-                        ##df_merged['REMARK_IUB_SOURCE'] = df_merged['SOURCE_NODE'].notna().map({True: 'IUB DEFINED', False: 'N/A'})
-                        ##df_merged['REMARK_IUB_TARGET'] = df_merged['TARGET_NODE'].notna().map({True: 'IUB DEFINED', False: 'N/A'})
-                        # Drop temporary columns
-                        ##df_merged = df_merged.drop(columns=['SOURCE_NODE', 'IUB_SOURCE', 'TARGET_NODE', 'IUB_TARGET'])
+                        # Export the before data
+                        ##df_alarm_before.to_excel(writer, sheet_name='ALARM_BEFORE', index=False)
+                    else:
+                        debug_print("Warning: Required columns missing for alarm comparison")
+                        debug_print(f"Available columns in df_alarm: {df_alarm.columns.tolist()}")
+                        debug_print(f"Available columns in df_alarm_before: {df_alarm_before.columns.tolist()}")
+                except Exception as e:
+                    debug_print(f"Error during alarm comparison: {str(e)}")
+                    import traceback
+                    debug_print(traceback.format_exc())
+        
+        # Export data for each check pattern if available
+        for item in item_check_list:
+            if item['result_list']:
+                df_data = item['result_list'].to_frame()
+                if log_check_mode == "collect data Hygiene":
+                    sheets[item['sheet_name']] = df_data
+                ##Cell_Status
+                if item['sheet_name'] == 'Cell_Status':
+                    column_order = ['NODENAME','MO',                      
+                        'administrativestate',
+                        'operationalstate' ]
+                    df_data = df_data.assign(**{col: pd.NA for col in column_order if col not in df_data.columns})
+                    df_data = df_data[column_order]
+                    sheets[item['sheet_name']] = df_data
+
+                elif (item['sheet_name'] == 'LTE_data' and 
+                    'earfcndl' in df_data.columns and 'earfcnul' in df_data.columns and log_check_mode == "3G_MOCN_CELL_LTE_Checking"):
+
+                    df_mob_check = df_connection_check.copy()
+                    column_order = ['NODENAME','REMARK']                    
+                    df_mob_check = df_mob_check[column_order]
+                    df_mob_check = df_mob_check.rename(columns={'REMARK': 'REMARK_MOBATCH'})
+                    df_3GMOCN_cell_activity = pd.merge(df_3GMOCN_cell_activity, df_mob_check, left_on=['NODENAME'], right_on=['NODENAME'], how='left')
+
+
+                    df_lte_data = df_data.copy()
+                    df_lte_data['MO'] = df_lte_data['MO'].str.replace('EUtranCell(FDD|TDD)=', '', case=False, regex=True)
+
+                    column_order = ['NODENAME','MO',
+                        'earfcndl',
+                        'earfcnul',                        
+                        'administrativestate',
+                        'operationalstate' ]
+                    df_lte_data = df_lte_data.assign(**{col: pd.NA for col in column_order if col not in df_lte_data.columns})
+                    df_lte_data = df_lte_data[column_order]
+
+                    df_source = df_lte_data.rename(columns={'MO': 'SOURCE_MO_CELL'})
+                    df_target = df_lte_data.rename(columns={'MO': 'TARGET_MO_CELL'})
+
+                    # Single merge operation for both source and target
+                    df_merged = pd.merge(
+                        pd.merge(df_3GMOCN_cell_activity, df_source, left_on=['NODENAME', 'CELLNAME SOURCE'], right_on=['NODENAME', 'SOURCE_MO_CELL'], how='left', suffixes=('', '_SOURCE')),
+                        df_target,
+                        left_on=['NODENAME', 'CELLNAME TARGET'],
+                        right_on=['NODENAME', 'TARGET_MO_CELL'],
+                        how='left',
+                        suffixes=('_SOURCE', '_TARGET')
+                    )
+
+                    df_merged = df_merged.drop(columns=['SOURCE_MO_CELL', 'TARGET_MO_CELL'])
+
+                    # Remove duplicates based on specified columns for LTE_data
+                    df_merged = df_merged.drop_duplicates(subset=['NODENAME', 'CELLNAME SOURCE', 'CELLNAME TARGET'], keep='first')
+                    
+                    # Print information about removed duplicates
+                    removed_count = len(df_3GMOCN_cell_activity) - len(df_merged)
+                    if removed_count > 0:
+                        debug_print(f"Removed {removed_count} duplicate entries from LTE_data")
+                    
+                    # Export merged data to 3G_MOCN_CELL_LTE sheet
+                    sheets['3G_MOCN_CELL_LTE'] = df_merged
 
-                        ####
 
 
-                        ###remove duplicate
-                        df_merged = df_merged.drop_duplicates(subset=['CELLNAME', 'IUBLINK', 'RNC_SOURCE', 'RNC_TARGET'], keep='first')
-                                           
-                                            
+                elif item['sheet_name'] == 'RNC_celldata' and 'iublinkref' in df_data.columns and log_check_mode == "RNC_Rehoming_Checking":
+                    # Remove 'UtranCell=' from MO column (case-insensitive)                    
+                    df_rnc_dump = df_data.copy()
+                    df_rnc_dump = df_rnc_dump[['NODENAME', 'MO']]  # Keep only NODENAME and MO columns
+                    df_rnc_dump['MO'] = df_rnc_dump['MO'].str.replace('UtranCell=', '', case=False)
 
-                        
-                        # Export merged data to RNC_ACTIVITY sheet
-                        df_merged.to_excel(writer, sheet_name='RNC_ACTIVITY', index=False)
-                        ##df_data.to_excel(writer, sheet_name=item['sheet_name'], index=False)
-               
-                        
-
-            # Adjust column widths for all sheets
-            for sheet_name in writer.sheets:
-                worksheet = writer.sheets[sheet_name]
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
+                    cell_status_data = next(item['result_list'] for item in item_check_list if item['sheet_name'] == 'Cell_Status').to_frame()
+                    cell_status_data['STATE'] = cell_status_data['administrativestate'].astype(str) + ' ' + cell_status_data['operationalstate'].astype(str)
+                    cell_status_data['MO'] = cell_status_data['MO'].str.replace('UtranCell=', '', case=False)
+                    column_order = ['NODENAME','MO','STATE']
+                    cell_status_data = cell_status_data[column_order]
+                    ##df_merged = pd.merge(df_merged, cell_status_data, left_on=['RNC_SOURCE', 'CELLNAME'], right_on=['SOURCE_NODE', 'IUB_SOURCE'], how='left')
+                    
                     
-                    # Find the maximum length of content in the column
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
+                    # Create source and target copies of df_rnc_dump for merging ##asli nya nanti kita skip kalau udah aman
+                    ##df_source = df_rnc_dump.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO'})
+                    ##df_target = df_rnc_dump.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO'})
+
+                    # Create source and target copies of df_rnc_dump for merging
+                    df_source = cell_status_data.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO', 'STATE': 'SOURCE_STATE'})
+                    df_target = cell_status_data.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO', 'STATE': 'TARGET_STATE'})
+
+
+                    # Single merge operation for both source and target
+                    df_merged = pd.merge(
+                        pd.merge(df_rnc_cell_activity, df_source, left_on=['RNC_SOURCE', 'CELLNAME'], right_on=['SOURCE_NODE', 'SOURCE_MO'], how='left'),
+                        df_target,
+                        left_on=['RNC_TARGET', 'CELLNAME'],
+                        right_on=['TARGET_NODE', 'TARGET_MO'],
+                        how='left'
+                    )
                     
-                    # Set column width (max 25 characters)
-                    adjusted_width = min(max_length + 2, 25)  # Add 2 for padding
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                    # Add remarks based on merge results
+                    ##df_merged['REMARK_SOURCE'] = df_merged['SOURCE_NODE'].notna().map({True: 'DEFINED', False: 'N/A'})
+                    ##df_merged['REMARK_TARGET'] = df_merged['TARGET_NODE'].notna().map({True: 'DEFINED', False: 'N/A'})
+                    
+                    # Drop temporary columns
+                    df_merged = df_merged.drop(columns=['SOURCE_NODE', 'SOURCE_MO', 'TARGET_NODE', 'TARGET_MO'])
+
+
+                    # Create source and target copies of df_rnc_dump for merging 
+                    ### IUBLINK CHECK
+                    df_rnc_dump = df_data.copy()
+                    df_rnc_dump = df_rnc_dump[['NODENAME', 'iublinkref']]    
+                    df_rnc_dump['iublinkref'] = df_rnc_dump['iublinkref'].str.replace('IubLink=', '', case=False)                 
+                    df_source = df_rnc_dump.rename(columns={'NODENAME': 'SOURCE_NODE', 'iublinkref': 'IUB_SOURCE'})
+                    df_target = df_rnc_dump.rename(columns={'NODENAME': 'TARGET_NODE', 'iublinkref': 'IUB_TARGET'})
+
+                    ###RNC_IUBdata
+                    cell_IUB_data = next(item['result_list'] for item in item_check_list if item['sheet_name'] == 'RNC_IUBdata').to_frame()
+                    cell_IUB_data['STATE'] = cell_IUB_data['administrativestate'].astype(str) + ' ' + cell_IUB_data['operationalstate'].astype(str)
+                    cell_IUB_data['MO'] = cell_IUB_data['MO'].str.replace('IubLink=', '', case=False)
+                    column_order = ['NODENAME','MO','STATE']
+                    cell_IUB_data = cell_IUB_data[column_order] 
+                    # Create source and target copies of df_rnc_dump for merging
+                    df_source = cell_IUB_data.rename(columns={'NODENAME': 'SOURCE_NODE', 'MO': 'SOURCE_MO', 'STATE': 'SOURCE_IUB_STATE'})
+                    df_target = cell_IUB_data.rename(columns={'NODENAME': 'TARGET_NODE', 'MO': 'TARGET_MO', 'STATE': 'TARGET_IUB_STATE'})
+
+
+                    # Single merge operation for both source and target
+                    df_merged = pd.merge(
+                        pd.merge(df_merged, df_source, left_on=['RNC_SOURCE', 'IUBLINK'], right_on=['SOURCE_NODE', 'SOURCE_MO'], how='left'),
+                        df_target,
+                        left_on=['RNC_TARGET', 'IUBLINK'],
+                        right_on=['TARGET_NODE', 'TARGET_MO'],
+                        how='left'
+                    )
+                    df_merged = df_merged.drop(columns=['SOURCE_NODE', 'SOURCE_MO', 'TARGET_NODE', 'TARGET_MO'])
+                    for col in ['SOURCE_STATE', 'TARGET_STATE', 'SOURCE_IUB_STATE','TARGET_IUB_STATE']: df_merged[col] = df_merged[col].fillna("N/A") if col in df_merged.columns else df_merged.get(col)
+
+                    # Add remarks based on merge results
+                    ##df_merged['REMARK_IUB_SOURCE'] = df_merged['SOURCE_NODE'].notna().map({True: 'IUB DEFINED', False: 'N/A'})
+                    ##df_merged['REMARK_IUB_TARGET'] = df_merged['TARGET_NODE'].notna().map({True: 'IUB DEFINED', False: 'N/A'})
+                    # Drop temporary columns
+                    ##df_merged = df_merged.drop(columns=['SOURCE_NODE', 'IUB_SOURCE', 'TARGET_NODE', 'IUB_TARGET'])
+
+                    ####
+
+
+                    ###remove duplicate
+                    df_merged = df_merged.drop_duplicates(subset=['CELLNAME', 'IUBLINK', 'RNC_SOURCE', 'RNC_TARGET'], keep='first')
+                                       
+                                        
+
+                    
+                    # Export merged data to RNC_ACTIVITY sheet
+                    sheets['RNC_ACTIVITY'] = df_merged
+                    ##df_data.to_excel(writer, sheet_name=item['sheet_name'], index=False)
+
+        # Sheets go out in their final order in one xlsxwriter pass
+        export_check_sheets(out_path, sheets)
 
     except Exception as e:
         debug_print(f"Error writing to Excel file: {str(e)}")
@@ -580,22 +797,6 @@ def check_logs_and_export_to_excel(parent=None, log_check_mode="Normal Log Check
         raise
 
     debug_print(f"Exported check results to {out_path}")
-    # Sort sheets: Connection_Check, 3G_MOCN_CELL_LTE, Cell_Status first (if they exist), then the rest
-    try:
-        import openpyxl
-        wb = openpyxl.load_workbook(out_path)
-        desired_order = ['Connection_Check', '3G_MOCN_CELL_LTE', 'Cell_Status']
-        # Move desired sheets to the front in the specified order if they exist
-        for sheet_name in reversed(desired_order):
-            if sheet_name in wb.sheetnames:
-                idx = wb.sheetnames.index(sheet_name)
-                ws = wb[sheet_name]
-                if sheet_name == '3G_MOCN_CELL_LTE':
-                    ws.sheet_properties.tabColor = "FFFF00"  # Keep yellow tab
-                wb._sheets.insert(0, wb._sheets.pop(idx))
-        wb.save(out_path)
-    except Exception as e:
-        debug_print(f"Could not reorder sheets or set tab color: {e}")
 
     # Display a success message box after export
     if QApplication.instance() is not None:
@@ -0,0 +1,118 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Rate-limited coalescing of session output before it reaches the terminal view
+#
+# Output that arrives after a quiet spell (typing, a prompt) is shown at once.
+# Output that keeps coming within 1 / max_updates_per_second of the last
+# update is held and shown together in the next update, so a flood costs at
+# most max_updates_per_second UI updates per second whatever its line rate.
+# Lines that would scroll out of the view's scrollback before they are shown
+# are dropped (they are still in the session log) and counted.
+
+import time
+from collections import deque
+
+DEFAULT_MAX_UPDATES_PER_SECOND = 20
+
+
+class OutputCoalescer:
+    """
+    Decide when buffered output is shown and in which batches.
+
+    Args:
+        max_updates_per_second (int): Upper bound of take() calls per second
+            that push() and delay() ask for.
+        max_pending_lines (int): Lines kept while waiting; older ones are dropped.
+            None (or 0, as Qt's unlimited maximumBlockCount) keeps everything.
+        clock (callable): Monotonic time source, in seconds.
+    """
+
+    def __init__(self, max_updates_per_second=DEFAULT_MAX_UPDATES_PER_SECOND, max_pending_lines=None, clock=time.monotonic):
+        self.min_interval = 1.0 / max_updates_per_second
+        self.max_pending_lines = max_pending_lines if max_pending_lines and max_pending_lines > 0 else None
+        self.clock = clock
+        self._pending = deque()
+        self._pending_lines = 0
+        self._last_update = None
+        self._dropped_pending = 0
+        # Totals for the session
+        self.updates = 0
+        self.texts = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def push(self, text):
+        """
+        Queue one output text (one or more lines).
+
+        Returns:
+            bool: True when the pending output should be shown now.
+        """
+        self._pending.append(text)
+        self._pending_lines += text.count('\n') + 1
+        self.texts += 1
+        if self.max_pending_lines is not None and self._pending_lines > self.max_pending_lines:
+            self._drop_oldest()
+        return self.delay() == 0
+
+    def discard_last(self, text):
+        """Remove text if it is the last pending output; True when removed."""
+        if self._pending and self._pending[-1] == text:
+            self._pending.pop()
+            self._pending_lines -= text.count('\n') + 1
+            self.texts -= 1
+            return True
+        return False
+
+    def delay(self):
+        """Seconds until the pending output may be shown, None when nothing is pending."""
+        if not self._pending:
+            return None
+        if self._last_update is None:
+            return 0
+        return max(0.0, self._last_update + self.min_interval - self.clock())
+
+    def take(self):
+        """
+        Take the pending output for one update.
+
+        Returns:
+            tuple: (texts, dropped) - the texts to show and how many lines were
+            dropped before them since the last update.
+        """
+        texts, dropped = list(self._pending), self._dropped_pending
+        self._pending.clear()
+        self._pending_lines, self._dropped_pending = 0, 0
+        if texts:
+            self.updates += 1
+            self.coalesced += len(texts) - 1
+            self._last_update = self.clock()
+        return texts, dropped
+
+    def stats(self):
+        return {'updates': self.updates, 'texts': self.texts, 'coalesced': self.coalesced, 'dropped': self.dropped}
+
+    def _drop_oldest(self):
+        excess = self._pending_lines - self.max_pending_lines
+        while excess > 0 and len(self._pending) > 1:
+            lines = self._pending[0].count('\n') + 1
+            if lines > excess:
+                break
+            self._pending.popleft()
+            excess -= lines
+            self._pending_lines -= lines
+            self._dropped_pending += lines
+            self.dropped += lines
+        if excess > 0:
+            # Cut the head of the oldest text
+            self._pending[0] = self._pending[0].split('\n', excess)[-1]
+            self._pending_lines -= excess
+            self._dropped_pending += excess
+            self.dropped += excess
@@ -10,46 +10,80 @@ import re
 import pandas as pd
 import numpy as np
 import xlsxwriter
-import glob
 import sys
 import os
+import math
+from collections import namedtuple
+from io import StringIO
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from .report_before_after_KPI import process_kpi_logs, create_main_merge_df, transform_headers
+from .alarm_compare import match_alarms, alarm_remarks
+from .compare_engine import CompareEngine, select_columns
 from tqdm import tqdm
 
 
-# Centralized patterns so it's easy to add/remove
-PATTERN_LOOP = ("cellstatus", "Alarm", 
-                "bandwidth", "SleepState", 
-"BAND_NR_SECTOR", "SSBFREQ_NR_CELL",
-"INTERMELINK_status","FEATURE_status","RSRPSCELLCOVERAGE","WAITFORBETTERSCELLREP",
-"ADDITIONALPUCCHFORCAENABLED","INTRAFREQMCCELLPROFILEREF", "NRCELLRELATION_STATUS",
-"GNBCUCPFunction_xnIpAddrViaNgActive",
-"AMF_status","SCTP_XN","LocalSctpEndpoint","AnrFunctionNR","TermPointToGNodeB"
+# Column order of the compare sheets that are not written as compared
+BANDWIDTH_COLUMNS = [
+    'NODENAME', 'MO', 'dlChannelBandwidth_Before', 'ulChannelBandwidth_Before', 'earfcndl_Before', 'earfcnul_Before',
+    'dlChannelBandwidth_After', 'ulChannelBandwidth_After', 'earfcndl_After', 'earfcnul_After',
+    'dlChannelBandwidth_Compare', 'ulChannelBandwidth_Compare', 'earfcndl_Compare', 'earfcnul_Compare',
+]
+CELL_STATUS_COLUMNS = [
+    'NODENAME', 'MO', 'administrativeState_Before', 'operationalState_Before',
+    'administrativeState_After', 'operationalState_After',
+    'administrativeState_Compare', 'operationalState_Compare',
+    'sleepState_Before', 'sleepState_After', 'sleepState_Compare',
+]
+BAND_NR_SECTOR_COLUMNS = [
+    'NODENAME', 'CELLNAME', 'MO', 'ssbFrequency_Before', 'arfcnDL_Before', 'arfcnUL_Before',
+    'bSChannelBwDL_Before', 'bSChannelBwUL_Before', 'ssbFrequency_After', 'arfcnDL_After', 'arfcnUL_After',
+    'bSChannelBwDL_After', 'bSChannelBwUL_After', 'MAIN_RESERVED_BY', 'ssbFrequency_Compare', 'arfcnDL_Compare',
+    'arfcnUL_Compare', 'bSChannelBwDL_Compare', 'bSChannelBwUL_Compare',
+    'reservedBy_Before', 'reservedBy_After', 'reservedBy_Compare',
+]
+
+# One check per ####LOG_<marker> ... ####END_LOG_<marker> section of the node logs
+#   marker       : section name in the node log
+#   key          : key in the dataframes dict (and sheet name unless sheet is set)
+#   sheet        : sheet name when it differs from key
+#   lookup       : columns matching the Before and After rows
+#   columns      : column order of the compare sheet (None = as compared)
+#   parser       : SECTION_PARSERS entry reading the section
+#   writer       : SHEET_WRITERS entry writing the sheet(s)
+#   require_both : skip the sheet unless Before and After both have rows
+Check = namedtuple("Check", "marker key sheet lookup columns parser writer require_both",
+                   defaults=(None, ('NODENAME', 'MO'), None, 'csv', 'compare', False))
+
+# In sheet order; a new parameter sheet is one more entry here
+CHECKS = (
+    Check('Alarm', 'Alarm', parser='alarm', writer='alarm'),
+    Check('bandwidth', 'bandwidth', columns=BANDWIDTH_COLUMNS),
+    Check('cellstatus', 'Cell Status', columns=CELL_STATUS_COLUMNS, writer='cell_status'),
+    Check('SleepState', 'SleepState'),
+    Check('BAND_NR_SECTOR', 'BAND_NR_SECTOR', sheet='Bandwidth 5G', columns=BAND_NR_SECTOR_COLUMNS,
+          writer='band_nr_sector'),
+    Check('SSBFREQ_NR_CELL', 'SSBFREQ_NR_CELL', require_both=True),
+    Check('AMF_status', 'TermPointToAmf'),
+    Check('SCTP_XN', 'Xn_SctpEndpoint'),
+    Check('LocalSctpEndpoint', 'Xn_LocalSctpEndpoint'),
+    Check('AnrFunctionNR', 'Xn_Parameter'),
+    Check('TermPointToGNodeB', 'TermPointToGNodeB', writer='before_after'),
+    Check('INTERMELINK_status', 'intermelink'),
+    Check('FEATURE_status', 'Feature'),
+    Check('RSRPSCELLCOVERAGE', 'rsrpSCellCoverage'),
+    Check('WAITFORBETTERSCELLREP', 'waitForBetterSCellRep'),
+    Check('ADDITIONALPUCCHFORCAENABLED', 'additionalPucchForCaEnabled'),
+    Check('INTRAFREQMCCELLPROFILEREF', 'intraFreqMcCellProfileRef'),
+    Check('GNBCUCPFunction_xnIpAddrViaNgActive', 'xnIpAddrViaNgActive_status'),
+    Check('NRCELLRELATION_STATUS', 'NRCellRelation', writer='before_after'),
 )
+CHECKS_BY_MARKER = {check.marker: check for check in CHECKS}
+CHECKS_BY_KEY = {check.key: check for check in CHECKS}
 
-# Map a pattern (as it appears in filename) to a key used in dataframes dict
-PATTERN_KEY_MAP = {
-    'Alarm': 'Alarm',
-    'bandwidth': 'bandwidth',
-    'cellstatus': 'Cell Status',
-    'SleepState': 'SleepState',
-    'BAND_NR_SECTOR': 'BAND_NR_SECTOR',
-    'SSBFREQ_NR_CELL': 'SSBFREQ_NR_CELL',
-    'AMF_status': 'TermPointToAmf',
-    'SCTP_XN' : 'Xn_SctpEndpoint',
-    'LocalSctpEndpoint' : 'Xn_LocalSctpEndpoint',
-    'AnrFunctionNR' : 'Xn_Parameter',
-    'TermPointToGNodeB' : 'TermPointToGNodeB',
-    'INTERMELINK_status': 'intermelink',
-    'FEATURE_status': 'Feature',
-    'RSRPSCELLCOVERAGE': 'rsrpSCellCoverage',
-    'WAITFORBETTERSCELLREP': 'waitForBetterSCellRep',
-    'ADDITIONALPUCCHFORCAENABLED': 'additionalPucchForCaEnabled',
-    'INTRAFREQMCCELLPROFILEREF': 'intraFreqMcCellProfileRef',
-    'GNBCUCPFunction_xnIpAddrViaNgActive': 'xnIpAddrViaNgActive_status',
-    'NRCELLRELATION_STATUS': 'NRCellRelation'
-}
+# Marker names and marker -> dataframes key, as derived from CHECKS
+PATTERN_LOOP = tuple(CHECKS_BY_MARKER)
+PATTERN_KEY_MAP = {check.marker: check.key for check in CHECKS}
 
 
 def reorder_columns(df):
@@ -76,161 +110,182 @@ def reorder_columns(df):
     return df_reordered
 
 
-# Function to extract NODENAME using regex
-def extract_nodename(filename):
-    # Build the alternation part from PATTERN_LOOP to make this extensible
-    # Also keep any legacy/static patterns if needed (e.g., freqPrioListEUTRA)
-    extra_patterns = ['freqPrioListEUTRA']
-    patterns = list(PATTERN_LOOP) + extra_patterns
-    alternation = '|'.join(re.escape(p) for p in patterns)
-    regex = rf'(.+?)_({alternation})\.LOGS_FILE'
-    match = re.match(regex, filename)
-    if match:
-        return match.group(1)
-    return None
+# One regex for every ####LOG_x / ####END_LOG_x marker, longest names first so
+# no pattern is shadowed by a shorter one that prefixes it
+PATTERN_MARKER = re.compile(r'####(END_)?LOG_(%s)' % '|'.join(
+    re.escape(marker) for marker in sorted(CHECKS_BY_MARKER, key=len, reverse=True)))
 
+# Whitespace cleanup of an extracted line: blanks before ';' are dropped and
+# other runs of 2+ blanks become a single space
+LINE_CLEANUP = re.compile(r'(?:\s{2,}| );|\s{2,}')
 
-def remark_log_as_unremote(logfile_path):
-    # Define the regex pattern to match lines that start with "Bye"
-    pattern = re.compile(r'^Bye')
+ALARM_COLUMNS = ['Date', 'Time', 'Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']
 
-    # Read the log file
-    with open(logfile_path, 'r', encoding='utf-8', errors='ignore') as file:
-        lines = file.readlines()
 
-    # Check if any line matches the pattern
-    contains_bye = any(pattern.match(line) for line in lines)
-    
-    # If no line matches, remark the log as "Unremote"
-    if not contains_bye:
-        remark_status = "Unremote"
-    else:
-        remark_status = "OK"
-        
-    return remark_status
+def _cleanup_blanks(match):
+    return ';' if match.group().endswith(';') else ' '
 
 
-def extract_log_patterns(logfile, patterns, log_folder):
-    log_folder = log_folder
-    input_path = os.path.join(log_folder, logfile)
-    base_name = os.path.splitext(logfile)[0]
-    
-    with open(input_path, 'r', encoding='utf-8', errors='ignore') as infile:
-        lines = infile.readlines()
-    
-    for pattern in patterns:
-        output_file = os.path.join(log_folder, f"{base_name}_{pattern}.LOGS_FILE")
-        extracting = False
-        
-        with open(output_file, 'w', encoding='utf-8') as outfile:
-            for line in lines:
-                if f'####LOG_{pattern}' in line:
-                    extracting = True
-                    continue  # Skip writing the start marker
-                elif f'####END_LOG_{pattern}' in line:
-                    extracting = False
-                    break  # Stop reading once end marker is found
-                
-                if extracting and ";" in line:
-                    cleaned_line = re.sub(r'\s{2,}', ' ', line.strip())  # Replace multiple spaces with a single space
-                    cleaned_line = re.sub(r' ;', ';', cleaned_line.strip())  # Replace multiple spaces with a single space
-                    outfile.write(cleaned_line + "\n")
-        
-        # print(f"Extracted content saved to: {output_file}")
+# A node log of a remote session ends with a line starting with "Bye"
+BYE_LINE = re.compile(r'^Bye', re.M)
+BYE_AFTER_LINE_BREAK = re.compile(rb'[\r\n]Bye')
 
+# Tail of a log searched first for the "Bye" line
+BYE_TAIL_SIZE = 64 * 1024
 
-def read_files_from_folder(folder_path, progress_callback=None):
-    # Initialize dataframes with 'Summary' first so Summary sheet is the first worksheet
-    dataframes = {'Summary': []}
-    for v in PATTERN_KEY_MAP.values():
-        dataframes[v] = []
 
-    log_files = [f for f in os.listdir(folder_path) if f.endswith('.log')]
-    
-    total_steps = len(log_files) + len(os.listdir(folder_path)) + 100 + 10  # Extraction + Summary + Processing + Cleanup
-    current_step = 0
-    
-    # Extract logs with progress reporting
-    total = len(log_files) or 1
-    for idx, filename in enumerate(log_files):
-        # use centralized PATTERN_LOOP
-        extract_log_patterns(filename, PATTERN_LOOP, folder_path)
-        current_step += 1
-        # report progress as 0-40% for extraction phase
-        if progress_callback:
-            progress_callback(int(40 * current_step / total_steps), f"Extracting {filename}")
-    
-    # First, create summaries from .log files
-    all_files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))]
-    for idx, filename in enumerate(all_files):
-        if filename.endswith('.log'):
-            file_path = os.path.join(folder_path, filename)
-            check_log = remark_log_as_unremote(file_path)
-            df = pd.DataFrame({'NODENAME': [filename.replace(".log", "")],
-                               'MO': [filename.replace(".log", "")],
-                               'Status': [check_log]})
-            dataframes['Summary'].append(df)
-        current_step += 1
-        if progress_callback:
-            # report progress up to ~60% for summary creation
-            progress_callback(min(60, int(60 * current_step / total_steps)), f"Summarizing {filename}")
+def remark_log_text(text):
+    """
+    "OK" if the log text has a line starting with "Bye", otherwise "Unremote".
+    The tail is searched first, the whole text only if the tail has no match.
+    """
+    if BYE_LINE.search(text, max(0, len(text) - BYE_TAIL_SIZE)) or BYE_LINE.search(text):
+        return "OK"
+    return "Unremote"
 
-    # Process the .LOGS_FILE files
-    logs_files = [f for f in os.listdir(folder_path) if f.endswith('.LOGS_FILE')]
-    for idx, filename in enumerate(logs_files):
-        if not filename.endswith('.LOGS_FILE'):
-            continue
 
-        file_path = os.path.join(folder_path, filename)
-        if os.stat(file_path).st_size == 0:
-            continue
+def remark_log_as_unremote(logfile_path):
+    """
+    remark_log_text for a log on disk: only the last BYE_TAIL_SIZE bytes are
+    read, unless they have no "Bye" line, then the whole file is scanned.
+    """
+    with open(logfile_path, 'rb') as file:
+        size = file.seek(0, os.SEEK_END)
+        if size > BYE_TAIL_SIZE:
+            # Start one byte early so a "Bye" opening the tail is seen after its line break
+            file.seek(size - BYE_TAIL_SIZE - 1)
+            if BYE_AFTER_LINE_BREAK.search(file.read()):
+                return "OK"
+        file.seek(0)
+        data = file.read()
+    if data.startswith(b'Bye') or BYE_AFTER_LINE_BREAK.search(data):
+        return "OK"
+    return "Unremote"
+
+
+def extract_log_patterns(text):
+    """
+    Split a node log into its ####LOG_<pattern> sections in a single pass.
+
+    For each pattern the section runs from its first start marker to the next
+    end marker (an end marker before any start marker leaves it empty); only
+    lines containing ';' are kept, cleaned with LINE_CLEANUP.
+
+    Args:
+        text (str): Whole content of the node log.
 
-        nodename = extract_nodename(filename)
-        if nodename is None:
-            print(f"Skipping file with unexpected format: {filename}")
+    Returns:
+        dict: pattern -> cleaned section text, for the non-empty sections only.
+    """
+    starts, ends = {}, {}
+    line_no = 0
+    pos = 0
+    for m in PATTERN_MARKER.finditer(text):
+        line_no += text.count('\n', pos, m.start())
+        pos = m.start()
+        (ends if m.group(1) else starts).setdefault(m.group(2), set()).add(line_no)
+    if not starts:
+        return {}
+
+    lines = text.split('\n')
+    sections = {}
+    for pattern, start_lines in starts.items():
+        first = min(start_lines)
+        # A line holding the start marker is never an end line
+        end_lines = sorted(ends.get(pattern, set()) - start_lines)
+        if end_lines and end_lines[0] < first:
             continue
+        end = next((n for n in end_lines if n > first), None)
+        cleaned = [
+            LINE_CLEANUP.sub(_cleanup_blanks, line.strip())
+            for n, line in enumerate(lines[first + 1:end], first + 1)
+            if ';' in line and n not in start_lines
+        ]
+        if cleaned:
+            sections[pattern] = '\n'.join(cleaned) + '\n'
+    return sections
 
-        try:
-            # Special-case Alarm layout
-            if '_Alarm.LOGS_FILE' in filename:
-                df = pd.read_csv(file_path, delimiter=';', skiprows=0,
-                                 names=['Date', 'Time', 'Severity', 'Object', 'Problem', 'Cause'] + 
-                                        [f'AdditionalText{i}' for i in range(1, 9)], dtype=str, keep_default_na=False)
-                df['AdditionalText'] = df[[f'AdditionalText{i}' for i in range(1, 9)]].apply(
-                    lambda x: ';'.join(x), axis=1)
-                df = df[df['Date'] != 'Date']
-                df = df[['Date', 'Time', 'Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']]
-            else:
-                df = pd.read_csv(file_path, delimiter=';', dtype=str, keep_default_na=False)
-
-            df['NODENAME'] = nodename
-
-            # Determine which key to append to by checking which pattern appears in filename
-            appended = False
-            for pat, key in PATTERN_KEY_MAP.items():
-                if f'_{pat}.LOGS_FILE' in filename:
-                    dataframes[key].append(df)
-                    appended = True
-                    break
-
-            if not appended:
-                # If no pattern matched, print a debug message and skip
-                print(f"No matching pattern for file: {filename}")
 
+def read_csv_section(section_text):
+    """Read a ';' separated section into a DataFrame (all columns as str)."""
+    return pd.read_csv(StringIO(section_text), delimiter=';', dtype=str, keep_default_na=False)
+
+
+def read_alarm_section(section_text):
+    """Read the Alarm section: AdditionalText may itself contain ';'."""
+    extra_cols = [f'AdditionalText{i}' for i in range(1, 9)]
+    df = pd.read_csv(StringIO(section_text), delimiter=';', skiprows=0,
+                     names=ALARM_COLUMNS[:-1] + extra_cols, dtype=str, keep_default_na=False)
+    df['AdditionalText'] = df[extra_cols].apply(lambda x: ';'.join(x), axis=1)
+    df = df[df['Date'] != 'Date']
+    return df[ALARM_COLUMNS]
+
+
+SECTION_PARSERS = {
+    'csv': read_csv_section,
+    'alarm': read_alarm_section,
+}
+
+
+def read_pattern_section(pattern, section_text):
+    """Read one extracted section with the parser of its check."""
+    return SECTION_PARSERS[CHECKS_BY_MARKER[pattern].parser](section_text)
+
+
+def read_node_log(folder_path, filename):
+    """
+    Read one node log and parse all of its pattern sections.
+
+    Returns:
+        tuple: (nodename, status, {dataframes key: DataFrame}). status is the
+        remark_log_text result, or 'ERROR' if a section failed to parse.
+    """
+    file_path = os.path.join(folder_path, filename)
+    nodename = os.path.splitext(filename)[0]
+
+    with open(file_path, 'r', encoding='utf-8', errors='ignore') as infile:
+        text = infile.read()
+    status = remark_log_text(text)
+
+    frames = {}
+    for pattern, section_text in extract_log_patterns(text).items():
+        try:
+            df = read_pattern_section(pattern, section_text)
         except Exception as e:
-            print(f"Error processing file {filename}: {e}")
-            # Find the summary for the current node and update its status
-            for summary_df in dataframes['Summary']:
-                if summary_df['NODENAME'].iloc[0] == nodename:
-                    summary_df.loc[summary_df['NODENAME'] == nodename, 'Status'] = 'ERROR'
-                    break
+            print(f"Error processing {pattern} section of {filename}: {e}")
+            status = 'ERROR'
             continue
-        
-        current_step += 1
-        if progress_callback:
-            # report progress up to ~90% for processing files
-            progress_callback(min(90, int(60 + 30 * current_step / total_steps)), f"Processing {filename}")
-    
+        df['NODENAME'] = nodename
+        frames[CHECKS_BY_MARKER[pattern].key] = df
+    return nodename, status, frames
+
+
+def list_node_logs(folder_path):
+    """Node log files (*.log) of a Before/After folder."""
+    return [f for f in os.listdir(folder_path)
+            if f.endswith('.log') and os.path.isfile(os.path.join(folder_path, f))]
+
+
+def build_dataframes(node_results):
+    """
+    Collect read_node_log results into the dataframes dict used by write_to_excel.
+
+    Args:
+        node_results (iterable): (nodename, status, frames) per node log.
+
+    Returns:
+        dict: 'Summary' first, then one DataFrame per check key (CHECKS order).
+    """
+    # Initialize dataframes with 'Summary' first so Summary sheet is the first worksheet
+    dataframes = {'Summary': []}
+    for check in CHECKS:
+        dataframes[check.key] = []
+
+    for nodename, status, frames in node_results:
+        dataframes['Summary'].append(pd.DataFrame({'NODENAME': [nodename], 'MO': [nodename], 'Status': [status]}))
+        for key, df in frames.items():
+            dataframes[key].append(df)
+
     # Concatenate DataFrames
     for key in dataframes:
         if dataframes[key]:
@@ -243,19 +298,85 @@ def read_files_from_folder(folder_path, progress_callback=None):
         else:
             # Ensure empty keys have DataFrame structure instead of empty list
             dataframes[key] = pd.DataFrame(columns=['NODENAME', 'MO'])
-    
-    # Clean up temporary files
-    files = glob.glob(os.path.join(folder_path, "*.LOGS_FILE"))
-    for idx, file in enumerate(files):
-        os.remove(file)
-        current_step += 1
-        if progress_callback:
-            # report 90-99% for cleanup
-            progress_callback(min(99, int(90 + 9 * current_step / total_steps)), f"Deleting {os.path.basename(file)}")
-    
+
     return dataframes
 
 
+def read_files_from_folder(folder_path, progress_callback=None):
+    log_files = list_node_logs(folder_path)
+
+    # Each log is read once; its sections are parsed in memory
+    node_results = []
+    total = len(log_files) or 1
+    for idx, filename in enumerate(log_files):
+        node_results.append(read_node_log(folder_path, filename))
+        if progress_callback:
+            progress_callback(min(99, int(99 * (idx + 1) / total)), f"Processing {filename}")
+
+    return build_dataframes(node_results)
+
+
+# Upper bound of node logs sent to a worker process per task
+INGEST_BATCH_SIZE = 20
+
+
+def default_ingest_workers():
+    """Default number of worker processes for read_folders_parallel."""
+    return max(1, min(4, os.cpu_count() or 1))
+
+
+def read_node_log_batch(folder_path, filenames):
+    """Process pool entry point: read_node_log for a batch of logs of one folder."""
+    return [read_node_log(folder_path, filename) for filename in filenames]
+
+
+def read_folders_parallel(folder_paths, progress_callback=None, workers=None):
+    """
+    Read several Before/After folders with one process pool.
+
+    The node logs of all folders are queued together, so the folders are
+    ingested concurrently and the workers stay busy until the last log.
+
+    Args:
+        folder_paths (list): Folders to read (e.g. [before_path, after_path]).
+        progress_callback (callable): Called with (progress, message).
+        workers (int): Worker processes (default: default_ingest_workers()).
+
+    Returns:
+        list: One dataframes dict per folder, identical to what
+        read_files_from_folder returns for it.
+    """
+    workers = workers or default_ingest_workers()
+    folder_logs = [list_node_logs(folder) for folder in folder_paths]
+    total = sum(len(logs) for logs in folder_logs)
+    batch_size = max(1, min(INGEST_BATCH_SIZE, math.ceil(total / (workers * 4))))
+
+    # Results are slotted back by (folder, batch) to keep the log order
+    batch_results = [[None] * math.ceil(len(logs) / batch_size) for logs in folder_logs]
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {}
+        for i, (folder, logs) in enumerate(zip(folder_paths, folder_logs)):
+            for b in range(len(batch_results[i])):
+                names = logs[b * batch_size:(b + 1) * batch_size]
+                futures[pool.submit(read_node_log_batch, folder, names)] = (i, b, len(names))
+
+        done = 0
+        for future in as_completed(futures):
+            i, b, count = futures[future]
+            batch_results[i][b] = future.result()
+            done += count
+            if progress_callback:
+                progress_callback(min(99, int(99 * done / (total or 1))),
+                                  f"Processed {done}/{total} logs ({os.path.basename(folder_paths[i])})")
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+
+    return [build_dataframes(result for batch in batches for result in batch) for batches in batch_results]
+
+
 # Function to compare two dataframes and format the difference
 def compare_dataframes(df_before, df_after):
     df_merged = pd.merge(df_before, df_after, on=['NODENAME', 'MO'], how='outer', suffixes=('_Before', '_After'))
@@ -299,17 +420,12 @@ def write_alarm_dataframe_with_format(df, sheet_name, writer):
     headers = ['NODENAME', 'Date', 'Time', 'Severity', 'Problem', 'Object', 'Cause', 'AdditionalText']
     df = df[headers]
 
-    for col_num, header in enumerate(headers):
-        worksheet.write(1, col_num, header)
+    worksheet.write_row(1, 0, headers)
     
-    # Write the DataFrame data starting from the third row
-    for row_num, row_data in enumerate(df.values.tolist(), start=2):
-        for col_num, cell_data in enumerate(row_data):
-            # Handle NaN values
-            if pd.isna(cell_data):
-                worksheet.write(row_num, col_num, '')  # Write an empty string for NaN values
-            else:
-                worksheet.write(row_num, col_num, cell_data)
+    # Write the DataFrame data starting from the third row, NaN as empty cells
+    values = df.astype(object).where(df.notna(), None).values.tolist()
+    for row_num, row_data in enumerate(values, start=2):
+        worksheet.write_row(row_num, 0, row_data)
 
 
 ### for summary Sheet
@@ -318,25 +434,23 @@ def write_summary(df, sheet_name, writer, cell_bef, cell_after):
     df_check_cell = count_df_by_nodename(cell_bef, cell_after, "Cell_COUNT")
     df_result = pd.merge(df, df_check_cell, on='NODENAME', how='left')
     
-    df_result.to_excel(writer, sheet_name=sheet_name, index=False)
-    
     workbook  = writer.book
-    worksheet = writer.sheets[sheet_name]
+    worksheet = workbook.add_worksheet(sheet_name)
     
     # Define formats
     header_format1 = workbook.add_format({'bold': True, 'bg_color': '#FFFF00', 'border': 1})
-    header_format = workbook.add_format({'bold': True, 'bg_color': '#ffa383', 'border': 1})
     cell_format = workbook.add_format({'border': 1})
     
-    # Apply formats
-    for col_num, value in enumerate(df.columns.values):
-        worksheet.write(0, col_num, value, header_format1)
+    # Header: the summary columns in yellow, the cell count columns plain
+    summary_cols = len(df.columns)
+    worksheet.write_row(0, 0, df_result.columns[:summary_cols].tolist(), header_format1)
+    worksheet.write_row(0, summary_cols, df_result.columns[summary_cols:].tolist())
     
-    # Apply cell format to the entire table
-    for row in range(1, len(df) + 1):
-        print(f"write NODENAME [{df.iloc[row - 1, 0]}] [{row} of {len(df) + 1}]")
-        for col in range(len(df.columns)):
-            worksheet.write(row, col, df.iloc[row - 1, col], cell_format)    
+    # One write_row per node: bordered summary cells, then the cell counts (NaN left empty)
+    values = df_result.astype(object).where(df_result.notna(), None).values.tolist()
+    for row_num, row_data in enumerate(values, start=1):
+        worksheet.write_row(row_num, 0, row_data[:summary_cols], cell_format)
+        worksheet.write_row(row_num, summary_cols, row_data[summary_cols:])
     
     # Set column widths
     worksheet.set_column('A:A', 20)  # Column A width 35
@@ -441,61 +555,8 @@ def write_summary(df, sheet_name, writer, cell_bef, cell_after):
           
           
 def compare_dataframes_with_check(df_before, df_after, col_lookup):
-    # Make a copy to avoid modifying the original col_lookup
-    ordered_columns = col_lookup.copy()
-    before_columns = []  # Untuk menyimpan kolom _Before
-    after_columns = []   # Untuk menyimpan kolom _After
-    compare_columns = [] # Untuk menyimpan kolom _Compare
-
-    # Ensure all col_lookup columns exist in both DataFrames
-    missing_cols_before = [col for col in col_lookup if col not in df_before.columns]
-    missing_cols_after = [col for col in col_lookup if col not in df_after.columns]
-
-    # Tambahkan kolom yang hilang ke DataFrame
-    if missing_cols_before:
-        print(f"Menambahkan kolom yang hilang di BEFORE: {missing_cols_before}")
-        for col in missing_cols_before:
-            df_before[col] = None
-            
-    if missing_cols_after:
-        print(f"Menambahkan kolom yang hilang di AFTER: {missing_cols_after}")
-        for col in missing_cols_after:
-            df_after[col] = None
-
-    df_merged = pd.merge(df_before, df_after, on=col_lookup, how='outer', suffixes=('_Before', '_After'))
-
-    # Remove unwanted rows
-    if 'MO' in df_merged.columns:
-        df_merged = df_merged[df_merged['MO'] != 'MO']
-
-    # Proses kolom-kolom untuk membuat kolom _Before, _After, dan _Compare
-    for column in df_before.columns:
-        if column not in col_lookup:
-            col_before = f'{column}_Before'
-            col_after = f'{column}_After'
-            col_compare = f'{column}_Compare'
-
-            if col_before not in df_merged.columns:
-                df_merged[col_before] = None
-            if col_after not in df_merged.columns:
-                df_merged[col_after] = None
-
-            df_merged[col_compare] = df_merged[col_before] == df_merged[col_after]
-
-            # Simpan kolom _Before, _After, dan _Compare dalam array terpisah
-            before_columns.append(col_before)
-            after_columns.append(col_after)
-            compare_columns.append(col_compare)
-
-    # Tambahkan kolom ke ordered_columns dengan urutan: kolom lookup, semua _Before, semua _After, semua _Compare
-    ordered_columns.extend(before_columns)
-    ordered_columns.extend(after_columns)
-    ordered_columns.extend(compare_columns)
-
-    # Reorder the columns
-    df_merged = df_merged[ordered_columns]
-
-    return df_merged
+    """Compare one Before/After pair (see CompareEngine.compare)."""
+    return CompareEngine({}, {}, col_lookup).compare(df_before, df_after, col_lookup)
 
 
 def clean_dataframe(df):
@@ -540,6 +601,173 @@ def count_df_by_nodename(df_before,df_after, col_name):
     return df_joined
 
 
+def write_autofit_sheet(df, sheet_name, writer, highlight_remark=None):
+    """
+    Write DataFrame to Excel and auto-fit column widths (max 50). With
+    highlight_remark, rows whose REMARK equals it are highlighted in yellow.
+    """
+    df = reorder_columns(df)
+    df.to_excel(writer, sheet_name=sheet_name, index=False)
+    ws = writer.sheets[sheet_name]
+
+    # Auto-fit column widths
+    for i, col in enumerate(df.columns):
+        width = min(50, max(len(col), df[col].astype(str).str.len().max() or 0) + 2)
+        ws.set_column(i, i, width)
+
+    # Add conditional formatting for highlighted REMARK rows
+    if highlight_remark and 'REMARK' in df.columns:
+        remark_col_idx = df.columns.get_loc('REMARK')
+        remark_col_letter = chr(65 + remark_col_idx)  # Convert to Excel column letter (A, B, C, etc.)
+
+        # Create yellow background format
+        yellow_format = writer.book.add_format({'bg_color': '#FFFF00'})
+
+        # Apply conditional formatting to highlight rows where REMARK = highlight_remark
+        ws.conditional_format(f'A2:{chr(65 + len(df.columns) - 1)}{len(df) + 1}', {
+            'type': 'formula',
+            'criteria': f'=${remark_col_letter}2="{highlight_remark}"',
+            'format': yellow_format
+        })
+
+
+def write_alarm_sheets(check, data_before, data_after, writer, compare_engine):
+    """Alarm_Before / Alarm_After sheets and the NEW_Alarm comparison."""
+    key = check.key
+    write_alarm_dataframe_with_format(data_before[key].reset_index(drop=True), 'Alarm_Before', writer)
+    write_alarm_dataframe_with_format(data_after[key].reset_index(drop=True), 'Alarm_After', writer)
+    # 2. Ambil semua nilai unik dari kolom 'NODENAME'
+    unique_statuses = data_before['Cell Status']['NODENAME'].unique()
+    df_bf1 = pd.DataFrame(unique_statuses, columns=['NODENAME'])
+
+    # 4. Tambahkan kolom penanda (flag) baru yang bernilai 1
+    df_bf1["MOBATCH_BEFORE"] = "OK"
+
+    # Tentukan kolom kunci untuk merge pertama
+    key_cols_1 = ['NODENAME', 'Severity', 'Problem', 'Object', 'Cause']
+
+    # 2. Merge kiri pertama: data_after -> data_before (hashed alarm key)
+    # '_merge' = 'both' jika ada di data_before, 'left_only' jika tidak
+    merged_df = match_alarms(
+        data_after[key],
+        data_before[key],
+        left_on=key_cols_1,
+        suffixes=('_After', '_Before')
+    )
+
+    # 3. Merge kiri kedua: merged_df -> df_bf1
+    # Ini untuk menambahkan kolom FLAG_BEFORE berdasarkan NODENAME
+    final_df = pd.merge(
+        merged_df,
+        df_bf1,
+        on='NODENAME',
+        how='left'
+    )
+    final_df['MOBATCH_BEFORE'] = final_df['MOBATCH_BEFORE'].fillna('NOK')
+
+    # 4. REMARK: EXISTING jika ada di data_before, NEW ALARM jika node OK sebelumnya
+    final_df['REMARK'] = alarm_remarks(
+        final_df['_merge'] == 'both', final_df['MOBATCH_BEFORE'],
+        existing='EXISTING', new='NEW ALARM',
+        unremote='DATA BEFORE NOT FOUND', no_data='DATA BEFORE NOT FOUND'
+    )
+
+    # Define the required column order
+    required_columns = [
+        'NODENAME', 'Object', 'Problem', 'Cause',
+        'Date_After', 'Time_After',
+        'Date_Before', 'Time_Before',
+        'REMARK', 'MOBATCH_BEFORE'
+    ]
+
+    # Create a new DataFrame with only the required columns
+    # Fill missing columns with "NULL"
+    filtered_df = pd.DataFrame()
+    for col in required_columns:
+        if col in final_df.columns:
+            filtered_df[col] = final_df[col].fillna("NULL")
+        else:
+            filtered_df[col] = "NULL"
+
+    write_autofit_sheet(filtered_df, "NEW_Alarm", writer, highlight_remark="NEW ALARM")
+
+
+def write_before_after_sheets(check, data_before, data_after, writer, compare_engine):
+    """The Before and After rows as they are, on <sheet>_Before and <sheet>_After."""
+    sheet = check.sheet or check.key
+    write_autofit_sheet(data_before[check.key], f"{sheet}_Before", writer)
+    write_autofit_sheet(data_after[check.key], f"{sheet}_After", writer)
+
+
+def write_compare_sheet(check, data_before, data_after, writer, compare_engine):
+    """Before/After compare sheet with the mismatch counts on top."""
+    key = check.key
+    if check.columns:
+        df_diff = compare_engine.compare(data_before[key], data_after[key], list(check.lookup), sheet=key)
+        df_diff = select_columns(df_diff, check.columns)
+    else:
+        # An empty side takes the columns of the other, so every column is compared
+        if len(data_before[key]) == 0:
+            data_before[key] = pd.DataFrame(columns=data_after[key].columns)
+        if len(data_after[key]) == 0:
+            data_after[key] = pd.DataFrame(columns=data_before[key].columns)
+        df_diff = compare_engine.compare(data_before[key], data_after[key], list(check.lookup), sheet=key)
+    write_count_false(df_diff, check.sheet or key, writer)
+
+
+def write_cell_status_sheet(check, data_before, data_after, writer, compare_engine):
+    """Cell Status compare sheet, joined with the SleepState comparison."""
+    key = check.key
+    col_lookup = list(check.lookup)
+    data_before[key] = clean_cell_status(data_before[key])
+    data_after[key] = clean_cell_status(data_after[key])
+
+    table_SleepState = "SleepState"
+    df_diff_sleepstate = compare_engine.compare(data_before[table_SleepState], data_after[table_SleepState], col_lookup, sheet=table_SleepState)
+    # Clean the "MO" column
+    df_diff_sleepstate["MO"] = df_diff_sleepstate["MO"].str.replace(r",CellSleepFunction=1", "", flags=re.IGNORECASE, regex=True)
+
+    cell_status_diff = compare_engine.compare(data_before[key], data_after[key], col_lookup, sheet=key)
+    merged_df = pd.merge(cell_status_diff, df_diff_sleepstate, on=col_lookup, how='left')
+    merged_df = select_columns(merged_df, check.columns)
+    write_count_false(merged_df, check.sheet or key, writer)
+
+
+def write_band_nr_sector_sheet(check, data_before, data_after, writer, compare_engine):
+    """NR sector carrier compare sheet, joined with the SSB frequency of the cell reserving it."""
+    key = check.key
+    col_lookup = list(check.lookup)
+    # Check if reservedBy column exists, if not skip this processing
+    if 'reservedBy' not in data_before[key].columns or 'reservedBy' not in data_after[key].columns:
+        print(f"Skipping {key} - reservedBy column not found")
+        return
+
+    pattern = r'(NRCellDU=.*?)(?:\s|$)'
+
+    data_before[key]['reservedBy'] = data_before[key]['reservedBy'].str.extract(pattern)
+    data_after[key]['reservedBy'] = data_after[key]['reservedBy'].str.extract(pattern)
+    merged_df = compare_engine.compare(data_before[key], data_after[key], col_lookup, sheet=key)
+    df_diff_ssbfreq = compare_engine.compare(data_before["SSBFREQ_NR_CELL"], data_after["SSBFREQ_NR_CELL"], col_lookup, sheet="SSBFREQ_NR_CELL")
+    df_diff_ssbfreq = df_diff_ssbfreq.rename(columns={'MO': 'CELLNAME'})
+    merged_df['MAIN_RESERVED_BY'] = merged_df['reservedBy_Before'].where(
+        merged_df['reservedBy_Before'].notna() & (merged_df['reservedBy_Before'] != ''), merged_df['reservedBy_After']
+    )
+    merged_df['MAIN_RESERVED_BY'] = merged_df['MAIN_RESERVED_BY'].fillna('NULL').replace('', 'NULL')
+
+    merged_df = merged_df.merge(df_diff_ssbfreq, how='left', left_on=['NODENAME', 'MAIN_RESERVED_BY'], right_on=['NODENAME', 'CELLNAME'])
+    merged_df = select_columns(merged_df, check.columns)
+    write_count_false(merged_df, check.sheet or key, writer)
+
+
+SHEET_WRITERS = {
+    'alarm': write_alarm_sheets,
+    'before_after': write_before_after_sheets,
+    'compare': write_compare_sheet,
+    'cell_status': write_cell_status_sheet,
+    'band_nr_sector': write_band_nr_sector_sheet,
+}
+
+
 def write_to_excel(df, df2, data_after, data_before, file_name):
     # Guard against None inputs from KPI.create_main_merge_df
     if df is None:
@@ -586,10 +814,15 @@ def write_to_excel(df, df2, data_after, data_before, file_name):
         # Debug for all keys
         print("DEBUG - Keys in data_before:", list(data_before.keys()))
         print("DEBUG - Keys in data_after:", list(data_after.keys()))
+
+        # NODENAME/MO of all sheets coded once, shared by every sheet comparison
+        compare_engine = CompareEngine(data_before, data_after)
         
         for key in data_after:
-            # Skip SSBFREQ_NR_CELL if it's empty (no data to process)
-            if key == 'SSBFREQ_NR_CELL':
+            # Keys without a check (other than Summary) get a plain compare sheet
+            check = CHECKS_BY_KEY.get(key) or Check(key, key)
+            # Skip checks that need data on both sides (e.g. SSBFREQ_NR_CELL)
+            if check.require_both:
                 if len(data_after[key]) == 0 or (len(data_before.get(key, pd.DataFrame())) == 0):
                     print(f"Skipping {key} - no data to process")
                     continue
@@ -618,232 +851,17 @@ def write_to_excel(df, df2, data_after, data_before, file_name):
             if key in data_after and isinstance(data_after[key], pd.DataFrame):
                 print(f"DEBUG - {key} data_after columns: {data_after[key].columns.tolist()}")
             
-            if key == 'Alarm':
-                if isinstance(data_before[key], pd.DataFrame):
-                    write_alarm_dataframe_with_format(data_before[key].reset_index(drop=True), 'Alarm_Before', writer)
-                if isinstance(data_after[key], pd.DataFrame):
-                    write_alarm_dataframe_with_format(data_after[key].reset_index(drop=True), 'Alarm_After', writer)
-                # 2. Ambil semua nilai unik dari kolom 'NODENAME'
-                unique_statuses = data_before['Cell Status']['NODENAME'].unique()
-                df_bf1 = pd.DataFrame(unique_statuses, columns=['NODENAME'])
-
-                # 4. Tambahkan kolom penanda (flag) baru yang bernilai 1
-                df_bf1["MOBATCH_BEFORE"] = "OK"
-
-
-                # --- Mulai Logika ---
-
-                # Tentukan kolom kunci untuk merge pertama
-                key_cols_1 = ['NODENAME', 'Severity', 'Problem', 'Object', 'Cause']
-
-                # 2. Merge kiri pertama: data_after -> data_before
-                # Kita hanya perlu kolom kunci dari data_before dan drop_duplicates
-                # indicator=True akan membuat kolom '_merge'
-                # ('both' = ada di data_before, 'left_only' = tidak ada di data_before)
-                merged_df = pd.merge(
-                    data_after[key],
-                    data_before[key],
-                    on=key_cols_1,
-                    how='left',
-                    indicator=True,
-                    suffixes=('_After', '_Before')
-                )
-
-                # 3. Merge kiri kedua: merged_df -> df_bf1
-                # Ini untuk menambahkan kolom FLAG_BEFORE berdasarkan NODENAME
-                final_df = pd.merge(
-                    merged_df,
-                    df_bf1,
-                    on='NODENAME',
-                    how='left'
-                )
-                final_df['MOBATCH_BEFORE'] = final_df['MOBATCH_BEFORE'].fillna('NOK')
-
-
-                # 4. Terapkan logika untuk kolom "REMARK"
-                # Tentukan kondisi
-                conditions = [
-                    # Kondisi 1: if exist in data_before[key]
-                    (final_df['_merge'] == 'both'),
-
-                    # Kondisi 2: if not exist in data_before[key] and MOBATCH_BEFORE == "OK"
-                    (final_df['_merge'] == 'left_only') & (final_df['MOBATCH_BEFORE'] == "OK")
-                ]
-
-                # Tentukan pilihan yang sesuai dengan kondisi
-                choices = ['EXISTING', 'NEW ALARM']
-
-                # Buat kolom REMARK menggunakan np.select
-                # default=np.nan berarti jika tidak ada kondisi yang terpenuhi, akan diisi NaN
-                final_df['REMARK'] = np.select(conditions, choices, default='DATA BEFORE NOT FOUND')
-
-                # 5. Bersihkan DataFrame
-                # Hapus kolom bantu yang tidak diperlukan di hasil akhir
-                ##final_result = final_df.drop(columns=['_merge', 'FLAG_BEFORE'])
-                
-                # Define the required column order
-                required_columns = [
-                    'NODENAME', 'Object', 'Problem', 'Cause',
-                    'Date_After', 'Time_After', 
-                    'Date_Before', 'Time_Before', 
-                    'REMARK','MOBATCH_BEFORE'
-                ]
-                
-                # Create a new DataFrame with only the required columns
-                # Fill missing columns with "NULL"
-                filtered_df = pd.DataFrame()
-                for col in required_columns:
-                    if col in final_df.columns:
-                        filtered_df[col] = final_df[col].fillna("NULL")
-                    else:
-                        filtered_df[col] = "NULL"
-                
-                # Print the filtered DataFrame
-                print("Final DataFrame with specified columns:")
-                ##print(filtered_df)
-                
-                
-                def write_sheet(df, sheet_name, writer):
-                    """Write DataFrame to Excel and auto-fit column widths (max 50), with yellow highlighting for NEW ALARM rows."""
-                    df = reorder_columns(df)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    ws = writer.sheets[sheet_name]
-                    
-                    # Auto-fit column widths
-                    for i, col in enumerate(df.columns):
-                        width = min(50, max(len(col), df[col].astype(str).str.len().max() or 0) + 2)
-                        ws.set_column(i, i, width)
-                    
-                    # Add conditional formatting for NEW ALARM rows
-                    if 'REMARK' in df.columns:
-                        remark_col_idx = df.columns.get_loc('REMARK')
-                        remark_col_letter = chr(65 + remark_col_idx)  # Convert to Excel column letter (A, B, C, etc.)
-                        
-                        # Create yellow background format
-                        yellow_format = writer.book.add_format({'bg_color': '#FFFF00'})
-                        
-                        # Apply conditional formatting to highlight rows where REMARK = "NEW ALARM"
-                        ws.conditional_format(f'A2:{chr(65 + len(df.columns) - 1)}{len(df) + 1}', {
-                            'type': 'formula',
-                            'criteria': f'=${remark_col_letter}2="NEW ALARM"',
-                            'format': yellow_format
-                        })
-
-                write_sheet(filtered_df, f"NEW_Alarm", writer)                                     
-
-            elif key == "Summary":
+            if key == "Summary":
                 df_diff = compare_dataframes(data_before[key], data_after[key]).drop(columns=['MO'])
                 df_diff = clean_dataframe(df_diff)
                 write_summary(df_diff, 'Summary', writer, data_before['Cell Status'],data_after['Cell Status'] )
-            elif key == "TermPointToGNodeB" or key == "NRCellRelation":
-                def write_sheet(df, sheet_name, writer):
-                    """Write DataFrame to Excel and auto-fit column widths (max 50)."""
-                    df = reorder_columns(df)
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    ws = writer.sheets[sheet_name]
-                    for i, col in enumerate(df.columns):
-                        width = min(50, max(len(col), df[col].astype(str).str.len().max() or 0) + 2)
-                        ws.set_column(i, i, width)
-
-                write_sheet(data_before[key], f"{key}_Before", writer)
-                write_sheet(data_after[key], f"{key}_After", writer)
-
-
-            else:
-
-                if isinstance(data_before[key], pd.DataFrame) and isinstance(data_after[key], pd.DataFrame):
-                    col_lookup = ['NODENAME', 'MO', 'arfcnValueEUtranDl'] if key == 'freqPrioListEUTRA' else ['NODENAME', 'MO']
-                    if key == 'BAND_NR_SECTOR':
-                        print(f"COBA OLAH [{key}]")
-                        # Check if reservedBy column exists, if not skip this processing
-                        if 'reservedBy' not in data_before[key].columns or 'reservedBy' not in data_after[key].columns:
-                            print(f"Skipping {key} - reservedBy column not found")
-                            continue
-                        
-                        pattern = r'(NRCellDU=.*?)(?:\s|$)'
-
-                        data_before[key]['reservedBy'] = data_before[key]['reservedBy'].str.extract(pattern)
-                        data_after[key]['reservedBy'] = data_after[key]['reservedBy'].str.extract(pattern)
-                        merged_df = compare_dataframes_with_check(data_before[key], data_after[key], col_lookup) 
-                        df_diff_ssbfreq = compare_dataframes_with_check(data_before["SSBFREQ_NR_CELL"], data_after["SSBFREQ_NR_CELL"], col_lookup)
-                        df_diff_ssbfreq = df_diff_ssbfreq.rename(columns={'MO': 'CELLNAME'})
-                        merged_df['MAIN_RESERVED_BY'] = merged_df['reservedBy_Before'].where(
-                            merged_df['reservedBy_Before'].notna() & (merged_df['reservedBy_Before'] != ''), merged_df['reservedBy_After']
-                        )
-                        merged_df['MAIN_RESERVED_BY'] = merged_df['MAIN_RESERVED_BY'].fillna('NULL').replace('', 'NULL')
-                                                
-                        
-                        merged_df = merged_df.merge(df_diff_ssbfreq, how='left', left_on=['NODENAME', 'MAIN_RESERVED_BY'], right_on=['NODENAME', 'CELLNAME'])
-                        column_order = ['NODENAME', 'CELLNAME', 'MO', 'ssbFrequency_Before', 'arfcnDL_Before', 'arfcnUL_Before', 'bSChannelBwDL_Before', 'bSChannelBwUL_Before','ssbFrequency_After', 'arfcnDL_After', 'arfcnUL_After', 'bSChannelBwDL_After', 'bSChannelBwUL_After', 'MAIN_RESERVED_BY', 'ssbFrequency_Compare', 'arfcnDL_Compare', 'arfcnUL_Compare', 'bSChannelBwDL_Compare', 'bSChannelBwUL_Compare', 'reservedBy_Before' , 'reservedBy_After', 'reservedBy_Compare']
+            elif isinstance(data_before[key], pd.DataFrame) and isinstance(data_after[key], pd.DataFrame):
+                SHEET_WRITERS[check.writer](check, data_before, data_after, writer, compare_engine)
 
-                        merged_df = merged_df.assign(**{col: pd.NA for col in column_order if col not in merged_df.columns})
-                        merged_df = merged_df[column_order]   
-                        
-                        ###print(data_after[key])
-                        write_count_false(merged_df, "Bandwidth 5G", writer)                                                
-                        
-                    elif key == 'bandwidth':
-                        merged_df = compare_dataframes_with_check(data_before[key], data_after[key], col_lookup)
-                        column_order = ['NODENAME', 'MO', 'dlChannelBandwidth_Before', 'ulChannelBandwidth_Before', 'earfcndl_Before', 'earfcnul_Before', 'dlChannelBandwidth_After', 'ulChannelBandwidth_After', 'earfcndl_After', 'earfcnul_After', 'dlChannelBandwidth_Compare', 'ulChannelBandwidth_Compare', 'earfcndl_Compare', 'earfcnul_Compare']
-                        merged_df = merged_df.assign(**{col: pd.NA for col in column_order if col not in merged_df.columns})
-                        merged_df = merged_df[column_order]   
-                        
-                                  
-                        write_count_false(merged_df, key, writer)                          
-                    
-                    elif key == 'Cell Status':
-                        data_before[key] = clean_cell_status(data_before[key])
-                        data_after[key] = clean_cell_status(data_after[key])
-                        #####
-                        ##count_df_by_nodename(df_before,df_after, col_name):
-                        ##df_check_cell = count_df_by_nodename(data_before[key], data_after[key] , "Cell_COUNT")
-                        ##write_count_false(df_check_cell, "Cell_COUNT", writer)
-                        
-                        
-                        table_SleepState = "SleepState"
-                        print(data_after[table_SleepState])
-                        df_diff_sleepstate = compare_dataframes_with_check(data_before[table_SleepState], data_after[table_SleepState], col_lookup)
-                        # Clean the "MO" column
-                        df_diff_sleepstate["MO"] = df_diff_sleepstate["MO"].str.replace(r",CellSleepFunction=1", "", flags=re.IGNORECASE, regex=True)
-                                                
-                        
-                        cell_status_diff = compare_dataframes_with_check(data_before[key], data_after[key], col_lookup)
-                        merged_df = pd.merge(cell_status_diff, df_diff_sleepstate, on=col_lookup, how='left')
-                        # Reorder the columns
-                        column_order = [
-                            "NODENAME",
-                            "MO",
-                            "administrativeState_Before",
-                            "operationalState_Before",
-                            "administrativeState_After",
-                            "operationalState_After",
-                            "administrativeState_Compare",
-                            "operationalState_Compare",
-                            "sleepState_Before",
-                            "sleepState_After",
-                            "sleepState_Compare"
-                        ]
-
-                        merged_df = merged_df.assign(**{col: pd.NA for col in column_order if col not in merged_df.columns})
-                        merged_df = merged_df[column_order]   
-                        
-                                  
-                        write_count_false(merged_df, key, writer)                        
-                    
-                    else:
-                        # Pastikan data_before[key] adalah DataFrame meskipun kosong
-                        if not isinstance(data_before[key], pd.DataFrame) or len(data_before[key]) == 0:
-                            data_before[key] = pd.DataFrame(columns=data_after[key].columns)
-                            
-                        # Pastikan data_after[key] adalah DataFrame meskipun kosong
-                        if not isinstance(data_after[key], pd.DataFrame) or len(data_after[key]) == 0:
-                            data_after[key] = pd.DataFrame(columns=data_before[key].columns)
-                            
-                        df_diff = compare_dataframes_with_check(data_before[key], data_after[key], col_lookup)
-                        write_count_false(df_diff, key, writer)
 
+        for sheet, counts in compare_engine.mismatches.items():
+            print(f"[{sheet}] Before/After mismatches: {sum(counts.values())}")
 
-        
         # Process KPI LTE
         worksheet = workbook.add_worksheet("KPI_LTE")
         writer.sheets["KPI_LTE"] = worksheet
@@ -967,7 +985,7 @@ def write_kpi_data(worksheet, header_data, df, workbook):
         worksheet.write_row(row_idx, 0, row)
 
 
-def generate_report(before_path, after_path, output_path, include_kpi=True, before_time="2025-04-10 09:00", after_time="2025-04-10 09:00", progress_callback=None):
+def generate_report(before_path, after_path, output_path, include_kpi=True, before_time="2025-04-10 09:00", after_time="2025-04-10 09:00", progress_callback=None, workers=1):
     """
     Generate a comprehensive Excel report comparing Before and After data.
     
@@ -979,6 +997,8 @@ def generate_report(before_path, after_path, output_path, include_kpi=True, befo
         before_time (str): Start time for KPI processing
         after_time (str): Start time for KPI processing
         progress_callback (callable): Function to call with progress updates (progress, message)
+        workers (int): Worker processes for reading the node logs; above 1 the
+            Before and After folders are read concurrently by a process pool
     
     Returns:
         str: Path to the generated report
@@ -1020,13 +1040,18 @@ def generate_report(before_path, after_path, output_path, include_kpi=True, befo
     print(KPI_LTE_AFTER)
 
     # Process log data
-    if progress_callback:
-        progress_callback(50, "Processing Before log files")
-    data_before = read_files_from_folder(before_path, progress_callback)
+    if workers and workers > 1:
+        if progress_callback:
+            progress_callback(50, f"Processing Before and After log files ({workers} workers)")
+        data_before, data_after = read_folders_parallel([before_path, after_path], progress_callback, workers)
+    else:
+        if progress_callback:
+            progress_callback(50, "Processing Before log files")
+        data_before = read_files_from_folder(before_path, progress_callback)
 
-    if progress_callback:
-        progress_callback(75, "Processing After log files")
-    data_after = read_files_from_folder(after_path, progress_callback)
+        if progress_callback:
+            progress_callback(75, "Processing After log files")
+        data_after = read_files_from_folder(after_path, progress_callback)
 
     if progress_callback:
         progress_callback(90, "Writing Excel report")
@@ -1039,7 +1064,7 @@ def generate_report(before_path, after_path, output_path, include_kpi=True, befo
     return output_path
 
 
-def run_before_after_analysis(before_path, after_path, include_kpi=True, before_time="2025-04-10 09:00", after_time="2025-04-10 09:00", progress_callback=None):
+def run_before_after_analysis(before_path, after_path, include_kpi=True, before_time="2025-04-10 09:00", after_time="2025-04-10 09:00", progress_callback=None, workers=1):
     """
     Main function to run the Before/After analysis.
     
@@ -1050,6 +1075,7 @@ def run_before_after_analysis(before_path, after_path, include_kpi=True, before_
         before_time (str): Start time for KPI processing
         after_time (str): Start time for KPI processing
         progress_callback (callable): Function to call with progress updates (progress, message)
+        workers (int): Worker processes for reading the node logs (1 = serial)
     """
     # Validate input paths
     if not os.path.exists(before_path):
@@ -1061,7 +1087,7 @@ def run_before_after_analysis(before_path, after_path, include_kpi=True, before_
     output_path = os.path.join(os.path.dirname(before_path), f"01_Report_CR_activity.xlsx")
     
     # Run the analysis and generate report
-    report_path = generate_report(before_path, after_path, output_path, include_kpi, before_time, after_time, progress_callback)
+    report_path = generate_report(before_path, after_path, output_path, include_kpi, before_time, after_time, progress_callback, workers)
     
     print(f"Analysis complete. Report saved to: {report_path}")
     return report_path
\ No newline at end of file
@@ -12,92 +12,131 @@ import re
 import numpy as np
 
 
-def process_kpi_logs(folder, pattern, start_defined):
+KPI_KEY_COLUMNS = ["NODENAME", "Object", "Counter"]
+# ROP header format of the GREP_KPI_* lines, e.g. "2025-04-10 09:15"
+KPI_ROP_FORMAT = "%Y-%m-%d %H:%M"
+KPI_MAX_ROP = 20
+
+
+def read_kpi_values(folder, pattern):
     """
-    Process KPI log files in the specified folder with the given pattern.
+    Stream the KPI lines of every log in folder into one long table.
+
+    Each log is read line by line; only lines starting with pattern are split.
+    The values of a KPI row are mapped onto the sorted ROP headers of its log
+    (missing values padded as NaN), and every distinct header string is parsed
+    to a timestamp only once.
 
     Args:
         folder (str): Path to the folder containing log files
         pattern (str): Pattern to look for in log files (e.g., "GREP_KPI_5G", "GREP_KPI_LTE")
-        start_defined (str or datetime): Starting time for filtering data ("NO_START" or datetime string)
 
     Returns:
-        pandas.DataFrame: DataFrame containing processed KPI data
+        pandas.DataFrame: One row per (KPI row, ROP) with NODENAME, Object,
+        Counter, ROP (datetime64, NaT for headers that are not a timestamp or
+        KPI rows of a log without headers) and value (float64, NaN when not
+        numeric), indexed by the KPI row number
     """
-    all_data = []
-    datetime_headers = set()
-    
-    # Read all log files in the directory
+    # Header string -> index into rop_times (-1 = not a timestamp), shared by all logs
+    rop_cache = {}
+    rop_times = []
+    nodenames, objects, counters = [], [], []
+    row_ids, rop_codes, values = [], [], []
+
     log_files = sorted(glob.glob(os.path.join(folder, "*.log")), key=os.path.getsize)
-    
-    # Process each log file with progress tracking
-    for idx, log_file in enumerate(log_files):
+    for log_file in log_files:
         nodename = os.path.splitext(os.path.basename(log_file))[0]
-        temp_data = []
-        temp_datetime_headers = set()
-        
+        headers = set()
+        rows = []
+
         with open(log_file, "r", encoding='utf-8', errors='ignore') as file:
-            lines = file.readlines()
-            
-            for line in lines:
+            for line in file:
                 if line.startswith(pattern):
                     parts = line.strip().rstrip(";").split("; ")
-                    
                     if "Object" in parts and "Counter" in parts:
-                        temp_datetime_headers.update(parts[3:])
+                        headers.update(parts[3:])
                     else:
-                        temp_data.append(parts[1:])
-        
-        if temp_data:
-            datetime_headers.update(temp_datetime_headers)
-            temp_datetime_headers = sorted(temp_datetime_headers)
-
-            columns = ["NODENAME", "Object", "Counter"] + temp_datetime_headers
-            formatted_data = []
-            
-            for row in temp_data:
-                row_dict = {"NODENAME": nodename, "Object": row[0], "Counter": row[1]}
-                for dt in temp_datetime_headers:
-                    row_dict[dt] = "N/A"
-                for i, dt in enumerate(row[2:]):
-                    if i < len(temp_datetime_headers):
-                        row_dict[temp_datetime_headers[i]] = dt
-                formatted_data.append(row_dict)
-
-            # Identify datetime columns based on format "YYYY-MM-DD HH:MM"
-            datetime_mapping = {}
-            temp_df = pd.DataFrame(formatted_data, columns=columns)
-            for col in temp_df.columns:
-                try:
-                    datetime_format = "%Y-%m-%d %H:%M"
-                    dt = pd.to_datetime(col, format=datetime_format, errors='raise')
-                    datetime_mapping[col] = dt.strftime(datetime_format)  # Store as string
-                except ValueError:
-                    pass  # Ignore non-datetime columns        
-            
-            temp_df.columns = [datetime_mapping[col] if col in datetime_mapping else col for col in temp_df.columns]
-            all_data.append(temp_df)
-        
-        
-    max_rop = 20
-    if start_defined == "NO_START":
-        datetime_candidates = sorted(datetime_headers)
-    else:
-        # Convert string column names to datetime for filtering using collected headers
-        datetime_candidates = sorted([
-            col for col in datetime_headers
-            if pd.to_datetime(col, format='%Y-%m-%d %H:%M', errors='coerce') >= pd.Timestamp(start_defined)
-        ])
-    datetime_headers = datetime_candidates[:max_rop]
-        
-    final_columns = ["NODENAME", "Object", "Counter"] + datetime_headers
-    # If no data was collected, return an empty DataFrame with the expected columns
-    if not all_data:
-        df = pd.DataFrame(columns=final_columns)
-        return df
-    df = pd.concat(all_data, ignore_index=True).reindex(columns=final_columns)
-    df.fillna("N/A", inplace=True)
-    return df
+                        rows.append(parts)
+
+        if not rows:
+            continue
+        for header in headers:
+            if header not in rop_cache:
+                rop_time = pd.to_datetime(header, format=KPI_ROP_FORMAT, errors='coerce')
+                rop_cache[header] = -1 if pd.isna(rop_time) else len(rop_times)
+                if rop_cache[header] >= 0:
+                    rop_times.append(rop_time)
+        file_rops = [rop_cache[header] for header in sorted(headers)] or [-1]
+        width = len(file_rops)
+
+        for parts in rows:
+            row = len(nodenames)
+            nodenames.append(nodename)
+            objects.append(parts[1])
+            counters.append(parts[2])
+            row_values = parts[3:3 + width]
+            if len(row_values) < width:
+                row_values += [""] * (width - len(row_values))
+            row_ids.extend([row] * width)
+            rop_codes.extend(file_rops)
+            values.extend(row_values)
+
+    row_ids = np.asarray(row_ids, dtype=np.int64)
+    table = {}
+    for column, keys in zip(KPI_KEY_COLUMNS, (nodenames, objects, counters)):
+        keys = pd.Categorical(keys)
+        table[column] = pd.Categorical.from_codes(keys.codes[row_ids], keys.categories)
+    # Code -1 picks the trailing NaT
+    rop_index = pd.DatetimeIndex(rop_times + [pd.NaT], dtype="datetime64[ns]")
+    table["ROP"] = rop_index[np.asarray(rop_codes, dtype=np.int64)]
+    table["value"] = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype(np.float64).to_numpy()
+    return pd.DataFrame(table, index=pd.Index(row_ids, name="row"))
+
+
+def pivot_kpi_values(values, start_defined, max_rop=KPI_MAX_ROP):
+    """
+    Pivot the long KPI table of read_kpi_values into one row per KPI row.
+
+    Args:
+        values (pandas.DataFrame): Long table from read_kpi_values
+        start_defined (str or datetime): Starting time for filtering data ("NO_START" or datetime string)
+        max_rop (int): Number of ROP columns kept, counted from the first one
+
+    Returns:
+        pandas.DataFrame: NODENAME, Object, Counter, then one "YYYY-MM-DD HH:MM"
+        column per ROP; missing values are "N/A"
+    """
+    rop_times = pd.DatetimeIndex(values["ROP"].dropna().unique()).sort_values()
+    if start_defined != "NO_START":
+        rop_times = rop_times[rop_times >= pd.Timestamp(start_defined)]
+    rop_times = rop_times[:max_rop]
+    labels = list(rop_times.strftime(KPI_ROP_FORMAT))
+
+    rows, first, positions = np.unique(values.index.to_numpy(), return_index=True, return_inverse=True)
+    table = np.full((len(rows), len(labels)), np.nan)
+    columns = rop_times.get_indexer(values["ROP"])
+    selected = columns >= 0
+    table[positions[selected], columns[selected]] = values["value"].to_numpy()[selected]
+
+    wide = table.astype(object)
+    wide[np.isnan(table)] = "N/A"
+    keys = {column: np.asarray(values[column].iloc[first], dtype=object) for column in KPI_KEY_COLUMNS}
+    return pd.concat([pd.DataFrame(keys), pd.DataFrame(wide, columns=labels)], axis=1)
+
+
+def process_kpi_logs(folder, pattern, start_defined):
+    """
+    Process KPI log files in the specified folder with the given pattern.
+
+    Args:
+        folder (str): Path to the folder containing log files
+        pattern (str): Pattern to look for in log files (e.g., "GREP_KPI_5G", "GREP_KPI_LTE")
+        start_defined (str or datetime): Starting time for filtering data ("NO_START" or datetime string)
+
+    Returns:
+        pandas.DataFrame: DataFrame containing processed KPI data
+    """
+    return pivot_kpi_values(read_kpi_values(folder, pattern), start_defined)
 
 
 def create_main_merge_df(before_df, after_df):
@@ -123,39 +162,25 @@ def create_main_merge_df(before_df, after_df):
         columns={col: f"{col}_AFTER" for col in after_df.columns if col not in columns_to_keep}
     ) 
     
-    merged_df = before_df.merge(after_df, on=["NODENAME", "Object", "Counter"], suffixes=("_BEFORE", "_AFTER"), how="outer")
-    
-    # Get unique Counter values
+    merged_df = before_df.merge(after_df, on=KPI_KEY_COLUMNS, suffixes=("_BEFORE", "_AFTER"), how="outer")
+
+    # Unique Counter values, in order of appearance
     counter_values = merged_df["Counter"].unique()
     # If there are no counters, return None as requested
     if len(counter_values) == 0:
         return None
-    main_merge_df = None
-    
-    for counter in counter_values:
-        temp_df = merged_df[merged_df["Counter"] == counter].drop(columns=["Counter"]).copy()        
-        
-        if main_merge_df is None:  
-            main_merge_df = temp_df
-            
-        else:
-            formatted_suffix = f"_{counter}"
-            main_merge_df = main_merge_df.merge(temp_df, on=["NODENAME", "Object"], how="outer", suffixes=("", formatted_suffix))
 
-    # Safe-guard: if no merged data by counters, return None
-    if main_merge_df is None:
-        return None
-    first_counter_value = counter_values[0]  # Get the first unique value
-    formatted_suffix = f"_{first_counter_value}"  # Ensures the format _latest
-    # Rename columns dynamically using regex
-    main_merge_df.rename(columns={
-        col: re.sub(r"_BEFORE$", f"_BEFORE{formatted_suffix}", col)
-             if re.search(r"_BEFORE$", col) else
-             re.sub(r"_AFTER$", f"_AFTER{formatted_suffix}", col)
-             if re.search(r"_AFTER$", col) else col
-        for col in main_merge_df.columns
-    }, inplace=True)    
-    return main_merge_df
+    # One row per (NODENAME, Object), one column per (Counter, ROP, BEFORE/AFTER);
+    # a repeated KPI row keeps its first values
+    value_columns = [col for col in merged_df.columns if col not in columns_to_keep]
+    merged_df = merged_df.drop_duplicates(subset=KPI_KEY_COLUMNS)
+    main_merge_df = merged_df.set_index(KPI_KEY_COLUMNS)[value_columns].unstack("Counter")
+    main_merge_df = main_merge_df.reindex(
+        columns=pd.MultiIndex.from_product([counter_values, value_columns]).swaplevel()
+    )
+    # e.g. "2025-04-10 18:00_BEFORE_Acc_InitialErabSetupSuccRate"
+    main_merge_df.columns = [f"{col}_{counter}" for col, counter in main_merge_df.columns]
+    return main_merge_df.reset_index()
 
 
 def split_column_name(col_name):
@@ -0,0 +1,150 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# On-disk cache of parsed node logs for the CR report generator
+#
+# One SQLite file per CR folder (next to the report in the output dir) keeps
+# the parsed result of every .log, keyed by file name + size + mtime. A re-run
+# after retrying a few nodes only parses the logs that changed.
+
+import os
+import pickle
+import sqlite3
+from .utils import debug_print
+
+# Bump when the parsed result layout (report_generator.parse_log_file) changes
+CACHE_VERSION = "1"
+
+
+def cache_path_for(output_dir, selected_file):
+    return os.path.join(output_dir, f"{selected_file}_report_cache.sqlite")
+
+
+def file_signature(filepath):
+    st = os.stat(filepath)
+    return st.st_size, st.st_mtime_ns
+
+
+class LogParseCache:
+    """
+    Parsed log results of one CR folder stored in a sidecar SQLite file.
+
+    Rows hold the pickled (filename, log_data, sections, bytes_read) tuple
+    returned by report_generator.parse_log_file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.conn = None
+        try:
+            self.conn = sqlite3.connect(path)
+            self._prepare()
+        except sqlite3.Error as e:
+            # A broken cache must never stop the report, start over without it
+            debug_print(f"LogParseCache: resetting {path}: {e}")
+            self._reset()
+
+    def _prepare(self):
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS parsed_logs ("
+            "filename TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, result BLOB)"
+        )
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is None or row[0] != CACHE_VERSION:
+            self.conn.execute("DELETE FROM parsed_logs")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('version', ?)", (CACHE_VERSION,))
+        self.conn.commit()
+
+    def _reset(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+        try:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.conn = sqlite3.connect(self.path)
+            self._prepare()
+        except (OSError, sqlite3.Error) as e:
+            debug_print(f"LogParseCache: cache disabled: {e}")
+            self.conn = None
+
+    def split(self, args_list):
+        """
+        Split process_single_log args into cached results and args still to parse.
+
+        Returns:
+            tuple: (cached_results, to_parse, signatures) where signatures maps
+            filename to its (size, mtime_ns) for store().
+        """
+        signatures = {}
+        for filename, folder_path, _ in args_list:
+            try:
+                signatures[filename] = file_signature(os.path.join(folder_path, filename))
+            except OSError:
+                signatures[filename] = None
+
+        stored = {}
+        if self.conn is not None:
+            try:
+                for filename, size, mtime_ns, blob in self.conn.execute(
+                    "SELECT filename, size, mtime_ns, result FROM parsed_logs"
+                ):
+                    stored[filename] = ((size, mtime_ns), blob)
+            except sqlite3.Error as e:
+                debug_print(f"LogParseCache: read failed: {e}")
+                stored = {}
+
+        cached_results, to_parse = [], []
+        for args in args_list:
+            entry = stored.get(args[0])
+            result = None
+            if entry is not None and signatures[args[0]] is not None and entry[0] == signatures[args[0]]:
+                try:
+                    result = pickle.loads(entry[1])
+                except Exception:
+                    result = None
+            if result is None:
+                to_parse.append(args)
+            else:
+                cached_results.append(result)
+        self.hits = len(cached_results)
+        self.misses = len(to_parse)
+
+        # Forget logs that are no longer in the folder
+        gone = [name for name in stored if name not in signatures]
+        if gone and self.conn is not None:
+            try:
+                self.conn.executemany("DELETE FROM parsed_logs WHERE filename = ?", [(name,) for name in gone])
+                self.conn.commit()
+            except sqlite3.Error as e:
+                debug_print(f"LogParseCache: cleanup failed: {e}")
+        return cached_results, to_parse, signatures
+
+    def store(self, results, signatures):
+        """Save freshly parsed results (list of parse_log_file tuples)."""
+        if self.conn is None or not results:
+            return
+        rows = [
+            (result[0], *signatures[result[0]], pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            for result in results
+            if signatures.get(result[0]) is not None
+        ]
+        try:
+            self.conn.executemany("INSERT OR REPLACE INTO parsed_logs VALUES (?, ?, ?, ?)", rows)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            debug_print(f"LogParseCache: write failed: {e}")
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
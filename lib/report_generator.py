@@ -36,33 +36,29 @@ import os
 import re
 import time
 import mmap
+import threading
+import numbers
+import numpy as np
+import xlsxwriter
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from .utils import debug_print
+from .report_cache import LogParseCache
+from .line_classifier import classify_line, SectionCollector, LINE_PROMPT, LINE_TAG, LINE_ALT_TAG, LINE_EXECUTE, LINE_BLANK
+
+# BB commands that produce a row in the report
+pattern_bb_action = re.compile(r"^(del|rdel|crn|set)", re.IGNORECASE)
 
 # Move this function to top-level so it can be pickled by multiprocessing
 def process_single_log(args):
     filename, folder_path, selected_file = args
     start_time = time.time()
     filepath = os.path.join(folder_path, filename)
-    node_log = re.search(r"^(.*?).log$", filename, re.IGNORECASE).group(1) if re.search(r"^(.*?).log$", filename, re.IGNORECASE) else filename
+    node_log = m.group(1) if (m := re.search(r"^(.*?).log$", filename, re.IGNORECASE)) else filename
     local_log_data = []
-
-    # Compile regex patterns once
-    pattern_cmd = re.compile(r"^[A-Z0-9\_\-]{4,180}\>(.*?)$", re.IGNORECASE)
-    pattern_run_script = re.compile(r".*?run\s+.*?\$nodename\_(.*?).mos$", re.IGNORECASE)
-    pattern_truni = re.compile(r"^(trun|truni)\s+(.*?)$", re.IGNORECASE)
-    pattern_tag = re.compile(r'^!!!!.*?TAG\s+:"(.*?)".*?$', re.IGNORECASE)
-    pattern_alt_tag = re.compile(r"^>>>\s+(\[.*?\]).*?$", re.IGNORECASE)
-    pattern_set = re.compile(r"^(SET\s+.*?)$", re.IGNORECASE)
-    pattern_create = re.compile(r"^(CREATE.*?)$", re.IGNORECASE)
-    pattern_delete = re.compile(r"^(DELETE.*?)$", re.IGNORECASE)
-    tag_errs = [
-        re.compile(r"^(ERROR:.*?:.*?)$", re.IGNORECASE),
-        re.compile(r"(!!!!\s+(ERROR|Processing):.*?)$", re.IGNORECASE),
-        re.compile(r"(!!!!\s+Processing.*?)$", re.IGNORECASE),
-        re.compile(r"^(>>>.*?:.*?)$", re.IGNORECASE),
-        re.compile(r"^(Total.*?MOs\s+attempted.*?)$", re.IGNORECASE)
-    ]
+    # The ####LOG_x sections are collected in the same pass, so the file is read once
+    sections = SectionCollector()
+    bytes_read = 0
 
     try:
         with open(filepath, 'r', encoding='utf-8', errors='ignore') as file:
@@ -71,40 +67,31 @@ def process_single_log(args):
             type_script_rnc = "NULL"
             line_execute = "NULL"
             TAG_RESULT = "NULL"
-            truni_script = "NULL"
             TAG_RESULT_FULL = "NULL"
-            print_tag = "NULL"
+            rnc_mode = False
             number_tag = 0
             cmd_get = "NULL"
             att_list = []
 
             for line in iter(mm.readline, b''):
+                bytes_read += len(line)
                 line = line.decode(errors='ignore')
-                cmd_match = pattern_cmd.search(line)
-                cmd_get_1 = cmd_match.group(1).strip() if cmd_match else line_execute
+                sections.feed(line)
+                event = classify_line(line, rnc_mode)
+                if event.script is not None:
+                    type_script = event.script
+                if event.trun:
+                    rnc_mode = True
                 # --- RNC CR SCRIPT (truni/trun) ---
-                type_script = re.search(r".*?run\s+.*?\$nodename\_(.*?).mos$", line, re.IGNORECASE).group(1) if re.search(r".*?run\s+.*?\$nodename\_(.*?).mos$", line, re.IGNORECASE) else type_script
-                truni_script = re.search(r".*?(trun|truni)\s+(.*?)$", line, re.IGNORECASE).group(1) if re.search(r".*?(trun|truni)\s+(.*?)$", line, re.IGNORECASE) else truni_script
-                if truni_script != "NULL":
-                    type_script_rnc = (m.group(2) if (m := re.search(r".*?trun(i)?\s+(.*?).mo(s)?$", line, re.IGNORECASE)) else type_script_rnc)
-                    line_execute = re.search(r"^(CREATE.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(CREATE.*?)$", line, re.IGNORECASE) else line_execute
-                    line_execute = re.search(r"^(DELETE.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(DELETE.*?)$", line, re.IGNORECASE) else line_execute
-                    line_execute = re.search(r"^(SET\s+.*?)$", line, re.IGNORECASE).group(1) if re.search(r"^(SET\s+.*?)$", line, re.IGNORECASE) else line_execute
-                    if re.search(r"^!!!!.*?TAG\s+:\"(.*?)\".*?$", line, re.IGNORECASE):
-                        TAG_RESULT = re.search(r"^!!!!.*?TAG\s+:\"(.*?)\".*?$", line, re.IGNORECASE).group(1)
+                if rnc_mode:
+                    if event.rnc_script is not None:
+                        type_script_rnc = event.rnc_script
+                    if event.kind == LINE_EXECUTE:
+                        line_execute = event.value
+                    elif event.kind == LINE_TAG or event.kind == LINE_ALT_TAG:
+                        TAG_RESULT = event.value
                         TAG_RESULT_FULL = line.rstrip()
-                    else:
-
-                        
-                        TAG_RESULT = TAG_RESULT
-                        TAG_RESULT_FULL = TAG_RESULT_FULL
-                    if re.search(r"^>>>\s+(\[.*?\]).*?$", line, re.IGNORECASE):
-                        TAG_RESULT = re.search(r"^>>>\s+(\[.*?\]).*?$", line, re.IGNORECASE).group(1)
-                        TAG_RESULT_FULL = line.rstrip()
-                    else:
-                        TAG_RESULT = TAG_RESULT
-                        TAG_RESULT_FULL = TAG_RESULT_FULL
-                    if (len(line.rstrip()) == 0 and line_execute != "NULL"):
+                    elif event.kind == LINE_BLANK and line_execute != "NULL":
                         if(len(TAG_RESULT_FULL.rstrip()) == 0):
                             TAG_RESULT = "Executed"
                         TAG_REPORT, TAG_COLOR = CATEGORY_CHECKING1(TAG_RESULT)
@@ -115,36 +102,27 @@ def process_single_log(args):
                         TAG_RESULT = "NULL"
                         TAG_RESULT_FULL = ""
                 # --- END RNC CR SCRIPT (truni/trun) ---
-                # The rest of the original logic (for BB CR SCRIPT and others) remains unchanged from before.
-                if truni_script == "NULL":
-                    if pattern_cmd.match(line):
+                # BB CR SCRIPT and others
+                else:
+                    if event.kind == LINE_PROMPT:
                         if number_tag == 1:
-                            if re.search(r"^(del|rdel|crn|set)", cmd_get.strip(), re.IGNORECASE):
+                            if pattern_bb_action.search(cmd_get):
                                 TAG_REPORT, TAG_COLOR = CATEGORY_CHECKING1(TAG_RESULT)
-                                local_log_data.append((selected_file, node_log, type_script, line_execute.strip(), TAG_REPORT.strip(), TAG_RESULT.strip(), att_list))                                
-                                
-                                ###local_log_data.append((selected_file ,node_log,type_script, line_execute.strip(),TAG_REPORT.strip() ,TAG_RESULT.strip() , att_list    ))  # Store filename and line
+                                local_log_data.append((selected_file, node_log, type_script, line_execute.strip(), TAG_REPORT.strip(), TAG_RESULT.strip(), att_list))
                                 TAG_RESULT = "NULL"
-                                print_tag = "NULL"
-                                number_tag = 0
-                            else:
-                                number_tag = 0
+                            number_tag = 0
                         number_tag += 1
-                        cmd_get = cmd_get_1
+                        cmd_get = event.value
 
-                    for pattern in tag_errs:
-                        match = pattern.search(line)
-                        if match:
-                            TAG_RESULT = match.group(1)
+                    if event.tag_err is not None:
+                        TAG_RESULT = event.tag_err
 
-                    if pattern_cmd.match(line):
+                    if event.kind == LINE_PROMPT:
                         att_list = ["", line.strip()]
                     else:
                         att_list.append(line.strip())
 
-                if "Checking ip contact...Not OK" in line:
-                    local_log_data.append((selected_file, node_log, "", "", "UNREMOTE", line.strip(), ""))
-                if re.search(r"(?i)tbac\s*control\s*-\s*unauthori[sz]ed\s*network\s*element", line):
+                for _ in range(event.unremote):
                     local_log_data.append((selected_file, node_log, "", "", "UNREMOTE", line.strip(), ""))
 
 
@@ -152,46 +130,12 @@ def process_single_log(args):
     except Exception as e:
         debug_print(f"Error processing {filename}: {e}")
     end_time = time.time()
-    debug_print(f"Processed {filename} in {end_time - start_time:.2f}s")
+    debug_print(f"Processed {filename} in {end_time - start_time:.2f}s ({bytes_read} bytes read)")
 
-    # --- New Section: Parse LOG_Alarm_bf, LOG_status_bf, LOG_Alarm_af, LOG_status_af ---
+    # --- Parse LOG_Alarm_bf, LOG_status_bf, LOG_Alarm_af, LOG_status_af (collected in the pass above) ---
     from io import StringIO
 
-    log_data_sections = {
-        'LOG_Alarm_bf': [],
-        'LOG_status_bf': [],
-        'LOG_Alarm_af': [],
-        'LOG_status_af': [],
-    }
-
-    mode = None
-    collecting = False
-
-    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        stripped = line.strip()
-        if '####LOG_Alarm_bf' in stripped:
-            mode, collecting = 'LOG_Alarm_bf', False
-            continue
-        elif '####LOG_status_bf' in stripped:
-            mode, collecting = 'LOG_status_bf', False
-            continue
-        elif '####LOG_Alarm_af' in stripped:
-            mode, collecting = 'LOG_Alarm_af', False
-            continue
-        elif '####LOG_status_af' in stripped:
-            mode, collecting = 'LOG_status_af', False
-            continue
-
-        if stripped == "" and collecting:
-            mode, collecting = None, False
-            continue
-
-        if ';' in stripped and mode:
-            collecting = True
-            log_data_sections[mode].append(stripped)
+    log_data_sections = sections.sections
 
     nodename = os.path.splitext(os.path.basename(filepath))[0]
 
@@ -234,9 +178,157 @@ def process_single_log(args):
         "df_LOG_Alarm_af": df_LOG_Alarm_af,
         "df_LOG_status_bf": df_LOG_status_bf,
         "df_LOG_status_af": df_LOG_status_af,
+        "bytes_read": bytes_read,
     }
 
 
+# --- Shared parse pool (reused by every WorkerThread / folder) ---
+# Worker processes import pandas and this module once, instead of once per folder.
+PARSE_BATCH_SIZE = 25
+SECTION_KEYS = ("df_LOG_Alarm_bf", "df_LOG_Alarm_af", "df_LOG_status_bf", "df_LOG_status_af")
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """Return the app wide process pool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor()
+        return _parse_pool
+
+
+def shutdown_parse_pool(wait=False):
+    """Shut down the shared pool (on app exit or after a worker crashed)."""
+    global _parse_pool
+    with _parse_pool_lock:
+        pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def chunk_log_files(args_list, batch_size=PARSE_BATCH_SIZE):
+    """
+    Split the per file args into batches for the pool. Small folders get
+    smaller batches so every worker still has something to do.
+    """
+    workers = os.cpu_count() or 1
+    size = max(1, min(batch_size, -(-len(args_list) // (workers * 4))))
+    return [args_list[i:i + size] for i in range(0, len(args_list), size)]
+
+
+def parse_log_file(args):
+    """
+    Parse one log and return a compact, cheap to pickle result:
+    (filename, log_data, sections, bytes_read) where sections maps each
+    SECTION_KEYS name to a {column: [values]} dict (None when empty).
+    """
+    result = process_single_log(args)
+    sections = {}
+    for key in SECTION_KEYS:
+        df = result[key]
+        sections[key] = None if df.empty else df.to_dict("list")
+    return args[0], result["log_data"], sections, result["bytes_read"]
+
+
+def process_log_batch(batch):
+    """Pool task: parse a batch of logs (list of process_single_log args)."""
+    return [parse_log_file(args) for args in batch]
+
+
+def merge_section_columns(chunks):
+    """
+    Build one DataFrame from the {column: [values]} chunks of several logs.
+    Columns keep their first seen order; missing values are NaN (as pd.concat).
+    """
+    columns = {}
+    total = 0
+    for chunk in chunks:
+        rows = len(next(iter(chunk.values()), []))
+        for name, values in chunk.items():
+            if name not in columns:
+                columns[name] = [np.nan] * total
+            columns[name].extend(values)
+        total += rows
+        for values in columns.values():
+            if len(values) < total:
+                values.extend([np.nan] * (total - len(values)))
+    return pd.DataFrame(columns) if columns else pd.DataFrame()
+
+
+def parse_folder_logs(folder_path, selected_file, progress_callback=None, cache_path=None):
+    """
+    Parse every .log of a CR folder with the shared pool.
+
+    Args:
+        folder_path (str): Folder holding the node logs.
+        selected_file (str): CR folder name (first column of log_data).
+        progress_callback (callable): Called as (done, total, filename, (hits, misses)) after each batch.
+        cache_path (str): Optional sidecar cache file; unchanged logs are taken from it.
+
+    Returns:
+        tuple: (log_data, sections) with sections mapping SECTION_KEYS to DataFrames.
+    """
+    log_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.log')]
+    total_files = len(log_files)
+    args_list = [(f, folder_path, selected_file) for f in log_files]
+
+    cache = LogParseCache(cache_path) if cache_path else None
+    results = []
+    signatures = {}
+    if cache is not None:
+        results, args_list, signatures = cache.split(args_list)
+    cache_info = (cache.hits, cache.misses) if cache is not None else (0, total_files)
+
+    log_data = []
+    section_chunks = {key: [] for key in SECTION_KEYS}
+    bytes_read = 0
+
+    def collect(batch_results):
+        nonlocal bytes_read
+        for filename, file_log_data, sections, file_bytes in batch_results:
+            log_data.extend(file_log_data)
+            bytes_read += file_bytes
+            for key, columns in sections.items():
+                if columns:
+                    section_chunks[key].append(columns)
+
+    collect(results)
+    bytes_read = 0  # Only count what is actually read from disk below
+    done = len(results)
+    if done and progress_callback:
+        progress_callback(done, total_files, results[-1][0], cache_info)
+
+    batches = chunk_log_files(args_list)
+    parsed = []
+    try:
+        executor = get_parse_pool()
+        futures = [executor.submit(process_log_batch, batch) for batch in batches]
+        for future in as_completed(futures):
+            batch_results = future.result()
+            collect(batch_results)
+            parsed.extend(batch_results)
+            done += len(batch_results)
+            if progress_callback and batch_results:
+                progress_callback(done, total_files, batch_results[-1][0], cache_info)
+    except BrokenProcessPool:
+        # A crashed worker breaks the pool for good; start a fresh one next time
+        shutdown_parse_pool()
+        raise
+    finally:
+        if cache is not None:
+            cache.store(parsed, signatures)
+            cache.close()
+    debug_print(
+        f"parse_folder_logs: read {bytes_read} bytes from {len(args_list)} of {total_files} logs "
+        f"in {len(batches)} batches (cache {cache_info[0]} hit / {cache_info[1]} miss)"
+    )
+
+    return log_data, {key: merge_section_columns(chunks) for key, chunks in section_chunks.items()}
+
+
 
 
 def CATEGORY_CHECKING1(TAG_RESULT):
@@ -270,14 +362,20 @@ def CATEGORY_CHECKING1(TAG_RESULT):
     
     
     
+# "Total: x MOs attempted, N MOs <action>" summary printed by the BB scripts
+pattern_total_attempted = re.compile(
+    r"^(?P<total>Total)(?:.*?MOs\s+attempted\,\s+(?P<count>[0-9]{1,5})\s+MOs\s+(?P<action>.*?)|.*?MOs\s+attempted.*?)$",
+    re.IGNORECASE,
+)
+GREEN_REPORTS = ("1 MOs created", "1 MOs set", "Mo deleted")
+
 def CATEGORY_CHECKING(TAG_RESULT):
     # Check if the string contains certain substrings
-    check_number_executed = int(re.search(r"^Total.*?MOs\s+attempted\,\s+([0-9]{1,5})\s+MOs.*?$", TAG_RESULT, re.IGNORECASE).group(1)) if re.search(r"^(Total.*?MOs\s+attempted.*?)$", TAG_RESULT, re.IGNORECASE) else "NULL"
-    Action_GET = re.search(r"^Total.*?MOs\s+attempted\,\s+[0-9]{1,5}\s+MOs\s+(.*?)$", TAG_RESULT, re.IGNORECASE).group(1) if re.search(r"^(Total.*?MOs\s+attempted.*?)$", TAG_RESULT, re.IGNORECASE) else "NULL"
-    
-    if TAG_RESULT == "1 MOs created" or TAG_RESULT == "1 MOs set" or TAG_RESULT == "Mo deleted":
-        TAG_COLOR="42FF00"
-    elif re.search(r"^Total.*?MOs\s+attempted", TAG_RESULT, re.IGNORECASE) and check_number_executed > 0:
+    total = pattern_total_attempted.search(TAG_RESULT)
+    executed = total is not None and total.group("count") is not None
+    success = executed and int(total.group("count")) > 0
+
+    if TAG_RESULT in GREEN_REPORTS or success:
         TAG_COLOR="42FF00"
     else:
         TAG_COLOR="FF7575"
@@ -286,22 +384,55 @@ def CATEGORY_CHECKING(TAG_RESULT):
     if "TOTAL X" in TAG_RESULT:
         TAG_COLOR="42FF00"
 
-    if (re.search(r"^Total.*?MOs\s+attempted", TAG_RESULT, re.IGNORECASE) and check_number_executed > 0):
-        MSG = "Success"
-    else:
-        MSG = "Failed"
-    
+    MSG = "Success" if success else "Failed"
 
-        
-        
-    if re.search(r"^Total.*?MOs\s+attempted", TAG_RESULT, re.IGNORECASE):
-        TAG_RETURN = f'''{MSG} to {Action_GET}'''
+    if executed:
+        TAG_RETURN = f'''{MSG} to {total.group("action")}'''
     else:
         TAG_RETURN = TAG_RESULT
             
     return  TAG_RETURN, TAG_COLOR      
 
 
+# Memo of already classified TAG strings -> (Report, Color), shared by all reports of the session
+_report_memo = {}
+_REPORT_MEMO_MAX = 200000
+
+def classify_reports(tags):
+    """
+    Vectorized CATEGORY_CHECKING over a whole TAG column.
+
+    Each distinct TAG string is classified once (and remembered for later
+    reports); the result is mapped back to every row.
+
+    Returns:
+        pd.DataFrame: "Report" and "Color" columns aligned with tags.
+    """
+    tags = pd.Series(tags, dtype=object).fillna("").astype(str)
+    codes, uniques = pd.factorize(tags)
+
+    missing = pd.Series([tag for tag in uniques if tag not in _report_memo], dtype=object)
+    if len(missing):
+        if len(_report_memo) + len(missing) > _REPORT_MEMO_MAX:
+            _report_memo.clear()
+        ext = missing.str.extract(pattern_total_attempted)
+        executed = ext["total"].notna() & ext["count"].notna()
+        success = executed & (pd.to_numeric(ext["count"]) > 0)
+        green = missing.isin(GREEN_REPORTS) | success | missing.str.contains("TOTAL X", regex=False)
+        colors = np.where(green, "42FF00", "FF7575").tolist()
+        reports = np.select(
+            [success.to_numpy(), executed.to_numpy()],
+            [("Success to " + ext["action"]).to_numpy(dtype=object), ("Failed to " + ext["action"]).to_numpy(dtype=object)],
+            default=missing.to_numpy(dtype=object),
+        )
+        _report_memo.update(zip(missing, zip(reports, colors)))
+
+    memo = [_report_memo[tag] for tag in uniques]
+    report = np.array([m[0] for m in memo], dtype=object)[codes]
+    color = np.array([m[1] for m in memo], dtype=object)[codes]
+    return pd.DataFrame({"Report": report, "Color": color}, index=tags.index)
+
+
         
 class ExcelReaderApp(QMainWindow):
     processing_finished = pyqtSignal()
@@ -547,68 +678,337 @@ class ExcelReaderApp(QMainWindow):
 
 from tqdm import tqdm
 
+# Patterns used to fill the "Command" / "Parameter" columns of the report
+illegal_char_pattern = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+pattern_prompt_cmd = re.compile(r"^[A-Z0-9_\-]{4,180}>(.*?)$")
+pattern_set_parameter = re.compile(r"^SET\s+.*?\s+(.*?)\s+\=", re.IGNORECASE)
+pattern_bb_set_parameter = re.compile(r">\s+set\s+.*?\s+(.*?)\s+", re.IGNORECASE)
+
+REPORT_HEADERS = ["CR", "Site", "Command", "Parameter", "Report", "TAG", "Script", "Full command log"]
+REPORT_COLUMN_WIDTHS = [20, 20, 45, 25, 25, 20, 40, 70]
+HEADER_COLOR = "0EA1DD"
+
+# Header colors of the pre/post check sheets
+PREPOST_FILLS = {
+    "yellow": "fafbbe",
+    "yellow_remark": "fbff02",
+    "blue": "ADD8E6",
+    "orange": "FFD580",
+    "green": "90EE90",
+    "red": "FF9999",
+}
+PREPOST_COLOR_MAP = {
+    "Alarm": ['yellow', 'blue', 'blue', 'blue', 'orange', 'orange', 'orange', 'green'],
+    "CellState": ['yellow','yellow', 'blue', 'blue', 'orange', 'orange', 'green']
+}
+
+
+def log_row_values(log_row, TAG_REMARK):
+    """Return the 8 report cells for one log_data entry (TAG_REMARK from classify_reports)."""
+    FILE_LOG, Site, type_script, line_execute, TAG_RESULT, line_full_log, att_list = log_row
+    log1 = illegal_char_pattern.sub('', line_full_log)
+    line_execute = next((m.group(1) for line in att_list if (m := pattern_prompt_cmd.match(line))), "") if line_execute == "NULL" else line_execute
+
+    parameter_match = pattern_set_parameter.search(line_execute)
+    parameter = parameter_match.group(1) if parameter_match else ""
+
+    if not parameter:
+        parameter_match = pattern_bb_set_parameter.search(line_execute)
+        parameter = parameter_match.group(1) if parameter_match else ""
+
+    return [FILE_LOG, Site, line_execute, parameter, TAG_REMARK, log1, type_script, '\n'.join(att_list)]
+
+
+def report_summary_color(TAG_RESULT):
+    # Color of the Report cell in the "Pivot DF Summary" sheet
+    if TAG_RESULT == "1 MOs created" or TAG_RESULT == "1 MOs set" or TAG_RESULT == "Mo deleted":
+        return "42FF00"
+    elif re.search(r"Success to deleted", TAG_RESULT, re.IGNORECASE):
+        return "42FF00"
+    elif re.search(r"MOs already exists", TAG_RESULT, re.IGNORECASE):
+        return "FFFF00"
+    elif re.search(r"^Total.*?MOs\s+attempted", TAG_RESULT, re.IGNORECASE):
+        return "42FF00"
+    return "FF7575"
+
+
+def build_report_frame(log_data):
+    # DataFrame of the log data with its Report/Color, shared by the sheet writer and the pivots
+    df = pd.DataFrame(log_data, columns=["CR", "Site", "Script", "Command", "TAG", "Full Log", "Attachments"])
+    classified = classify_reports(df['TAG'])
+    df['Report'] = classified['Report']
+    df['Color'] = classified['Color']
+    return df
+
+
+def build_report_pivots(df):
+
+    # First pivot table (by Site)
+    pivot_df = pd.pivot_table(
+        df,
+        values='Command',
+        index=['Site','Report'],
+        aggfunc='count',
+        fill_value=0
+    )
+
+    # Add total column
+    pivot_df['Total'] = pivot_df.sum(axis=1)
+
+    # Second pivot table (Report Summary)
+    report_summary = df.groupby('Report').size().reset_index(name='Count')
+    total_commands = report_summary['Count'].sum()
+    report_summary['Percentage'] = (report_summary['Count'] / total_commands * 100).round(1).astype(str) + '%'
+    return pivot_df, report_summary, total_commands
+
+
+def build_prepost_compare(df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af):
+    """Return (df_compare_alarm, df_result) for the Alarm / CellState sheets, or (None, None)."""
+    if not (df_LOG_status_bf is not None and not df_LOG_status_bf.empty and df_LOG_status_af is not None and not df_LOG_status_af.empty):
+        return None, None
+
+    # Merge the two DataFrames on 'NODENAME' and 'MO'
+    cols = ['NODENAME', 'MO', 'administrativeState', 'operationalState']
+    df_result = (
+        pd.merge(df_LOG_status_bf[cols], df_LOG_status_af[cols], on=['NODENAME', 'MO'], suffixes=('_bf', '_af'))
+        .assign(
+            state_pair_bf=lambda x: x['administrativeState_bf'].astype(str) + '|' + x['operationalState_bf'].astype(str),
+            state_pair_af=lambda x: x['administrativeState_af'].astype(str) + '|' + x['operationalState_af'].astype(str),
+            state_match=lambda x: x['state_pair_bf'] == x['state_pair_af']
+        )[
+            ['NODENAME', 'MO',
+            'administrativeState_bf', 'operationalState_bf',
+            'administrativeState_af', 'operationalState_af',
+            'state_match']
+        ]
+    )
+
+
+    df_LOG_Alarm_af['Alarm'] = df_LOG_Alarm_af[['Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']].astype(str).agg('|'.join, axis=1)
+    df_LOG_Alarm_bf['Alarm'] = df_LOG_Alarm_bf[['Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']].astype(str).agg('|'.join, axis=1)
+    # Step 1: Add suffix
+    df_LOG_Alarm_bf = df_LOG_Alarm_bf.add_suffix('_Before')
+    df_LOG_Alarm_af = df_LOG_Alarm_af.add_suffix('_After')
+
+    # Step 2: Merge
+    df_compare_alarm = pd.merge(
+        df_LOG_Alarm_af,
+        df_LOG_Alarm_bf,
+        left_on=['NODENAME_After', 'Alarm_After'],
+        right_on=['NODENAME_Before', 'Alarm_Before'],
+        how='left'
+    )
+
+    # Step 3: Apply Remarks
+    def get_alarm_remark(row):
+        try:
+            if pd.notna(row['Alarm_Before']):
+                return 'Alarm Existing'
+            else:
+                return 'NEW Alarm'
+        except KeyError:
+            return 'NO DATA BEFORE'
+
+    df_compare_alarm['Remarks'] = df_compare_alarm.apply(get_alarm_remark, axis=1)
+    df_compare_alarm = df_compare_alarm.rename(columns={
+    'NODENAME_After': 'NODENAME'
+    })
+    # Optional: Rearrange columns for readability
+    cols = [
+        'NODENAME', 
+        'Date_Before', 'Time_Before', 'Alarm_Before',
+        'Date_After', 'Time_After', 'Alarm_After', 'Remarks'
+    ]
+    df_compare_alarm = df_compare_alarm[cols]
+    return df_compare_alarm, df_result
+
+
 # Function to write log data to an Excel file
-def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callback=None, df_LOG_Alarm_bf=None, df_LOG_Alarm_af=None, df_LOG_status_bf=None, df_LOG_status_af=None):
+def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callback=None, df_LOG_Alarm_bf=None, df_LOG_Alarm_af=None, df_LOG_status_bf=None, df_LOG_status_af=None, engine="xlsxwriter"):
+    """
+    Write the CR report workbook ("Sheet", "Pivot Table", "Pivot DF Summary"
+    and, when pre/post data is available, "Alarm" and "CellState").
+
+    engine="xlsxwriter" (default) streams rows with constant_memory and a small
+    cached format palette; engine="openpyxl" keeps the previous in-memory writer.
+    """
+    if engine == "openpyxl":
+        return _write_logs_to_excel_openpyxl(log_data, excel_filename, progress_callback, df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af)
+    if engine != "xlsxwriter":
+        raise ValueError(f"Unknown Excel engine: {engine}")
+    return _write_logs_to_excel_xlsxwriter(log_data, excel_filename, progress_callback, df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af)
+
+
+class FormatPalette:
+    """Caches xlsxwriter formats so every distinct cell style is created once per workbook."""
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._formats = {}
+
+    def get(self, size=9, bold=False, fill=None, border=False):
+        key = (size, bold, fill, border)
+        fmt = self._formats.get(key)
+        if fmt is None:
+            props = {'font_size': size, 'bold': bold}
+            if fill:
+                props['bg_color'] = f"#{fill}"
+                props['pattern'] = 1
+            if border:
+                props['border'] = 1
+            fmt = self._formats[key] = self.workbook.add_format(props)
+        return fmt
+
+
+def xlsx_write_value(ws, row, col, value, fmt=None):
+    # Explicit write_* calls: no formula/URL/number guessing on log text
+    if value is None or value is pd.NA or value == "" or (isinstance(value, float) and value != value):
+        ws.write_blank(row, col, None, fmt)
+    elif isinstance(value, (bool, np.bool_)):
+        ws.write_boolean(row, col, bool(value), fmt)
+    elif isinstance(value, numbers.Number):
+        ws.write_number(row, col, value, fmt)
+    else:
+        ws.write_string(row, col, str(value), fmt)
+
+
+def _write_logs_to_excel_xlsxwriter(log_data, excel_filename, progress_callback, df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af):
+    # constant_memory flushes every row once the next one starts, so each sheet is written top to bottom
+    wb = xlsxwriter.Workbook(excel_filename, {'constant_memory': True})
+    palette = FormatPalette(wb)
+    header_format = palette.get(size=12, bold=True, fill=HEADER_COLOR)
+    site_format = palette.get(bold=True)
+    text_format = palette.get()
+
+    ws = wb.add_worksheet("Sheet")
+    for col, (header, width) in enumerate(zip(REPORT_HEADERS, REPORT_COLUMN_WIDTHS)):
+        ws.set_column(col, col, width)
+        ws.write_string(0, col, header, header_format)
+
+    df = build_report_frame(log_data)
+    total = len(log_data)
+    last_percent = -1
+    for idx, (log_row, TAG_REMARK, TAG_COLOR) in enumerate(zip(log_data, df['Report'], df['Color']), start=1):
+        values = log_row_values(log_row, TAG_REMARK)
+        for col, value in enumerate(values):
+            if col < 2:
+                fmt = site_format
+            elif col == 4:
+                fmt = palette.get(fill=TAG_COLOR)
+            else:
+                fmt = text_format
+            xlsx_write_value(ws, idx, col, value, fmt)
+        # GUI progress update (only when the percentage changes)
+        if progress_callback is not None:
+            percent = int(idx/total*100)
+            if percent != last_percent:
+                last_percent = percent
+                progress_callback(percent)
+
+    pivot_df, report_summary, total_commands = build_report_pivots(df)
+
+    # Pivot table sheet
+    pivot_sheet = wb.add_worksheet("Pivot Table")
+    headers = ['Site', 'Report'] + list(pivot_df.columns)
+    pivot_sheet.set_column(0, len(headers) - 1, 15)
+    for col, header in enumerate(headers):
+        xlsx_write_value(pivot_sheet, 0, col, header, header_format)
+    value_format = palette.get(border=True)
+    for row_idx, ((site, report), row) in enumerate(pivot_df.iterrows(), start=1):
+        xlsx_write_value(pivot_sheet, row_idx, 0, site, site_format)
+        xlsx_write_value(pivot_sheet, row_idx, 1, report, site_format)
+        for col, value in enumerate(row, start=2):
+            xlsx_write_value(pivot_sheet, row_idx, col, value, value_format)
+    total_row = len(pivot_df) + 1
+    pivot_sheet.write_string(total_row, 0, "Total", site_format)
+    total_format = palette.get(bold=True, fill=HEADER_COLOR, border=True)
+    for col, value in enumerate(pivot_df.sum(), start=2):
+        xlsx_write_value(pivot_sheet, total_row, col, value, total_format)
+
+    # Report Summary sheet
+    report_sheet = wb.add_worksheet("Pivot DF Summary")
+    report_sheet.set_column(0, 2, 30)
+    for col, header in enumerate(['Report', 'Count', 'Percentage']):
+        report_sheet.write_string(0, col, header, header_format)
+    for row_idx, (_, row) in enumerate(report_summary.iterrows(), start=1):
+        xlsx_write_value(report_sheet, row_idx, 0, row['Report'], palette.get(fill=report_summary_color(row['Report']), border=True))
+        xlsx_write_value(report_sheet, row_idx, 1, row['Count'], value_format)
+        xlsx_write_value(report_sheet, row_idx, 2, row['Percentage'], value_format)
+    total_row = len(report_summary) + 1
+    report_sheet.write_string(total_row, 0, "Total", total_format)
+    xlsx_write_value(report_sheet, total_row, 1, total_commands, total_format)
+    report_sheet.write_string(total_row, 2, "100%", total_format)
+
+    df_compare_alarm, df_result = build_prepost_compare(df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af)
+    if df_compare_alarm is not None:
+        _xlsx_write_prepost_sheet(wb, palette, df_compare_alarm, "Alarm", highlight_remarks="NEW Alarm")
+        _xlsx_write_prepost_sheet(wb, palette, df_result, "CellState")
+
+    wb.close()
+
+
+def _xlsx_write_prepost_sheet(wb, palette, df, sheet_name, highlight_remarks=None):
+    if df is None or df.empty:
+        return
+
+    ws = wb.add_worksheet(sheet_name)
+    colors = PREPOST_COLOR_MAP.get(sheet_name, [])
+    columns = list(df.columns)
+
+    # Column widths from the data itself (header included), capped at 50
+    for c, col in enumerate(columns):
+        width = max(len(str(col)), int(df[col].fillna("").astype(str).str.len().max()))
+        ws.set_column(c, c, min(width + 2, 50))
+
+    for c, col in enumerate(columns):
+        fill = PREPOST_FILLS[colors[c]] if c < len(colors) else None
+        xlsx_write_value(ws, 0, c, col, palette.get(size=11, bold=True, fill=fill, border=True))
+
+    remarks_idx = columns.index("Remarks") if "Remarks" in columns else None
+    state_match_idx = columns.index("state_match") if sheet_name == "CellState" and "state_match" in columns else None
+    text_format = palette.get()
+    for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        row_format = text_format
+        if highlight_remarks and remarks_idx is not None and row[remarks_idx] == highlight_remarks:
+            row_format = palette.get(fill=PREPOST_FILLS["yellow_remark"])
+        for c, val in enumerate(row):
+            fmt = row_format
+            if c == state_match_idx:
+                state = str(val).strip().lower()
+                if state == "true":
+                    fmt = palette.get(fill=PREPOST_FILLS["green"])
+                elif state == "false":
+                    fmt = palette.get(fill=PREPOST_FILLS["red"])
+            xlsx_write_value(ws, r, c, val, fmt)
+
+
+def _write_logs_to_excel_openpyxl(log_data, excel_filename, progress_callback, df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af):
     # Create a new Excel workbook
     wb = openpyxl.Workbook()
     ws = wb.active
 
-    # Define a regular expression pattern to remove illegal characters
-    illegal_char_pattern = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
-
     # Write headers
-    headers = ["CR", "Site", "Command", "Parameter", "Report", "TAG", "Script", "Full command log"]
-    column_widths = [20, 20, 45, 25, 25, 20, 40, 70]
-
-    for col_num, (header, width) in enumerate(zip(headers, column_widths), start=1):
+    for col_num, (header, width) in enumerate(zip(REPORT_HEADERS, REPORT_COLUMN_WIDTHS), start=1):
         cell = ws.cell(row=1, column=col_num, value=header)
         cell.font = Font(size=12, bold=True)
-        cell.fill = PatternFill(start_color="0EA1DD", end_color="0EA1DD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
         ws.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = width
 
+    df = build_report_frame(log_data)
     total = len(log_data)
-    for idx, (FILE_LOG, Site, type_script, line_execute, TAG_RESULT, line_full_log, att_list) in enumerate(log_data, start=2):
-        log1 = illegal_char_pattern.sub('', line_full_log)
-        TAG_REMARK, TAG_COLOR = CATEGORY_CHECKING(TAG_RESULT)
-        line_execute = next((m.group(1) for line in att_list if (m := re.match(r"^[A-Z0-9_\-]{4,180}>(.*?)$", line))), "") if line_execute == "NULL" else line_execute
-
-        parameter_match = re.search(r"^SET\s+.*?\s+(.*?)\s+\=", line_execute, re.IGNORECASE)
-        parameter = parameter_match.group(1) if parameter_match else ""
-
-        if not parameter:
-            parameter_match = re.search(r">\s+set\s+.*?\s+(.*?)\s+", line_execute, re.IGNORECASE)
-            parameter = parameter_match.group(1) if parameter_match else ""
+    for idx, (log_row, TAG_REMARK, TAG_COLOR) in enumerate(zip(log_data, df['Report'], df['Color']), start=2):
+        values = log_row_values(log_row, TAG_REMARK)
 
         # Write data to cells
-        ws.cell(row=idx, column=1, value=FILE_LOG).font = Font(size=9, bold=True)
-        ws.cell(row=idx, column=2, value=Site).font = Font(size=9, bold=True)
-        ws.cell(row=idx, column=3, value=line_execute).font = Font(size=9)
-        ws.cell(row=idx, column=4, value=parameter).font = Font(size=9)
-        ws.cell(row=idx, column=5, value=TAG_REMARK).font = Font(size=9)
-        ws.cell(row=idx, column=6, value=log1).font = Font(size=9)
-        ws.cell(row=idx, column=7, value=type_script).font = Font(size=9)
-        ws.cell(row=idx, column=8, value='\n'.join(att_list)).font = Font(size=9)
+        for col_num, value in enumerate(values, start=1):
+            ws.cell(row=idx, column=col_num, value=value).font = Font(size=9, bold=col_num <= 2)
         ws.cell(row=idx, column=5).fill = PatternFill(start_color=TAG_COLOR, end_color=TAG_COLOR, fill_type="solid")
         # GUI progress update
         if progress_callback is not None:
             percent = int((idx-1)/total*100)
             progress_callback(percent)
 
-    # Create a DataFrame from the log data for pivot tables
-    df = pd.DataFrame(log_data, columns=["CR", "Site", "Script", "Command", "TAG", "Full Log", "Attachments"])
-    df['Report'] = df['TAG'].apply(lambda x: CATEGORY_CHECKING(x)[0])
-
-    # Create first pivot table (by Site)
-    pivot_df = pd.pivot_table(
-        df,
-        values='Command',
-        index=['Site','Report'],
-        aggfunc='count',
-        fill_value=0
-    )
-
-    # Add total column
-    pivot_df['Total'] = pivot_df.sum(axis=1)
+    pivot_df, report_summary, total_commands = build_report_pivots(df)
 
     # Create pivot table sheet
     pivot_sheet = wb.create_sheet(title="Pivot Table")
@@ -618,7 +1018,7 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
     for col_num, header in enumerate(headers, start=1):
         cell = pivot_sheet.cell(row=1, column=col_num, value=header)
         cell.font = Font(size=12, bold=True)
-        cell.fill = PatternFill(start_color="0EA1DD", end_color="0EA1DD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
         pivot_sheet.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = 15
 
     # Write pivot table data
@@ -641,7 +1041,7 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
     for col_idx, value in enumerate(pivot_df.sum(), start=3):
         cell = pivot_sheet.cell(row=total_row, column=col_idx, value=value)
         cell.font = Font(size=9, bold=True)
-        cell.fill = PatternFill(start_color="0EA1DD", end_color="0EA1DD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
         cell.border = Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
@@ -649,11 +1049,6 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
             bottom=Side(style='thin')
         )
 
-    # Create second pivot table (Report Summary)
-    report_summary = df.groupby('Report').size().reset_index(name='Count')
-    total_commands = report_summary['Count'].sum()
-    report_summary['Percentage'] = (report_summary['Count'] / total_commands * 100).round(1).astype(str) + '%'
-
     # Create Report Summary sheet
     report_sheet = wb.create_sheet(title="Pivot DF Summary")
     
@@ -662,7 +1057,7 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
     for col_num, header in enumerate(headers, start=1):
         cell = report_sheet.cell(row=1, column=col_num, value=header)
         cell.font = Font(size=12, bold=True)
-        cell.fill = PatternFill(start_color="0EA1DD", end_color="0EA1DD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
         report_sheet.column_dimensions[openpyxl.utils.get_column_letter(col_num)].width = 30
 
     # Write data
@@ -698,17 +1093,7 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
         )
 
         # Apply color fill based on Report category
-        TAG_RESULT = row['Report']
-        if TAG_RESULT == "1 MOs created" or TAG_RESULT == "1 MOs set" or TAG_RESULT == "Mo deleted":
-            TAG_COLOR="42FF00"
-        elif re.search(r"Success to deleted", TAG_RESULT, re.IGNORECASE):
-            TAG_COLOR="42FF00"    
-        elif re.search(r"MOs already exists", TAG_RESULT, re.IGNORECASE):
-            TAG_COLOR="FFFF00"                     
-        elif re.search(r"^Total.*?MOs\s+attempted", TAG_RESULT, re.IGNORECASE):
-            TAG_COLOR="42FF00"
-        else:
-            TAG_COLOR="FF7575"        
+        TAG_COLOR = report_summary_color(row['Report'])
 
         # Apply color to the Report cell (first cell in the row)
         report_sheet.cell(row=row_idx, column=1).fill = PatternFill(start_color=TAG_COLOR, end_color=TAG_COLOR, fill_type="solid")
@@ -722,7 +1107,7 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
     # Format total row
     for col in range(1, 4):
         cell = report_sheet.cell(row=total_row, column=col)
-        cell.fill = PatternFill(start_color="0EA1DD", end_color="0EA1DD", fill_type="solid")
+        cell.fill = PatternFill(start_color=HEADER_COLOR, end_color=HEADER_COLOR, fill_type="solid")
         cell.border = Border(
             left=Side(style='thin'),
             right=Side(style='thin'),
@@ -732,66 +1117,8 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
     
     
     
-    if df_LOG_status_bf is not None and not df_LOG_status_bf.empty and df_LOG_status_af is not None and not df_LOG_status_af.empty:
-        ###############################################
-        # Merge the two DataFrames on 'NODENAME' and 'MO'
-        cols = ['NODENAME', 'MO', 'administrativeState', 'operationalState']
-        df_result = (
-            pd.merge(df_LOG_status_bf[cols], df_LOG_status_af[cols], on=['NODENAME', 'MO'], suffixes=('_bf', '_af'))
-            .assign(
-                state_pair_bf=lambda x: x['administrativeState_bf'].astype(str) + '|' + x['operationalState_bf'].astype(str),
-                state_pair_af=lambda x: x['administrativeState_af'].astype(str) + '|' + x['operationalState_af'].astype(str),
-                state_match=lambda x: x['state_pair_bf'] == x['state_pair_af']
-            )[
-                ['NODENAME', 'MO',
-                'administrativeState_bf', 'operationalState_bf',
-                'administrativeState_af', 'operationalState_af',
-                'state_match']
-            ]
-        )
-
-
-        df_LOG_Alarm_af['Alarm'] = df_LOG_Alarm_af[['Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']].astype(str).agg('|'.join, axis=1)
-        df_LOG_Alarm_bf['Alarm'] = df_LOG_Alarm_bf[['Severity', 'Object', 'Problem', 'Cause', 'AdditionalText']].astype(str).agg('|'.join, axis=1)
-        # Step 1: Add suffix
-        df_LOG_Alarm_bf = df_LOG_Alarm_bf.add_suffix('_Before')
-        df_LOG_Alarm_af = df_LOG_Alarm_af.add_suffix('_After')
-
-        # Step 2: Merge
-        df_compare_alarm = pd.merge(
-            df_LOG_Alarm_af,
-            df_LOG_Alarm_bf,
-            left_on=['NODENAME_After', 'Alarm_After'],
-            right_on=['NODENAME_Before', 'Alarm_Before'],
-            how='left'
-        )
-
-        # Step 3: Apply Remarks
-        def get_alarm_remark(row):
-            try:
-                if pd.notna(row['Alarm_Before']):
-                    return 'Alarm Existing'
-                else:
-                    return 'NEW Alarm'
-            except KeyError:
-                return 'NO DATA BEFORE'
-
-        df_compare_alarm['Remarks'] = df_compare_alarm.apply(get_alarm_remark, axis=1)
-        df_compare_alarm = df_compare_alarm.rename(columns={
-        'NODENAME_After': 'NODENAME'
-        })
-        # Optional: Rearrange columns for readability
-        cols = [
-            'NODENAME', 
-            'Date_Before', 'Time_Before', 'Alarm_Before',
-            'Date_After', 'Time_After', 'Alarm_After', 'Remarks'
-        ]
-        df_compare_alarm = df_compare_alarm[cols]
-
-
-
-
-        # Save the Excel workbook
+    df_compare_alarm, df_result = build_prepost_compare(df_LOG_Alarm_bf, df_LOG_Alarm_af, df_LOG_status_bf, df_LOG_status_af)
+    if df_compare_alarm is not None:
         # Write each DataFrame to a separate sheet if not empty
         def write_df_to_sheet(wb, df, sheet_name, highlight_remarks=None):
             if df is None or df.empty:
@@ -802,20 +1129,10 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
             # Styles
             bold = Font(bold=True)
             border = Border(*(Side(style="thin") for _ in range(4)))
-            fills = {
-                "yellow": PatternFill("solid", fgColor="fafbbe"),
-                "yellow_remark": PatternFill("solid", fgColor="fbff02"),
-                "blue": PatternFill("solid", fgColor="ADD8E6"),
-                "orange": PatternFill("solid", fgColor="FFD580"),
-                "green": PatternFill("solid", fgColor="90EE90"),
-                "red": PatternFill("solid", fgColor="FF9999"),
-            }
+            fills = {name: PatternFill("solid", fgColor=color) for name, color in PREPOST_FILLS.items()}
 
             # Column color mapping
-            color_map = {
-                "Alarm": ['yellow', 'blue', 'blue', 'blue', 'orange', 'orange', 'orange', 'green'],
-                "CellState": ['yellow','yellow', 'blue', 'blue', 'orange', 'orange', 'green']
-            }
+            color_map = PREPOST_COLOR_MAP
 
             remarks_idx = None
             state_match_idx = None
@@ -853,7 +1170,6 @@ def write_logs_to_excel(log_data, excel_filename, selected_file, progress_callba
         # === USAGE ===    
         write_df_to_sheet(wb, df_compare_alarm, "Alarm", highlight_remarks="NEW Alarm")
         write_df_to_sheet(wb, df_result, "CellState")
-    
 
     wb.save(excel_filename)
      
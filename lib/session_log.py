@@ -0,0 +1,116 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Buffered writer for the LOG/<session>.log file of an interactive session
+#
+# The file stays open with a large buffer and is flushed when enough text is
+# pending, when flush_interval has passed (on write or on flush_if_due()), and
+# on close, instead of being reopened for every line. Past max_bytes the log
+# is rotated to <session>.<YYYYmmdd-HHMMSS>.log, gzipped when compress is set.
+
+import os
+import gzip
+import time
+import shutil
+import threading
+from datetime import datetime
+from .utils import debug_print
+
+LOG_BUFFER_SIZE = 256 * 1024
+# Pending characters that trigger a flush
+FLUSH_SIZE = 64 * 1024
+# Seconds after which pending lines are flushed anyway
+FLUSH_INTERVAL = 1.0
+
+
+class SessionLogWriter:
+    """
+    Append lines to one session log, keeping the file open in between.
+
+    Safe to call from the reader thread and the GUI thread. After close()
+    the next write reopens the file.
+
+    Args:
+        path (str): Log file path, e.g. LOG/<session>.log.
+        max_bytes (int): Rotate the log once it grows past this size; None never rotates.
+        compress (bool): Gzip the rotated logs.
+    """
+
+    def __init__(self, path, max_bytes=None, compress=False, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._file = None
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def write_lines(self, lines):
+        """Append lines (without their newline) to the log."""
+        if not lines:
+            return
+        text = "\n".join(lines) + "\n"
+        with self._lock:
+            try:
+                if self._file is None:
+                    self._file = open(self.path, "a", encoding="utf-8", buffering=LOG_BUFFER_SIZE)
+                self._file.write(text)
+                self._pending += len(text)
+                if self._pending >= self.flush_size or time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._flush()
+            except OSError as e:
+                debug_print(f"SessionLogWriter: cannot write {self.path}: {e}")
+
+    def flush_if_due(self):
+        """Flush pending lines older than flush_interval (call from a periodic tick)."""
+        with self._lock:
+            if self._pending and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+
+    def _flush(self):
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+        except OSError as e:
+            debug_print(f"SessionLogWriter: flush of {self.path} failed: {e}")
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if self.max_bytes and self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        base, ext = os.path.splitext(self.path)
+        stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+        rotated, n = f"{base}.{stamp}{ext}", 1
+        while os.path.exists(rotated) or os.path.exists(rotated + ".gz"):
+            rotated, n = f"{base}.{stamp}-{n}{ext}", n + 1
+        try:
+            os.replace(self.path, rotated)
+            if self.compress:
+                with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(rotated)
+        except OSError as e:
+            debug_print(f"SessionLogWriter: rotating {self.path} failed: {e}")
@@ -0,0 +1,217 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Shared SSH connections per target
+#
+# The interactive shell of a tab, its upload and its log download all talk to
+# the same ENM host as the same user. Instead of one SSHClient (TCP connect,
+# key exchange, password auth) each, they acquire() one authenticated client
+# from the pool and open their own channels on its transport: invoke_shell(),
+# exec_command() and open_sftp() each open a channel and run side by side.
+# A connection that is no longer active is replaced on the next acquire();
+# one nobody has used for idle_timeout seconds is closed.
+
+import time
+import threading
+import paramiko
+from .utils import debug_print, get_setting
+
+CONNECT_TIMEOUT = 30
+KEEPALIVE_INTERVAL = 30
+# Seconds an unused connection is kept open
+IDLE_TIMEOUT = 300
+# Users per connection; each one may keep a couple of channels open, and
+# OpenSSH allows 10 channels per connection by default (MaxSessions)
+MAX_USERS = 4
+
+
+def pool_key(target):
+    """Connections are shared between targets with the same host, port and credentials."""
+    return (target['host'], int(target['port']), target['username'], target['password'])
+
+
+def connect_client(target):
+    """Open and authenticate a new SSHClient for target."""
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    client.connect(
+        hostname=target['host'],
+        port=target['port'],
+        username=target['username'],
+        password=target['password'],
+        timeout=CONNECT_TIMEOUT,
+        banner_timeout=CONNECT_TIMEOUT,
+    )
+    transport = client.get_transport()
+    if transport:
+        transport.set_keepalive(KEEPALIVE_INTERVAL)
+    return client
+
+
+def is_healthy(client):
+    """True while the client's transport is connected and authenticated."""
+    transport = client.get_transport() if client else None
+    return bool(transport and transport.is_active() and transport.is_authenticated())
+
+
+class _PooledConnection:
+    def __init__(self):
+        # Held while connecting, so concurrent acquire() calls wait for one handshake
+        self.lock = threading.Lock()
+        self.client = None
+        self.users = 0
+        self.last_used = time.monotonic()
+
+
+class SSHConnectionPool:
+    """
+    Hand out shared, authenticated SSHClients per target.
+
+    Every acquire() must be paired with a release() of the returned client;
+    callers close their channels (shell, SFTP) themselves but never the client.
+
+    Args:
+        idle_timeout (float): Seconds an unused connection stays open.
+        max_users (int): Users per connection before another one is opened.
+        connect (callable): Opens a client for a target dict.
+    """
+
+    def __init__(self, idle_timeout=IDLE_TIMEOUT, max_users=MAX_USERS, connect=connect_client):
+        self.idle_timeout = idle_timeout
+        self.max_users = max_users
+        self.connect = connect
+        self._lock = threading.Lock()
+        self._connections = {}  # pool_key -> [_PooledConnection]
+        self._owners = {}  # client -> (pool_key, _PooledConnection)
+        self._evict_timer = None
+        self.connects = 0
+        self.reuses = 0
+
+    def acquire(self, target):
+        """
+        Get a connected client for target, reusing a healthy shared one.
+
+        Args:
+            target (dict): host, port, username and password (e.g. a session target).
+
+        Returns:
+            paramiko.SSHClient: Shared client; hand it back with release().
+        """
+        key = pool_key(target)
+        with self._lock:
+            connection = self._pick(key)
+            # Counted before connecting, so it is never evicted meanwhile
+            connection.users += 1
+        try:
+            with connection.lock:
+                if is_healthy(connection.client):
+                    self.reuses += 1
+                else:
+                    stale, connection.client = connection.client, None
+                    if stale is not None:
+                        debug_print(f"SSH pool: connection to {target['host']} is down, reconnecting")
+                        self._close(stale)
+                    connection.client = self.connect(target)
+                    self.connects += 1
+                    debug_print(f"SSH pool: connected to {target['username']}@{target['host']}")
+                client = connection.client
+                with self._lock:
+                    self._owners[client] = (key, connection)
+                return client
+        except Exception:
+            self._done(key, connection)
+            raise
+
+    def release(self, client):
+        """Give back a client from acquire(); unknown clients are closed."""
+        with self._lock:
+            owner = self._owners.get(client)
+        if owner is None:
+            self._close(client)
+            return
+        key, connection = owner
+        if connection.client is not client:
+            # Replaced after a failure while this user held it
+            self._close(client)
+        self._done(key, connection)
+
+    def evict_idle(self):
+        """Close connections that are unused for idle_timeout seconds or no longer healthy."""
+        now = time.monotonic()
+        evicted = []
+        with self._lock:
+            for key, connections in list(self._connections.items()):
+                for connection in list(connections):
+                    if connection.users:
+                        continue
+                    if now - connection.last_used >= self.idle_timeout or not is_healthy(connection.client):
+                        connections.remove(connection)
+                        for client in [c for c, owner in self._owners.items() if owner[1] is connection]:
+                            del self._owners[client]
+                        evicted.append(connection.client)
+                if not connections:
+                    del self._connections[key]
+            self._evict_timer = None
+            # Connections in use schedule the next pass when released
+            if any(not c.users for connections in self._connections.values() for c in connections):
+                self._schedule_eviction()
+        for client in evicted:
+            self._close(client)
+
+    def _pick(self, key):
+        # Least used connection of key with room for one more user
+        connections = self._connections.setdefault(key, [])
+        available = [c for c in connections if c.users < self.max_users]
+        if available:
+            return min(available, key=lambda c: c.users)
+        connection = _PooledConnection()
+        connections.append(connection)
+        return connection
+
+    def _done(self, key, connection):
+        with self._lock:
+            connection.users -= 1
+            connection.last_used = time.monotonic()
+            if connection.client is None and not connection.users:
+                # Never connected
+                connections = self._connections.get(key, [])
+                if connection in connections:
+                    connections.remove(connection)
+                if not connections:
+                    self._connections.pop(key, None)
+            elif self._evict_timer is None:
+                self._schedule_eviction()
+
+    def _schedule_eviction(self):
+        self._evict_timer = threading.Timer(self.idle_timeout, self.evict_idle)
+        self._evict_timer.daemon = True
+        self._evict_timer.start()
+
+    def _close(self, client):
+        try:
+            client.close()
+        except Exception as e:
+            debug_print(f"SSH pool: error closing connection: {e}")
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def shared_pool():
+    """The SSHConnectionPool shared by the sessions and workers of the app."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            # settings.json: SSH_POOL_IDLE_TIMEOUT (seconds), SSH_POOL_MAX_USERS
+            _shared_pool = SSHConnectionPool(
+                idle_timeout=get_setting('SSH_POOL_IDLE_TIMEOUT', IDLE_TIMEOUT),
+                max_users=get_setting('SSH_POOL_MAX_USERS', MAX_USERS),
+            )
+        return _shared_pool
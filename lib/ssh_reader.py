@@ -0,0 +1,204 @@
+# -----------------------------------------------------------------------------
+# Author      : esptnnd
+# Company     : Ericsson Indonesia
+# Created on  : 7 May 2025
+# Description : CR TOOLS by esptnnd — built for the ECT Project to help the team
+#               execute faster, smoother, and with way less hassle.
+#               Making life easier, one script at a time!
+# -----------------------------------------------------------------------------
+
+# Multiplexed reader for interactive SSH channels
+#
+# One I/O thread waits in a selector on the channels of every open session
+# (paramiko channels expose a fileno() that turns readable when data or EOF
+# arrives) instead of one thread per session polling recv_ready() every 10 ms.
+# Readable channels are drained with large recv() calls (stdout, then
+# stderr) and each chunk is handed to the callback of its session, on the
+# I/O thread.
+
+import time
+import socket
+import selectors
+import threading
+from .utils import debug_print
+
+RECV_BUFFER_SIZE = 64 * 1024
+# Upper bound of one chunk, so one flooding channel cannot starve the others
+MAX_CHUNK_SIZE = 1024 * 1024
+# Select timeout while a session wants on_idle calls; without any, block until data
+IDLE_INTERVAL = 0.5
+
+
+class ChannelReader:
+    """
+    Read many paramiko channels from one thread.
+
+    Args:
+        buffer_size (int): Bytes asked per recv() call.
+        idle_interval (float): Seconds between on_idle calls of the sessions.
+    """
+
+    def __init__(self, buffer_size=RECV_BUFFER_SIZE, idle_interval=IDLE_INTERVAL):
+        self.buffer_size = buffer_size
+        self.idle_interval = idle_interval
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        # Registrations queued by other threads, applied by the I/O thread
+        self._pending = []
+        # Channel -> fd it was registered with; a closed channel may no longer
+        # report that fd (paramiko recreates its pipe on the next fileno())
+        self._fds = {}
+        self._idle_callbacks = {}
+        self._last_idle = time.monotonic()
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._selector.register(self._wake_recv, selectors.EVENT_READ, None)
+        self._thread = None
+        self._running = False
+
+    def register(self, channel, on_data, on_close=None, on_idle=None):
+        """
+        Start reading channel.
+
+        Args:
+            channel (paramiko.Channel): Open channel, e.g. from invoke_shell().
+            on_data (callable): Called with each chunk of bytes read.
+            on_close (callable): Called once when the channel reaches EOF or is closed.
+            on_idle (callable): Called about every idle_interval seconds while registered.
+        """
+        with self._lock:
+            self._pending.append(('add', channel, (on_data, on_close, on_idle)))
+            if not self._running:
+                self._running = True
+                self._thread = threading.Thread(target=self._run, name="ssh-channel-reader", daemon=True)
+                self._thread.start()
+        self._wake()
+
+    def unregister(self, channel):
+        """Stop reading channel; on_close is not called."""
+        with self._lock:
+            self._pending.append(('remove', channel, None))
+        self._wake()
+
+    def stop(self):
+        """Stop the I/O thread after its current pass."""
+        with self._lock:
+            self._running = False
+        self._wake()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+
+    def _wake(self):
+        try:
+            self._wake_send.send(b'\0')
+        except OSError:
+            pass
+
+    def _apply_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for action, channel, callbacks in pending:
+            if action == 'add':
+                try:
+                    fd = channel.fileno()
+                    self._selector.register(fd, selectors.EVENT_READ, (channel,) + callbacks)
+                except (KeyError, ValueError, OSError) as e:
+                    debug_print(f"ChannelReader: cannot register channel: {e}")
+                    continue
+                self._fds[channel] = fd
+                if callbacks[2] is not None:
+                    self._idle_callbacks[channel] = callbacks[2]
+            else:
+                self._drop(channel)
+
+    def _drop(self, channel):
+        self._idle_callbacks.pop(channel, None)
+        fd = self._fds.pop(channel, None)
+        if fd is not None:
+            try:
+                self._selector.unregister(fd)
+            except (KeyError, ValueError, OSError):
+                pass
+
+    def _drop_closed(self):
+        # select() failed, most likely on the fd of a channel closed meanwhile
+        for channel in list(self._fds):
+            if channel.closed:
+                self._drop(channel)
+
+    def _read(self, channel):
+        # Drain what is buffered now; b'' means EOF/closed, None means nothing yet.
+        # The channel's fd also turns readable for stderr data, which must be
+        # drained as well or select() keeps returning at once
+        chunks, size = [], 0
+        for ready, recv in ((channel.recv_ready, channel.recv), (channel.recv_stderr_ready, channel.recv_stderr)):
+            while size < MAX_CHUNK_SIZE and ready():
+                data = recv(self.buffer_size)
+                if not data:
+                    break
+                chunks.append(data)
+                size += len(data)
+        if chunks:
+            return b''.join(chunks)
+        if channel.closed or channel.eof_received:
+            return b''
+        return None
+
+    def _run(self):
+        while True:
+            self._apply_pending()
+            with self._lock:
+                if not self._running:
+                    break
+            timeout = self.idle_interval if self._idle_callbacks else None
+            try:
+                events = self._selector.select(timeout)
+            except OSError as e:
+                debug_print(f"ChannelReader: select failed: {e}")
+                self._drop_closed()
+                continue
+            for key, _ in events:
+                if key.fileobj is self._wake_recv:
+                    try:
+                        while self._wake_recv.recv(4096):
+                            pass
+                    except (BlockingIOError, InterruptedError):
+                        pass
+                    continue
+                channel, on_data, on_close, _ = key.data
+                if self._fds.get(channel) != key.fd:
+                    continue
+                try:
+                    data = self._read(channel)
+                    if data:
+                        on_data(data)
+                    elif data == b'':
+                        self._drop(channel)
+                        if on_close is not None:
+                            on_close()
+                except Exception as e:
+                    # A failing session must not stop the reads of the others
+                    debug_print(f"ChannelReader: dropping channel after error: {e}")
+                    self._drop(channel)
+            now = time.monotonic()
+            if now - self._last_idle < self.idle_interval:
+                continue
+            self._last_idle = now
+            for on_idle in list(self._idle_callbacks.values()):
+                try:
+                    on_idle()
+                except Exception as e:
+                    debug_print(f"ChannelReader: on_idle failed: {e}")
+
+
+_shared_reader = None
+_shared_reader_lock = threading.Lock()
+
+
+def shared_reader():
+    """The ChannelReader shared by all interactive sessions of the app."""
+    global _shared_reader
+    with _shared_reader_lock:
+        if _shared_reader is None:
+            _shared_reader = ChannelReader()
+        return _shared_reader
@@ -1,6 +1,6 @@
-from PyQt5.QtWidgets import QTextEdit, QMainWindow, QPushButton, QLineEdit, QProgressBar, QLabel, QMenuBar, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QAbstractItemView, QFrame, QDateEdit, QSlider
+from PyQt5.QtWidgets import QTextEdit, QPlainTextEdit, QMainWindow, QPushButton, QLineEdit, QProgressBar, QLabel, QMenuBar, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QListWidget, QAbstractItemView, QFrame, QDateEdit, QSlider
 from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QPainter, QColor, QLinearGradient, QPen, QPalette, QBrush, QPixmap, QIcon, QFont
+from PyQt5.QtGui import QTextCursor, QPainter, QColor, QLinearGradient, QPen, QPalette, QBrush, QPixmap, QIcon, QFont
 import os
 
 # Style configuration
@@ -30,6 +30,39 @@ STYLE_CONFIG = {
     }
 }
 
+def paint_glass_background(viewport):
+    painter = QPainter(viewport)
+    painter.setRenderHint(QPainter.Antialiasing)
+    
+    rect = viewport.rect()
+    
+    # Draw base semi-transparent background with blur effect
+    painter.fillRect(rect, QColor(26, 26, 26, int(255 * 0.15)))
+    
+    # Draw gradient overlay for glass effect
+    gradient = QLinearGradient(0, 0, 0, rect.height())
+    gradient.setColorAt(0, QColor(26, 26, 26, 20))
+    gradient.setColorAt(0.5, QColor(26, 26, 26, 30))
+    gradient.setColorAt(1, QColor(26, 26, 26, 20))
+    painter.fillRect(rect, gradient)
+    
+    # Draw subtle highlight at the top
+    highlight = QLinearGradient(0, 0, 0, 2)
+    highlight.setColorAt(0, QColor(255, 255, 255, 10))
+    highlight.setColorAt(1, QColor(255, 255, 255, 0))
+    painter.fillRect(rect.adjusted(0, 0, 0, -rect.height() + 2), highlight)
+    
+    # Draw border effects
+    painter.setPen(QPen(QColor(128, 128, 128, 77), 1))  # Grey with 30% opacity
+    painter.drawRect(rect.adjusted(1, 1, -1, -1))
+    
+    # Draw subtle inner glow
+    glow = QPen(QColor(128, 128, 128, 77), 1, Qt.DotLine)  # Grey with 30% opacity
+    painter.setPen(glow)
+    painter.drawRect(rect.adjusted(2, 2, -2, -2))
+    painter.end()
+
+
 class TransparentTextEdit(QTextEdit):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -46,36 +79,59 @@ class TransparentTextEdit(QTextEdit):
         """)
 
     def paintEvent(self, event):
-        painter = QPainter(self.viewport())
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        rect = self.viewport().rect()
-        
-        # Draw base semi-transparent background with blur effect
-        painter.fillRect(rect, QColor(26, 26, 26, int(255 * 0.15)))
-        
-        # Draw gradient overlay for glass effect
-        gradient = QLinearGradient(0, 0, 0, rect.height())
-        gradient.setColorAt(0, QColor(26, 26, 26, 20))
-        gradient.setColorAt(0.5, QColor(26, 26, 26, 30))
-        gradient.setColorAt(1, QColor(26, 26, 26, 20))
-        painter.fillRect(rect, gradient)
-        
-        # Draw subtle highlight at the top
-        highlight = QLinearGradient(0, 0, 0, 2)
-        highlight.setColorAt(0, QColor(255, 255, 255, 10))
-        highlight.setColorAt(1, QColor(255, 255, 255, 0))
-        painter.fillRect(rect.adjusted(0, 0, 0, -rect.height() + 2), highlight)
-        
-        # Draw border effects
-        painter.setPen(QPen(QColor(128, 128, 128, 77), 1))  # Grey with 30% opacity
-        painter.drawRect(rect.adjusted(1, 1, -1, -1))
-        
-        # Draw subtle inner glow
-        glow = QPen(QColor(128, 128, 128, 77), 1, Qt.DotLine)  # Grey with 30% opacity
-        painter.setPen(glow)
-        painter.drawRect(rect.adjusted(2, 2, -2, -2))
-        
+        paint_glass_background(self.viewport())
+        super().paintEvent(event)
+
+# Lines kept by a terminal view; older lines only remain in LOG/<session>.log
+DEFAULT_SCROLLBACK_LINES = 10000
+
+class TerminalOutputView(QPlainTextEdit):
+    """
+    Read-only terminal output with a bounded scrollback.
+
+    The document is a ring buffer of lines: maximumBlockCount makes Qt drop
+    the oldest line for every line appended past the scrollback, so a session
+    that runs all day keeps a constant memory footprint and append cost.
+    """
+
+    def __init__(self, scrollback=DEFAULT_SCROLLBACK_LINES, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_TranslucentBackground)
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(scrollback)
+        self.setStyleSheet(f"""
+            QPlainTextEdit {{
+                background: rgba(26, 26, 26, 0.2);
+                color: white;
+                border: 1px solid rgba(128, 128, 128, 0.3);
+                font-family: {STYLE_CONFIG['fonts']['default'][0]};
+                font-size: {STYLE_CONFIG['fonts']['default'][1]}pt;
+                font-weight: bold;
+            }}
+        """)
+
+    def append_lines(self, lines):
+        """Append lines at the end and scroll to them."""
+        if lines:
+            self.appendPlainText('\n'.join(lines))
+            self.moveCursor(QTextCursor.End)
+
+    def remove_last_line(self, text):
+        """Remove the last line if it is exactly text."""
+        block = self.document().lastBlock()
+        if block.text() != text:
+            return
+        cursor = QTextCursor(block)
+        cursor.select(QTextCursor.BlockUnderCursor)
+        if block.blockNumber() == 0:
+            # No newline before the first line: clear just its text
+            cursor = QTextCursor(block)
+            cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+
+    def paintEvent(self, event):
+        paint_glass_background(self.viewport())
         super().paintEvent(event)
 
 class StyledPushButton(QPushButton):
@@ -22,6 +22,19 @@ def get_debug_mode():
         get_debug_mode._cached = debug_mode
     return get_debug_mode._cached
 
+def get_setting(key, default=None):
+    # settings.json is read once and cached, like get_debug_mode
+    if not hasattr(get_setting, '_cached'):
+        settings_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'settings.json')
+        settings = {}
+        try:
+            with open(settings_path, 'r') as f:
+                settings = json.load(f)
+        except Exception:
+            pass
+        get_setting._cached = settings
+    return get_setting._cached.get(key, default)
+
 def debug_print(*args, **kwargs):
 
     if get_debug_mode() == 'DEBUG':
@@ -17,22 +17,23 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import (
     QEventLoop, QTimer, QObject, pyqtSignal, QThread, Qt, QFileInfo, QDir, QEvent
 )
-from PyQt5.QtGui import QFont, QTextCursor
+from PyQt5.QtGui import QFont
 import re
 import time # For profiling in SSHTab, maybe move later
 import os
-import pandas as pd
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import threading
 from queue import Queue
-from .utils import debug_print
+from .utils import debug_print, get_setting
 
 # Import the run_concheck function and SSH related classes/dialogs/workers
 from .concheck import run_concheck
 from .ssh import InteractiveSSH # Assuming InteractiveSSH is needed by SSHTab
 from .dialogs import ScreenSelectionDialog, MultiConnectDialog, UploadCRDialog, DownloadLogDialog, DuplicateSessionDialog # Import dialogs used by these widgets
 from .workers import UploadWorker, SubfolderLoaderWorker, DownloadLogWorker # Import workers used by these widgets
-from .style import StyledTabWidget, TransparentTextEdit, StyledPushButton, StyledLineEdit, StyledProgressBar, TopButton, StyledListWidget, StyledContainer, setup_window_style, update_window_style
-from .report_generator import process_single_log, write_logs_to_excel, ExcelWriterThread
+from .output_coalescer import OutputCoalescer, DEFAULT_MAX_UPDATES_PER_SECOND
+from .style import StyledTabWidget, TransparentTextEdit, TerminalOutputView, DEFAULT_SCROLLBACK_LINES, StyledPushButton, StyledLineEdit, StyledProgressBar, TopButton, StyledListWidget, StyledContainer, setup_window_style, update_window_style
+from .report_generator import write_logs_to_excel, ExcelWriterThread, parse_folder_logs
+from .report_cache import cache_path_for
 from lib.merge_file_case import ENM_NAMES, merge_cmbulk_files
 from lib.rehoming import merge_lacrac_files, parse_dump, ParseDumpWorker, select_dump_and_excel
 
@@ -105,8 +106,8 @@ class SSHTab(QWidget):
 
         self.layout = QVBoxLayout()
 
-        self.output_box = TransparentTextEdit()
-        self.output_box.setReadOnly(True)
+        # Bounded scrollback; the full history stays in LOG/<session>.log
+        self.output_box = TerminalOutputView(get_setting('TERMINAL_SCROLLBACK_LINES', DEFAULT_SCROLLBACK_LINES))
         font = QFont("Consolas", 10)
         self.output_box.setFont(font)
 
@@ -165,10 +166,12 @@ class SSHTab(QWidget):
 
         self.update_button_states()
 
-        self._output_buffer = []  # For batching output
-        self._output_batch_size = 20
+        # Output shown at most OUTPUT_MAX_UPDATES_PER_SECOND times per second
+        self._output = OutputCoalescer(
+            get_setting('OUTPUT_MAX_UPDATES_PER_SECOND', DEFAULT_MAX_UPDATES_PER_SECOND),
+            max_pending_lines=self.output_box.maximumBlockCount() or None)
         self._output_timer = QTimer(self)
-        self._output_timer.setInterval(100)  # ms
+        self._output_timer.setSingleShot(True)
         self._output_timer.timeout.connect(self.flush_output)
         self._waiting_for_prompt = False
 
@@ -253,6 +256,7 @@ class SSHTab(QWidget):
             self.connected = False
             self.update_button_states()
             self.append_output(f"Disconnected from {self.target['session_name']}.")
+            debug_print(f"Output of {self.target['session_name']}: {self._output.stats()}")
 
 
     def update_button_states(self):
@@ -263,36 +267,24 @@ class SSHTab(QWidget):
     def append_output(self, text):
         # If waiting for prompt, clear the waiting message on first real output
         if self._waiting_for_prompt:
-            # Remove 'Waiting for prompt...' from the end if present
-            cursor = self.output_box.textCursor()
-            cursor.movePosition(QTextCursor.End)
-            self.output_box.setTextCursor(cursor)
-            content = self.output_box.toPlainText()
-            # Check both with and without trailing newline
-            if content.endswith("Waiting for prompt...\n"):
-                 new_content = content[:-len("Waiting for prompt...\n")]
-                 self.output_box.setPlainText(new_content)
-            elif content.endswith("Waiting for prompt..."):
-                 new_content = content[:-len("Waiting for prompt...")]
-                 self.output_box.setPlainText(new_content)
+            # Remove 'Waiting for prompt...' from the end if present (still buffered or shown)
+            if not self._output.discard_last("Waiting for prompt..."):
+                self.output_box.remove_last_line("Waiting for prompt...")
 
             self._waiting_for_prompt = False
 
-        self._output_buffer.append(text)
-        if len(self._output_buffer) >= self._output_batch_size:
+        if self._output.push(text):
             self.flush_output()
-        else:
-            if not self._output_timer.isActive():
-                self._output_timer.start()
+        elif not self._output_timer.isActive():
+            self._output_timer.start(int(self._output.delay() * 1000) + 1)
 
     def flush_output(self):
-        if self._output_buffer:
-            self.output_box.moveCursor(QTextCursor.End)
-            self.output_box.insertPlainText('\n'.join(self._output_buffer) + '\n')
-            self.output_box.moveCursor(QTextCursor.End)
-            self._output_buffer.clear()
-            # QApplication.processEvents() # Removed to avoid potential re-entrancy issues
         self._output_timer.stop()
+        texts, dropped = self._output.take()
+        if dropped:
+            texts.insert(0, f"[INFO] {dropped} lines skipped on screen, full output in LOG/{self.target['session_name']}.log")
+        if texts:
+            self.output_box.append_lines(texts)
 
     def send_command(self):
         cmd = self.input_line.text()
@@ -595,6 +587,17 @@ class ExcelReaderApp(QMainWindow):
         self.process_button.clicked.connect(self.read_selected_excel)
         container.layout().addWidget(self.process_button)
 
+        # Pipelined mode: parse the next folder while the previous report is written
+        self.pipeline_checkbox = QCheckBox("Parse next folder while writing report")
+        self.pipeline_checkbox.setChecked(True)
+        self.pipeline_checkbox.setStyleSheet("color: white;")
+        container.layout().addWidget(self.pipeline_checkbox)
+
+        # One progress row per selected folder (filled in when a run starts)
+        self.folder_rows_layout = QVBoxLayout()
+        container.layout().addLayout(self.folder_rows_layout)
+        self.folder_rows = {}
+
         # Create progress bar
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
@@ -648,10 +651,64 @@ class ExcelReaderApp(QMainWindow):
         if not selected_items:
             self.show_error_message("Please select a file first")
             return
-        for item in selected_items:
-            self.file_queue.put(item.text())
+        folders = [item.text() for item in selected_items]
+        if self.pipeline_checkbox.isChecked() and len(folders) > 1:
+            self.process_folders_pipelined(folders)
+            return
+        for folder in folders:
+            self.file_queue.put(folder)
         self.process_next_file()
 
+    def clear_folder_rows(self):
+        for row_widget, _, _ in self.folder_rows.values():
+            self.folder_rows_layout.removeWidget(row_widget)
+            row_widget.deleteLater()
+        self.folder_rows = {}
+
+    def add_folder_row(self, folder):
+        row_widget = QWidget()
+        row = QHBoxLayout(row_widget)
+        row.setContentsMargins(0, 0, 0, 0)
+        name_label = QLabel(folder)
+        name_label.setStyleSheet("color: white;")
+        bar = QProgressBar()
+        bar.setRange(0, 100)
+        status_label = QLabel("Queued")
+        status_label.setStyleSheet("color: white;")
+        row.addWidget(name_label, 2)
+        row.addWidget(bar, 3)
+        row.addWidget(status_label, 2)
+        self.folder_rows_layout.addWidget(row_widget)
+        self.folder_rows[folder] = (row_widget, bar, status_label)
+
+    def update_folder_progress(self, folder, value):
+        if folder in self.folder_rows:
+            self.folder_rows[folder][1].setValue(value)
+
+    def update_folder_phase(self, folder, text):
+        if folder in self.folder_rows:
+            self.folder_rows[folder][2].setText(text)
+
+    def process_folders_pipelined(self, folders):
+        self.output_dir = os.path.join(self.file_path, "reports")
+        self.check_folder(self.output_dir)
+        self.clear_folder_rows()
+        for folder in folders:
+            self.add_folder_row(folder)
+        self.process_button.setEnabled(False)
+        self.worker = BatchReportThread(self.file_path, folders, self.output_dir)
+        self.worker.folder_progress.connect(self.update_folder_progress)
+        self.worker.folder_phase.connect(self.update_folder_phase)
+        self.worker.overall_progress.connect(self.update_overall_progress)
+        self.worker.phase_changed.connect(self.update_phase_label)
+        self.worker.details_changed.connect(self.update_details_label)
+        self.worker.all_finished.connect(self.on_pipeline_finished)
+        self.worker.start()
+
+    def on_pipeline_finished(self):
+        self.process_button.setEnabled(True)
+        self.show_success_message("All selected folders processed!")
+
     def process_next_file(self):
         if not self.file_queue.empty():
             selected_file = self.file_queue.get()
@@ -696,12 +753,6 @@ class WorkerThread(QThread):
     def run(self):
         try:
             folder_path = os.path.join(self.file_path, self.selected_file)
-            log_files = [f for f in os.listdir(folder_path) if f.lower().endswith('.log')]
-            total_files = len(log_files)
-
-            log_data = []
-            alarm_bf_list, alarm_af_list, status_bf_list, status_af_list = [], [], [], []
-            args_list = [(f, folder_path, self.selected_file) for f in log_files]
 
             # Emit 0% progress at the start
             debug_print(f"WorkerThread: Starting log reading, progress 0%")
@@ -709,29 +760,13 @@ class WorkerThread(QThread):
             self.details_changed.emit("")
             self.overall_progress.emit(0)
 
-            from lib.report_generator import process_single_log
-            import pandas as pd
-            with ProcessPoolExecutor() as executor:
-                futures = {executor.submit(process_single_log, args): args[0] for args in args_list}
-                for i, future in enumerate(as_completed(futures), 1):
-                    result = future.result()
-                    log_data.extend(result["log_data"])
-                    if not result["df_LOG_Alarm_bf"].empty:
-                        alarm_bf_list.append(result["df_LOG_Alarm_bf"])
-                    if not result["df_LOG_Alarm_af"].empty:
-                        alarm_af_list.append(result["df_LOG_Alarm_af"])
-                    if not result["df_LOG_status_bf"].empty:
-                        status_bf_list.append(result["df_LOG_status_bf"])
-                    if not result["df_LOG_status_af"].empty:
-                        status_af_list.append(result["df_LOG_status_af"])
-                    percent = int((i / total_files) * 100) if total_files else 100
-                    self.overall_progress.emit(percent)
-                    self.details_changed.emit(f"Reading: {futures[future]}")
-
-            df_LOG_Alarm_bf = pd.concat(alarm_bf_list, ignore_index=True) if alarm_bf_list else pd.DataFrame()
-            df_LOG_Alarm_af = pd.concat(alarm_af_list, ignore_index=True) if alarm_af_list else pd.DataFrame()
-            df_LOG_status_bf = pd.concat(status_bf_list, ignore_index=True) if status_bf_list else pd.DataFrame()
-            df_LOG_status_af = pd.concat(status_af_list, ignore_index=True) if status_af_list else pd.DataFrame()
+            def read_progress(done, total, filename, cache_info):
+                self.overall_progress.emit(int((done / total) * 100) if total else 100)
+                self.details_changed.emit(f"Reading: {filename} (cache {cache_info[0]} hit / {cache_info[1]} miss)")
+            log_data, sections = parse_folder_logs(
+                folder_path, self.selected_file, progress_callback=read_progress,
+                cache_path=cache_path_for(self.output_dir, self.selected_file)
+            )
 
             # After log reading, write Excel and update progress
             self.phase_changed.emit("Writing Excel...")
@@ -743,10 +778,7 @@ class WorkerThread(QThread):
             write_logs_to_excel(
                 log_data, output_excel, self.selected_file, 
                 progress_callback=excel_progress,
-                df_LOG_Alarm_bf=df_LOG_Alarm_bf,
-                df_LOG_Alarm_af=df_LOG_Alarm_af,
-                df_LOG_status_bf=df_LOG_status_bf,
-                df_LOG_status_af=df_LOG_status_af
+                **sections
             )
             self.overall_progress.emit(100)
             self.phase_changed.emit("Done!")
@@ -760,6 +792,83 @@ class WorkerThread(QThread):
             debug_print(err_msg)
             self.finished.emit(self.file_path, [], self.selected_file, self.output_dir)
 
+class BatchReportThread(QThread):
+    """
+    Pipelined report run over several CR folders: a parse stage reads folder
+    N+1 while this thread writes the Excel report of folder N. The two stages
+    are joined by a bounded queue so at most queue_size parsed folders wait
+    in memory for the writer.
+    """
+    folder_progress = pyqtSignal(str, int)  # folder, 0-100 (read 0-50, write 50-100)
+    folder_phase = pyqtSignal(str, str)     # folder, status text
+    overall_progress = pyqtSignal(int)
+    phase_changed = pyqtSignal(str)
+    details_changed = pyqtSignal(str)
+    all_finished = pyqtSignal()
+
+    def __init__(self, file_path, folders, output_dir, queue_size=1):
+        super().__init__()
+        self.file_path = file_path
+        self.folders = list(folders)
+        self.output_dir = output_dir
+        self.parsed_queue = Queue(maxsize=queue_size)
+
+    def _parse_stage(self):
+        for folder in self.folders:
+            try:
+                self.folder_phase.emit(folder, "Reading logs...")
+                def read_progress(done, total, filename, cache_info, folder=folder):
+                    self.folder_progress.emit(folder, int((done / total) * 50) if total else 50)
+                    self.folder_phase.emit(folder, f"Reading logs (cache {cache_info[0]} hit / {cache_info[1]} miss)")
+                log_data, sections = parse_folder_logs(
+                    os.path.join(self.file_path, folder), folder, progress_callback=read_progress,
+                    cache_path=cache_path_for(self.output_dir, folder)
+                )
+                self.folder_phase.emit(folder, "Waiting for writer...")
+                self.parsed_queue.put((folder, log_data, sections, None))  # Blocks while the writer is behind
+            except Exception as e:
+                import traceback
+                self.parsed_queue.put((folder, [], None, f"Error: {str(e)}\n{traceback.format_exc()}"))
+        self.parsed_queue.put(None)
+
+    def run(self):
+        total = len(self.folders)
+        self.phase_changed.emit(f"Processing {total} folders...")
+        self.overall_progress.emit(0)
+        parser = threading.Thread(target=self._parse_stage, daemon=True)
+        parser.start()
+
+        written = 0
+        while True:
+            item = self.parsed_queue.get()
+            if item is None:
+                break
+            folder, log_data, sections, error = item
+            if error is None:
+                try:
+                    self.folder_phase.emit(folder, "Writing Excel...")
+                    output_excel = os.path.join(self.output_dir, f"{folder}_report.xlsx")
+                    self.details_changed.emit(f"Writing: {os.path.basename(output_excel)}")
+                    def excel_progress(val, folder=folder):
+                        self.folder_progress.emit(folder, 50 + val // 2)
+                    write_logs_to_excel(log_data, output_excel, folder, progress_callback=excel_progress, **sections)
+                except Exception as e:
+                    import traceback
+                    error = f"Error: {str(e)}\n{traceback.format_exc()}"
+            if error is None:
+                self.folder_progress.emit(folder, 100)
+                self.folder_phase.emit(folder, "Done!")
+            else:
+                debug_print(error)
+                self.folder_phase.emit(folder, "Error!")
+                self.details_changed.emit(error)
+            written += 1
+            self.overall_progress.emit(int((written / total) * 100))
+
+        parser.join()
+        self.phase_changed.emit("Done!")
+        self.all_finished.emit()
+
 class CMBulkFileMergeWidget(QWidget):
     def __init__(self, parent=None, start_path=None):
         super().__init__(parent)
@@ -21,6 +21,7 @@ import threading # For thread-safe file operations
 
 # Import utility functions if needed by the worker
 from .utils import remove_ansi_escape_sequences, debug_print # Added debug_print
+from .ssh_pool import shared_pool
 
 # Global mutex for file system operations to prevent race conditions
 _file_operation_lock = threading.Lock()
@@ -55,25 +56,14 @@ class UploadWorker(QObject):
         self._should_stop = True
 
     def run(self):
-        import paramiko
         client = None
         sftp = None
         local_run_cr_path = None
         local_zip_path = None
 
         try:
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            
-            # Add connection timeout to prevent hanging
-            client.connect(
-                hostname=self.target_info['host'],
-                port=self.target_info['port'],
-                username=self.target_info['username'],
-                password=self.target_info['password'],
-                timeout=30,
-                banner_timeout=30
-            )
+            # Shared with the interactive session of the same target
+            client = shared_pool().acquire(self.target_info)
 
             username = self.target_info['username']
             # Use self.var_FOLDER_CR
@@ -468,11 +458,8 @@ class UploadWorker(QObject):
             except Exception as e:
                 debug_print(f"Error closing SFTP connection: {e}")
             
-            try:
-                if client:
-                    client.close()
-            except Exception as e:
-                debug_print(f"Error closing SSH client: {e}")
+            if client:
+                shared_pool().release(client)
 
     # The initiate_multi_session_upload method is not part of the worker,
     # it should remain in SSHManager.
@@ -508,19 +495,15 @@ class DownloadLogWorker(QObject):
     def run(self):
         username = self.target['username']
         host = self.target['host']
-        port = self.target['port']
-        password = self.target['password']
         remote_zip = f"/home/shared/{username}/00_{self.var_FOLDER_CR}_download.zip"
         local_dir = "02_DOWNLOAD"
         os.makedirs(local_dir, exist_ok=True)
         local_zip = os.path.join(local_dir, f"{self.target['session_name']}_download.zip")
+        client = None
 
         try:
             self.output.emit(f"Connecting to {host}...")
-            import paramiko
-            client = paramiko.SSHClient()
-            client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            client.connect(host, port, username, password)
+            client = shared_pool().acquire(self.target)
 
 
 
@@ -541,7 +524,6 @@ class DownloadLogWorker(QObject):
             if err and ("zip error" in err.lower() or "permission denied" in err.lower()):
                 self.output.emit(f"Remote zipping failed with error. Skipping download.")
                 self.error.emit(f"Download failed for {self.target['session_name']}: Remote zipping failed.")
-                client.close()
                 return
 
 
@@ -559,7 +541,6 @@ class DownloadLogWorker(QObject):
             if not file_count_output.isdigit() or int(file_count_output) == 0:
                 self.output.emit(f"[SKIP] No files found in {self.remote_path}. Skipping zip and download.")
                 self.completed.emit(f"No files to download for {self.target['session_name']}")
-                client.close()
                 return
 
 
@@ -596,14 +577,17 @@ class DownloadLogWorker(QObject):
 
             # Remove remote zip file
             rm_cmd = f"rm -f {remote_zip}"
-            client.exec_command(rm_cmd)
-            client.close()
+            stdin, stdout, stderr = client.exec_command(rm_cmd)
+            stdout.channel.recv_exit_status()
 
             self.completed.emit(f"Download completed for {self.target['session_name']}")
 
         except Exception as e:
             self.output.emit(f"Download failed for {self.target['session_name']}: {e}")
             self.error.emit(f"Download failed for {self.target['session_name']}: {e}")
+        finally:
+            if client:
+                shared_pool().release(client)
 
 
 
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from lib.alarm_compare import alarm_keys, match_alarms, alarm_remarks
+
+
+def _alarms(rows):
+    return pd.DataFrame(rows, columns=["NODENAME", "Severity", "Problem", "Object", "Date"])
+
+
+def test_alarm_keys_ignore_categorical_dtype():
+    df = _alarms([("N1", "Major", "Link failure", "Cell=1", "d")])
+    categorical = df.astype({"NODENAME": "category"})
+    assert (alarm_keys(df) == alarm_keys(categorical)).all()
+
+
+def test_match_alarms_suffixed_before_columns():
+    after = _alarms([("N1", "Major", "Link failure", "Cell=1", "d1"), ("N2", "Minor", "Clock", "Cell=2", "d2")])
+    before = _alarms([("N1", "Major", "Link failure", "Cell=1", "d0")]).add_suffix("_BEFORE")
+    merged = match_alarms(
+        after, before,
+        left_on=["NODENAME", "Severity", "Problem", "Object"],
+        right_on=["NODENAME_BEFORE", "Severity_BEFORE", "Problem_BEFORE", "Object_BEFORE"],
+    )
+    assert list(merged["_merge"]) == ["both", "left_only"]
+    assert merged.loc[0, "Date_BEFORE"] == "d0"
+    assert pd.isna(merged.loc[1, "Date_BEFORE"])
+
+
+def test_match_alarms_same_key_names_like_merge_on():
+    after = _alarms([("N1", "Major", "Link failure", "Cell=1", "d1")])
+    before = _alarms([("N1", "Major", "Link failure", "Cell=1", "d0")])
+    merged = match_alarms(after, before, suffixes=("_After", "_Before"))
+    assert list(merged.columns) == ["NODENAME", "Severity", "Problem", "Object", "Date_After", "Date_Before", "_merge"]
+
+
+def test_alarm_remarks():
+    matched = pd.Series([True, False, False, False, False])
+    status = pd.Series(["UNREMOTE", "UNREMOTE", "OK", None, "NOK"])
+    assert list(alarm_remarks(matched, status)) == [
+        "Alarm Existing", "Before Site Unremote", "NEW Alarm", "NO DATA BEFORE", "NO DATA BEFORE",
+    ]
+    assert list(alarm_remarks(matched)) == ["Alarm Existing"] + ["NO DATA BEFORE"] * 4
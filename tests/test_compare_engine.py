@@ -0,0 +1,46 @@
+import pandas as pd
+
+from lib.compare_engine import CompareEngine, select_columns
+
+
+def _frame(rows, columns=("NODENAME", "MO", "state")):
+    return pd.DataFrame(rows, columns=list(columns))
+
+
+BEFORE = _frame([("N2", "C1", "1"), ("N1", "C2", "1"), ("N1", "MO", "state"), ("N1", "C1", None)])
+AFTER = _frame([("N1", "C1", None), ("N1", "C2", "2"), ("N3", "C1", "1")])
+
+
+def test_compare_matches_outer_string_merge():
+    engine = CompareEngine({"Cell Status": BEFORE}, {"Cell Status": AFTER})
+    result = engine.compare(BEFORE, AFTER, sheet="Cell Status")
+
+    assert list(result.columns) == ["NODENAME", "MO", "state_Before", "state_After", "state_Compare"]
+    # Sorted like merge(how='outer'), the 'MO' header row dropped, empty never equal
+    assert result[["NODENAME", "MO"]].values.tolist() == [["N1", "C1"], ["N1", "C2"], ["N2", "C1"], ["N3", "C1"]]
+    assert result["state_Compare"].tolist() == [False, False, False, False]
+    assert engine.mismatches == {"Cell Status": {"state_Compare": 4}}
+
+
+def test_compare_equal_values_and_columns_missing_after():
+    before = _frame([("N1", "C1", "1", "x")], ("NODENAME", "MO", "state", "extra"))
+    after = _frame([("N1", "C1", "1")])
+    result = CompareEngine({"k": before}, {"k": after}).compare(before, after, sheet="k")
+    assert result["state_Compare"].tolist() == [True]
+    assert result["extra_After"].isna().all() and result["extra_Compare"].tolist() == [False]
+
+
+def test_compare_codes_values_not_seen_at_construction():
+    engine = CompareEngine({}, {})
+    before = _frame([("N9", "C1", "1"), (None, "C1", "1")])
+    after = _frame([("N9", "C1", "1"), ("N0", "C2", "1")])
+    result = engine.compare(before, after)
+    assert result["NODENAME"].tolist()[:2] == ["N0", "N9"]
+    assert pd.isna(result["NODENAME"].iloc[2])
+    assert result["state_Compare"].tolist() == [False, True, False]
+
+
+def test_select_columns_adds_missing_as_na():
+    df = select_columns(pd.DataFrame({"MO": ["C1"], "NODENAME": ["N1"]}), ["NODENAME", "MO", "x"])
+    assert list(df.columns) == ["NODENAME", "MO", "x"]
+    assert df["x"].isna().all()
@@ -0,0 +1,76 @@
+import pytest
+
+from lib.line_classifier import (
+    classify_line, SectionCollector, LINE_TEXT, LINE_BLANK, LINE_PROMPT, LINE_TAG, LINE_ALT_TAG, LINE_EXECUTE
+)
+
+
+def test_bb_prompt_line():
+    ev = classify_line("NODE01> set EUtranCellFDD=1 qRxLevMin -124\n")
+    assert ev.kind == LINE_PROMPT
+    assert ev.value == "set EUtranCellFDD=1 qRxLevMin -124"
+    assert ev.trun is False
+    assert ev.unremote == 0
+
+
+def test_bb_run_script_name():
+    ev = classify_line("NODE01> run $nodename_CR_123.mos\n")
+    assert ev.kind == LINE_PROMPT
+    assert ev.script == "CR_123"
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("ERROR: crn : Parent MO not found\n", "ERROR: crn : Parent MO not found"),
+    ("!!!! Processing failure : MO already exists\n", "!!!! Processing failure : MO already exists"),
+    ("!!!! ERROR: operation-failed\n", "!!!! ERROR: operation-failed"),
+    (">>> Total: 0 MOs attempted, 0 MOs deleted\n", ">>> Total: 0 MOs attempted, 0 MOs deleted"),
+    ("Total: 1 MOs attempted, 1 MOs set\n", "Total: 1 MOs attempted, 1 MOs set"),
+    ("ERROR: x : y !!!! Processing z\n", "!!!! Processing z"),
+    ("Checking MOM version\n", None),
+])
+def test_bb_result_precedence(line, expected):
+    assert classify_line(line).tag_err == expected
+
+
+def test_trun_line_switches_to_rnc():
+    ev = classify_line("RNC01> truni $nodename_CR_9.mos\n")
+    assert ev.trun is True
+    assert ev.rnc_script == "$nodename_CR_9"
+    assert ev.tag_err is None
+
+
+@pytest.mark.parametrize("line, kind, value", [
+    ("CREATE\n", LINE_EXECUTE, "CREATE"),
+    ("SET UtranCell=1 primaryCpichPower 300\n", LINE_EXECUTE, "SET UtranCell=1 primaryCpichPower 300"),
+    ("DELETE UtranRelation=1\n", LINE_EXECUTE, "DELETE UtranRelation=1"),
+    ('!!!! Processing TAG :"Proxy ID = 5" on line 3\n', LINE_TAG, "Proxy ID = 5"),
+    (">>> [MoNotFound] UtranCell=1\n", LINE_ALT_TAG, "[MoNotFound]"),
+    ("   \n", LINE_BLANK, None),
+    ("   identity \"1\"\n", LINE_TEXT, None),
+])
+def test_rnc_lines(line, kind, value):
+    ev = classify_line(line, rnc=True)
+    assert (ev.kind, ev.value) == (kind, value)
+
+
+def test_unremote_markers():
+    assert classify_line("Checking ip contact...Not OK\n").unremote == 1
+    assert classify_line("TBAC Control - Unauthorised Network Element\n").unremote == 1
+    assert classify_line("NODE01> lt all\n").unremote == 0
+
+
+def test_section_collector_splits_sections():
+    collector = SectionCollector()
+    for line in [
+        "NODE01> ####LOG_Alarm_bf\n",
+        "Date;Time;Severity\n",
+        "2025-05-07;10:00;M\r\n",
+        "\n",
+        "ignored;row\n",
+        "NODE01> ####LOG_status_af\n",
+        "MO;operationalState\rCELL1;1 (ENABLED)\n",
+    ]:
+        collector.feed(line)
+    assert collector.sections["LOG_Alarm_bf"] == ["Date;Time;Severity", "2025-05-07;10:00;M"]
+    assert collector.sections["LOG_status_af"] == ["MO;operationalState", "CELL1;1 (ENABLED)"]
+    assert collector.sections["LOG_status_bf"] == []
@@ -0,0 +1,132 @@
+import zipfile
+
+import pandas as pd
+
+from lib.log_checker import (
+    scan_zip, scan_zip_files, find_section_spans, scan_hygiene_text, ColumnarRows, ITEM_CHECK_LIST,
+    column_widths, export_check_sheets,
+)
+
+
+HYGIENE_LOG = "\n".join([
+    "NODE01> lt all",
+    "NODE01> ####LOG_Alarm",
+    "Date;Time;Severity;Object;Problem;Cause;AdditionalText",
+    "2025-05-07 ; 10:00 ; Major ; Cell=1 ; Link failure ; cause ; text",
+    "NODE01> ####END_LOG_Alarm",
+    "NODE01> ####LOG_cellstatus",
+    "MO;administrativeState;operationalState",
+    "UtranCell=C1;1 (UNLOCKED);1 (ENABLED)",
+    "NODE01> ####END_LOG_cellstatus",
+]) + "\n"
+
+
+def _make_zip(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, text in members.items():
+            zf.writestr(name, text)
+    return str(path)
+
+
+def test_scan_zip_connection_rows(tmp_path):
+    zip_path = _make_zip(tmp_path / "ENM1.zip", {
+        "LOG/01_CHECK/NODE01.log": "NODE01> lt all\nbye\n",
+        "LOG/01_CHECK/NODE02.log": "Checking ip contact...Not OK\n",
+        "LOG/01_CHECK/NODE03.log": "Unable to connect to 10.0.0.3\n",
+        "README.txt": "not a node log\n",
+    })
+    result = scan_zip(zip_path)
+    assert result["status"] == "ok"
+    rows = result["rows"].to_frame()
+    assert list(zip(rows["NODENAME"], rows["REMARK"], rows["Count"])) == [
+        ("NODE01", "OK", 2),
+        ("NODE02", "UNREMOTE", 1),
+        ("NODE03", "UNREMOTE", 1),
+    ]
+
+
+def test_scan_zip_hygiene_sections(tmp_path):
+    zip_path = _make_zip(tmp_path / "ENM1.zip", {"LOG/99_Hygiene_collect/NODE01.log": HYGIENE_LOG})
+    result = scan_zip(zip_path)
+    alarms = result["alarms"].to_frame()
+    assert len(alarms) == 1
+    assert alarms.loc[0, "Problem"] == "Link failure"
+    assert alarms.loc[0, "Object"] == "Cell=1"
+    assert result["items"]["cellstatus"].to_frame().astype(object).to_dict("records") == [{
+        "FILE": "ENM1.zip", "NODENAME": "NODE01", "MO": "UtranCell=C1",
+        "administrativestate": "1 (UNLOCKED)", "operationalstate": "1 (ENABLED)",
+    }]
+
+
+def test_scan_zip_files_keeps_order_and_flags_bad_zips(tmp_path):
+    good = _make_zip(tmp_path / "A.zip", {"LOG/01_CHECK/NODE01.log": "x\n"})
+    empty = _make_zip(tmp_path / "B.zip", {})
+    bad = tmp_path / "C.zip"
+    bad.write_bytes(b"not a zip")
+    results = scan_zip_files([good, empty, str(bad)])
+    assert [(r["file"], r["status"]) for r in results] == [("A.zip", "ok"), ("B.zip", "empty"), ("C.zip", "bad")]
+
+
+def test_find_section_spans_indexes_markers_once():
+    lines = HYGIENE_LOG.split("\n")
+    spans = find_section_spans(HYGIENE_LOG)
+    assert spans["Alarm"] == [(2, 4)]
+    assert spans["cellstatus"] == [(6, 8)]
+    assert lines[6] == "MO;administrativeState;operationalState"
+
+
+def test_find_section_spans_open_section_runs_to_end():
+    spans = find_section_spans("x\n####LOG_bandwidth\nMO;earfcndl\nL1;100\n")
+    assert spans == {"LTE_data": [(2, None)]}
+
+
+def test_scan_hygiene_text_counts_lines_like_line_iteration():
+    alarms = ColumnarRows()
+    items = {item["name"]: ColumnarRows() for item in ITEM_CHECK_LIST}
+    row = scan_hygiene_text("a\r\nb\n  \n", "ENM1.zip", "99_Hygiene_collect", "NODE01", alarms, items)
+    assert row == ("ENM1.zip", "99_Hygiene_collect", "NODE01", "OK", 3)
+    assert len(alarms) == 0 and all(len(rows) == 0 for rows in items.values())
+
+
+def test_columnar_rows_matches_list_of_dicts():
+    records = [
+        {"FILE": "A.zip", "NODENAME": "N1", "MO": "C1", "earfcndl": "100"},
+        {"FILE": "A.zip", "NODENAME": "N2", "MO": "C2", "earfcnul": "200"},
+        {"FILE": "B.zip", "NODENAME": "N1", "MO": "C3", "earfcndl": "300", "earfcnul": "400"},
+    ]
+    first, second = ColumnarRows(), ColumnarRows()
+    for record in records[:2]:
+        first.add(tuple(record), tuple(record.values()))
+    second.add(tuple(records[2]), tuple(records[2].values()))
+    first.extend(second)
+
+    frame = first.to_frame()
+    assert frame["NODENAME"].dtype == "category"
+    pd.testing.assert_frame_equal(frame.astype(object), pd.DataFrame(records).astype(object))
+
+
+def test_columnar_rows_empty_frame_keeps_columns():
+    frame = ColumnarRows().to_frame(columns=("FILE", "REMARK"))
+    assert list(frame.columns) == ["FILE", "REMARK"]
+    assert frame.empty
+
+
+def test_column_widths_from_dataframe():
+    df = pd.DataFrame({"NODENAME": ["N1", "A_VERY_LONG_NODE_NAME_OVER_25_CHARS"], "Count": [1, None]})
+    assert column_widths(df) == [25, 7]
+
+
+def test_export_check_sheets_order_and_highlight(tmp_path):
+    import openpyxl
+
+    out_path = str(tmp_path / "MOBATCH_Check.xlsx")
+    export_check_sheets(out_path, {
+        "ALARM": pd.DataFrame({"NODENAME": ["N1"]}),
+        "ALARM_COMPARE": pd.DataFrame({"NODENAME": ["N1", "N2"], "REMARK_COMPARE": ["NEW Alarm", "Alarm Existing"]}),
+        "Cell_Status": pd.DataFrame({"NODENAME": ["N1"]}),
+        "Connection_Check": pd.DataFrame({"NODENAME": ["N1"]}),
+    })
+    wb = openpyxl.load_workbook(out_path)
+    assert wb.sheetnames == ["Connection_Check", "Cell_Status", "ALARM", "ALARM_COMPARE"]
+    rules = [(str(cf.sqref), rule.formula) for cf in wb["ALARM_COMPARE"].conditional_formatting for rule in cf.rules]
+    assert rules == [("A2:B3", ['$B2="NEW Alarm"'])]
@@ -0,0 +1,64 @@
+from lib.output_coalescer import OutputCoalescer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_first_push_is_shown_at_once_then_rate_limited():
+    clock = FakeClock()
+    out = OutputCoalescer(10, clock=clock)
+    assert out.delay() is None
+    assert out.push("a") is True
+    assert out.take() == (["a"], 0)
+
+    clock.now += 0.02
+    assert out.push("b") is False
+    assert out.push("c\nd") is False
+    assert abs(out.delay() - 0.08) < 1e-9
+    clock.now += 0.08
+    assert out.delay() == 0
+    assert out.take() == (["b", "c\nd"], 0)
+
+    # After a quiet spell output is shown at once again
+    clock.now += 1
+    assert out.push("e") is True
+    assert out.take() == (["e"], 0)
+    assert out.stats() == {'updates': 3, 'texts': 4, 'coalesced': 1, 'dropped': 0}
+
+
+def test_pending_lines_beyond_scrollback_are_dropped():
+    clock = FakeClock()
+    out = OutputCoalescer(10, max_pending_lines=3, clock=clock)
+    out.push("x")
+    out.take()
+    out.push("1\n2")
+    out.push("3")
+    out.push("4\n5\n6")
+    assert out.take() == (["4\n5\n6"], 3)
+    out.push("7\n8\n9\n10\n11")
+    assert out.take() == (["9\n10\n11"], 2)
+    assert out.stats()['dropped'] == 5
+    assert out.take() == ([], 0)
+
+
+def test_discard_last_only_removes_matching_pending_text():
+    out = OutputCoalescer(10, clock=FakeClock())
+    out.push("Connecting...")
+    out.take()
+    out.push("Waiting for prompt...")
+    assert out.discard_last("other") is False
+    assert out.discard_last("Waiting for prompt...") is True
+    assert out.delay() is None
+    assert out.discard_last("Waiting for prompt...") is False
+
+
+def test_no_line_limit_when_scrollback_is_unlimited():
+    out = OutputCoalescer(10, max_pending_lines=0, clock=FakeClock())
+    assert out.push("line one") is True
+    assert out.take() == (["line one"], 0)
+    assert out.stats()['dropped'] == 0
@@ -0,0 +1,128 @@
+import os
+
+import pandas as pd
+
+from lib.report_before_after import (
+    extract_log_patterns, read_files_from_folder, read_folders_parallel, remark_log_as_unremote, remark_log_text,
+    BYE_TAIL_SIZE, write_summary, write_alarm_dataframe_with_format, CHECKS, SECTION_PARSERS, SHEET_WRITERS,
+    PATTERN_MARKER, build_dataframes,
+)
+
+
+NODE_LOG = "\n".join([
+    "NODE01> lt all",
+    "NODE01> ####LOG_cellstatus",
+    "MO  ;  administrativeState ;operationalState",
+    "no separator here",
+    "NRCellDU=C1   ; 1 (UNLOCKED)\t;\t1 (ENABLED)",
+    "NODE01> ####END_LOG_cellstatus",
+    "NODE01> ####LOG_Alarm",
+    "Date;Time;Severity;Object;Problem;Cause;AdditionalText",
+    "2025-05-07 ; 10:00 ; Major ; Cell=1 ; Link failure ; cause ; text;more",
+    "NODE01> ####END_LOG_Alarm",
+    "Bye",
+]) + "\n"
+
+
+def test_extract_log_patterns_single_pass_cleanup():
+    sections = extract_log_patterns(NODE_LOG)
+    assert sorted(sections) == ["Alarm", "cellstatus"]
+    assert sections["cellstatus"] == (
+        "MO; administrativeState;operationalState\n"
+        "NRCellDU=C1; 1 (UNLOCKED)\t;\t1 (ENABLED)\n"
+    )
+
+
+def test_extract_log_patterns_marker_rules():
+    text = "\n".join([
+        "####END_LOG_bandwidth",
+        "####LOG_bandwidth",
+        "MO;x",
+        "####LOG_SleepState",
+        "MO;y",
+        "again ####LOG_SleepState ;",
+        "S1;1",
+        "####END_LOG_SleepState",
+        "S2;2",
+    ])
+    # bandwidth ends before it starts; a repeated start marker line is skipped
+    assert extract_log_patterns(text) == {"SleepState": "MO;y\nS1;1\n"}
+
+
+def test_read_files_from_folder_leaves_no_temp_files(tmp_path):
+    with open(os.path.join(tmp_path, "NODE01.log"), "w") as f:
+        f.write(NODE_LOG)
+    dataframes = read_files_from_folder(str(tmp_path))
+    assert os.listdir(tmp_path) == ["NODE01.log"]
+    assert dataframes["Summary"].to_dict("records") == [{"NODENAME": "NODE01", "MO": "NODE01", "Status": "OK"}]
+    assert dataframes["Cell Status"]["MO"].tolist() == ["NRCellDU=C1"]
+    alarm = dataframes["Alarm"]
+    assert alarm.loc[0, "Problem"] == " Link failure"
+    assert alarm.loc[0, "AdditionalText"].startswith(" text;more")
+    assert alarm.loc[0, "NODENAME"] == "NODE01"
+
+
+def test_read_folders_parallel_matches_serial(tmp_path):
+    folders = []
+    for name, nodes in (("Before", 5), ("After", 3)):
+        folder = tmp_path / name
+        folder.mkdir()
+        for n in range(nodes):
+            (folder / f"NODE{n:02d}.log").write_text(NODE_LOG.replace("NODE01", f"NODE{n:02d}"))
+        folders.append(str(folder))
+
+    parallel = read_folders_parallel(folders, workers=2)
+    for folder, dataframes in zip(folders, parallel):
+        serial = read_files_from_folder(folder)
+        assert list(dataframes) == list(serial)
+        for key in serial:
+            pd.testing.assert_frame_equal(dataframes[key], serial[key])
+
+
+def test_remark_log_tail_and_full_scan(tmp_path):
+    path = tmp_path / "NODE01.log"
+    filler = "x" * 99 + "\n"
+    cases = [
+        ("lt all\nBye\n", "OK"),
+        ("Bye\n" + filler * (BYE_TAIL_SIZE // 50), "OK"),  # only found by the full scan
+        (filler * (BYE_TAIL_SIZE // 100) + "Bye", "OK"),
+        ("x Bye\n" + filler, "Unremote"),
+        ("", "Unremote"),
+    ]
+    for text, expected in cases:
+        path.write_text(text)
+        assert remark_log_as_unremote(str(path)) == expected
+        assert remark_log_text(text) == expected
+
+
+def test_summary_and_alarm_sheets_bulk_written(tmp_path, capsys):
+    import openpyxl
+
+    path = str(tmp_path / "report.xlsx")
+    summary = pd.DataFrame({"NODENAME": ["N1", "N2"], "Status_Before": ["OK", "Unremote"], "Status_After": ["OK", "OK"]})
+    cells = pd.DataFrame({"NODENAME": ["N1"], "MO": ["C1"]})
+    alarms = pd.DataFrame({col: ["x"] for col in ["NODENAME", "Date", "Time", "Severity", "Problem", "Object", "Cause", "AdditionalText"]})
+    alarms["Cause"] = float("nan")
+    with pd.ExcelWriter(path, engine="xlsxwriter") as writer:
+        write_summary(summary, "Summary", writer, cells, cells)
+        write_alarm_dataframe_with_format(alarms, "Alarm_After", writer)
+    assert capsys.readouterr().out == ""
+
+    wb = openpyxl.load_workbook(path)
+    ws = wb["Summary"]
+    assert [c.value for c in ws[1]][:5] == ["NODENAME", "Status_Before", "Status_After", "Cell_COUNT_Before", "Cell_COUNT_After"]
+    assert [c.value for c in ws[3]][:5] == ["N2", "Unremote", "OK", None, None]
+    assert ws["A2"].border.left.style == "thin" and ws["D2"].value == 1
+    assert ws["A1"].fill.fgColor.rgb == "FFFFFF00"
+    alarm_ws = wb["Alarm_After"]
+    assert alarm_ws["A1"].value == 1
+    assert [c.value for c in alarm_ws[3]] == ["x"] * 6 + [None, "x"]
+
+
+def test_check_registry_is_complete():
+    assert len({check.marker for check in CHECKS}) == len({check.key for check in CHECKS}) == len(CHECKS)
+    for check in CHECKS:
+        assert check.parser in SECTION_PARSERS and check.writer in SHEET_WRITERS
+        assert PATTERN_MARKER.search(f"NODE01> ####LOG_{check.marker}").group(2) == check.marker
+    # Sheet order: Summary first, then the checks in registry order
+    assert list(build_dataframes([])) == ["Summary"] + [check.key for check in CHECKS]
@@ -0,0 +1,78 @@
+import re
+
+import pandas as pd
+
+from lib.report_before_after_KPI import process_kpi_logs, read_kpi_values, create_main_merge_df, transform_headers
+
+
+KPI_LOG = "\n".join([
+    "NODE01> lt all",
+    "GREP_KPI_LTE; Object; Counter; 2025-04-10 09:15; 2025-04-10 09:00; 2025-04-10 09:30;",
+    "GREP_KPI_LTE; EUtranCellFDD=C1; Acc_RrcConnSetupSuccRate; 99.50; N/A; 98;",
+    "GREP_KPI_LTE; EUtranCellFDD=C2; Acc_RrcConnSetupSuccRate; 97.25;",
+    "GREP_KPI_5G; Object; Counter; 2025-04-10 09:00;",
+    "GREP_KPI_5G; NRCellDU=C1; Acc_RrcConnSetupSuccRate; 90;",
+    "Bye",
+]) + "\n"
+
+
+def test_read_kpi_values_long_table(tmp_path):
+    (tmp_path / "NODE01.log").write_text(KPI_LOG)
+    values = read_kpi_values(str(tmp_path), "GREP_KPI_LTE")
+    assert list(values.columns) == ["NODENAME", "Object", "Counter", "ROP", "value"]
+    assert values["ROP"].dtype == "datetime64[ns]" and values["value"].dtype == "float64"
+    # Values follow the sorted headers; short rows are padded with NaN
+    assert values.index.tolist() == [0, 0, 0, 1, 1, 1]
+    assert values["ROP"].iloc[:3].dt.strftime("%H:%M").tolist() == ["09:00", "09:15", "09:30"]
+    assert values["value"].fillna(-1).tolist() == [99.5, -1, 98.0, 97.25, -1, -1]
+
+
+def test_process_kpi_logs_pivots_rops_from_start(tmp_path):
+    (tmp_path / "NODE01.log").write_text(KPI_LOG)
+    (tmp_path / "NODE02.log").write_text("NODE02> lt all\nBye\n")
+    df = process_kpi_logs(str(tmp_path), "GREP_KPI_LTE", "2025-04-10 09:15")
+    assert list(df.columns) == ["NODENAME", "Object", "Counter", "2025-04-10 09:15", "2025-04-10 09:30"]
+    assert df.values.tolist() == [
+        ["NODE01", "EUtranCellFDD=C1", "Acc_RrcConnSetupSuccRate", "N/A", 98.0],
+        ["NODE01", "EUtranCellFDD=C2", "Acc_RrcConnSetupSuccRate", "N/A", "N/A"],
+    ]
+    assert process_kpi_logs(str(tmp_path), "GREP_KPI_NONE", "NO_START").columns.tolist() == ["NODENAME", "Object", "Counter"]
+
+
+def _merge_per_counter(before_df, after_df):
+    # create_main_merge_df before the single unstack, as the reference
+    keys = ["NODENAME", "Object", "Counter"]
+    before_df = before_df.rename(columns={col: f"{col}_BEFORE" for col in before_df.columns if col not in keys})
+    after_df = after_df.rename(columns={col: f"{col}_AFTER" for col in after_df.columns if col not in keys})
+    merged_df = before_df.merge(after_df, on=keys, how="outer")
+    counter_values = merged_df["Counter"].unique()
+    main_merge_df = None
+    for counter in counter_values:
+        temp_df = merged_df[merged_df["Counter"] == counter].drop(columns=["Counter"])
+        if main_merge_df is None:
+            main_merge_df = temp_df
+        else:
+            main_merge_df = main_merge_df.merge(temp_df, on=["NODENAME", "Object"], how="outer", suffixes=("", f"_{counter}"))
+    return main_merge_df.rename(columns=lambda col: re.sub(r"_(BEFORE|AFTER)$", rf"_\1_{counter_values[0]}", col))
+
+
+def _kpi_frame(nodes, counters, rops):
+    rows = [
+        [f"NODE{n:02d}", f"EUtranCellFDD=C{c}", counter] + [n + c + r / 4 if (n + r) % 5 else "N/A" for r in range(len(rops))]
+        for n in nodes for c in range(2) for counter in counters
+    ]
+    return pd.DataFrame(rows, columns=["NODENAME", "Object", "Counter"] + rops)
+
+
+def test_create_main_merge_df_matches_per_counter_merge():
+    rops = [f"2025-04-10 09:{m:02d}" for m in (0, 15, 30)]
+    before = _kpi_frame(range(0, 6), ["Ret_ErabDropRate", "Acc_RrcConnSetupSuccRate", "Int_DlThroughput"], rops)
+    after = _kpi_frame(range(2, 8), ["Acc_RrcConnSetupSuccRate", "Ret_ErabDropRate"], rops[1:])
+
+    result = create_main_merge_df(before, after)
+    expected = _merge_per_counter(before, after)
+    assert list(result.columns) == list(expected.columns)
+    pd.testing.assert_frame_equal(result.astype(object), expected.astype(object))
+    assert transform_headers(result)[0][2:4] == ["Acc_RrcConnSetupSuccRate"] * 2
+    assert transform_headers(result)[1][2] == "BEFORE" and transform_headers(result)[2][2] == "2025-04-10 09:00"
+    assert create_main_merge_df(before.iloc[0:0], after.iloc[0:0]) is None
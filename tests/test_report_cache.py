@@ -0,0 +1,77 @@
+import os
+
+from lib.report_cache import LogParseCache, cache_path_for
+
+
+def _parsed(filename):
+    return (filename, [("CR", filename[:-4], "CR_1", "set X=1", "SUCCESS", "Total: 1 MOs attempted, 1 MOs set", [])], {}, 10)
+
+
+def _write_log(folder, name, text):
+    with open(os.path.join(folder, name), "w") as f:
+        f.write(text)
+
+
+def test_cache_hits_unchanged_logs(tmp_path):
+    folder = str(tmp_path)
+    _write_log(folder, "NODE1.log", "a\n")
+    _write_log(folder, "NODE2.log", "b\n")
+    args_list = [("NODE1.log", folder, "CR"), ("NODE2.log", folder, "CR")]
+    path = cache_path_for(folder, "CR")
+
+    cache = LogParseCache(path)
+    cached, to_parse, signatures = cache.split(args_list)
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert cached == [] and to_parse == args_list
+    cache.store([_parsed("NODE1.log"), _parsed("NODE2.log")], signatures)
+    cache.close()
+
+    cache = LogParseCache(path)
+    cached, to_parse, _ = cache.split(args_list)
+    cache.close()
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert to_parse == []
+    assert sorted(cached) == sorted([_parsed("NODE1.log"), _parsed("NODE2.log")])
+
+
+def test_cache_misses_changed_and_new_logs(tmp_path):
+    folder = str(tmp_path)
+    _write_log(folder, "NODE1.log", "a\n")
+    path = cache_path_for(folder, "CR")
+    cache = LogParseCache(path)
+    _, _, signatures = cache.split([("NODE1.log", folder, "CR")])
+    cache.store([_parsed("NODE1.log")], signatures)
+    cache.close()
+
+    _write_log(folder, "NODE1.log", "a retried\n")
+    _write_log(folder, "NODE2.log", "b\n")
+    args_list = [("NODE1.log", folder, "CR"), ("NODE2.log", folder, "CR")]
+    cache = LogParseCache(path)
+    cached, to_parse, _ = cache.split(args_list)
+    cache.close()
+    assert cached == []
+    assert to_parse == args_list
+
+
+def test_corrupt_cache_file_is_reset(tmp_path):
+    path = str(tmp_path / "CR_report_cache.sqlite")
+    with open(path, "wb") as f:
+        f.write(b"not a database" * 100)
+    cache = LogParseCache(path)
+    cached, to_parse, _ = cache.split([])
+    cache.close()
+    assert cached == [] and to_parse == []
+
+
+def test_read_only_cache_does_not_stop_cleanup(tmp_path):
+    folder = str(tmp_path)
+    _write_log(folder, "NODE1.log", "a\n")
+    path = cache_path_for(folder, "CR")
+    cache = LogParseCache(path)
+    _, _, signatures = cache.split([("NODE1.log", folder, "CR")])
+    cache.store([_parsed("NODE1.log")], signatures)
+    # NODE1.log is gone and the stale row cannot be deleted
+    cache.conn.execute("PRAGMA query_only = ON")
+    cached, to_parse, _ = cache.split([])
+    cache.close()
+    assert cached == [] and to_parse == []
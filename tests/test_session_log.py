@@ -0,0 +1,29 @@
+import gzip
+
+from lib.session_log import SessionLogWriter
+
+
+def test_lines_buffered_until_flush_and_reopened_after_close(tmp_path):
+    path = tmp_path / "S1.log"
+    writer = SessionLogWriter(str(path), flush_interval=3600)
+    writer.write_lines(["[t]a", "[t]b"])
+    assert path.read_text() == ""  # still in the buffer
+    writer.flush_if_due()
+    assert path.read_text() == ""
+    writer.close()
+    assert path.read_text() == "[t]a\n[t]b\n"
+    writer.write_lines(["[t]Disconnected"])
+    writer.close()
+    assert path.read_text().endswith("[t]b\n[t]Disconnected\n")
+
+
+def test_rotation_with_compression(tmp_path):
+    path = tmp_path / "S1.log"
+    writer = SessionLogWriter(str(path), max_bytes=10, compress=True, flush_size=1)
+    writer.write_lines(["0123456789"])
+    writer.write_lines(["next"])
+    writer.close()
+    rotated = [p for p in tmp_path.iterdir() if p.name.endswith(".log.gz")]
+    assert len(rotated) == 1 and rotated[0].name.startswith("S1.")
+    assert gzip.decompress(rotated[0].read_bytes()) == b"0123456789\n"
+    assert path.read_text() == "next\n"
@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from lib.ssh_pool import SSHConnectionPool
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+
+    def is_active(self):
+        return self.active
+
+    def is_authenticated(self):
+        return self.active
+
+
+class FakeClient:
+    # Just enough of paramiko.SSHClient for the pool
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return self.transport
+
+    def close(self):
+        self.closed = True
+        self.transport.active = False
+
+
+TARGET = {'session_name': 'ENM1', 'host': 'enm1', 'port': 22, 'username': 'u', 'password': 'p'}
+
+
+def _pool(**kwargs):
+    connected = []
+
+    def connect(target):
+        time.sleep(0.01)
+        connected.append(FakeClient())
+        return connected[-1]
+    return SSHConnectionPool(connect=connect, **kwargs), connected
+
+
+def test_one_connection_shared_per_target():
+    pool, connected = _pool(idle_timeout=60)
+    clients = []
+    threads = [threading.Thread(target=lambda: clients.append(pool.acquire(TARGET))) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(connected) == 1 and clients == connected * 3
+    assert (pool.connects, pool.reuses) == (1, 2)
+
+    other = pool.acquire(dict(TARGET, username='v'))
+    assert other is connected[1]
+    for client in clients + [other]:
+        pool.release(client)
+    assert not any(client.closed for client in connected)
+
+
+def test_max_users_opens_another_connection():
+    pool, connected = _pool(idle_timeout=60, max_users=2)
+    clients = [pool.acquire(TARGET) for _ in range(3)]
+    assert clients == [connected[0], connected[0], connected[1]]
+    pool.release(clients[0])
+    assert pool.acquire(TARGET) is connected[0]
+
+
+def test_dead_connection_is_replaced():
+    pool, connected = _pool(idle_timeout=60)
+    first = pool.acquire(TARGET)
+    first.transport.active = False
+    second = pool.acquire(TARGET)
+    assert second is not first and first.closed
+    pool.release(first)
+    pool.release(second)
+    assert not second.closed
+
+
+def test_idle_connections_are_evicted():
+    pool, connected = _pool(idle_timeout=0.05)
+    held = pool.acquire(TARGET)
+    idle = pool.acquire(dict(TARGET, host='enm2'))
+    pool.release(idle)
+    time.sleep(0.2)
+    assert idle.closed and not held.closed
+    pool.release(held)
+    time.sleep(0.2)
+    assert held.closed
+    assert pool.acquire(TARGET) is connected[2]
+
+
+def test_failed_connect_is_not_pooled():
+    def connect(target):
+        raise OSError("unreachable")
+    pool = SSHConnectionPool(connect=connect)
+    with pytest.raises(OSError):
+        pool.acquire(TARGET)
+    assert pool._connections == {}
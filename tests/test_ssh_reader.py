@@ -0,0 +1,105 @@
+import socket
+import threading
+
+from lib.ssh_reader import ChannelReader
+
+
+class FakeChannel:
+    # Just enough of paramiko.Channel: like its pipe, the socket pair only
+    # signals readiness, the data waits in the stdout and stderr buffers
+    def __init__(self):
+        self._pipe, self._peer = socket.socketpair()
+        self._pipe.setblocking(False)
+        self._stdout, self._stderr = bytearray(), bytearray()
+        self.closed = False
+        self.eof_received = False
+
+    def fileno(self):
+        return self._pipe.fileno()
+
+    def _set_event(self):
+        self._peer.send(b"*")
+
+    def _take(self, buffer, size):
+        data = bytes(buffer[:size])
+        del buffer[:size]
+        if not self._stdout and not self._stderr and not self.eof_received:
+            try:
+                while self._pipe.recv(4096):
+                    pass
+            except BlockingIOError:
+                pass
+        return data
+
+    def feed(self, data):
+        self._stdout += data
+        self._set_event()
+
+    def feed_stderr(self, data):
+        self._stderr += data
+        self._set_event()
+
+    def remote_close(self):
+        self.eof_received = True
+        self._set_event()
+
+    def recv_ready(self):
+        return bool(self._stdout)
+
+    def recv(self, size):
+        return self._take(self._stdout, size)
+
+    def recv_stderr_ready(self):
+        return bool(self._stderr)
+
+    def recv_stderr(self, size):
+        return self._take(self._stderr, size)
+
+
+def test_channel_reader_multiplexes_channels():
+    reader = ChannelReader(idle_interval=0.05)
+    channels = [FakeChannel(), FakeChannel()]
+    received = {0: [], 1: []}
+    closed = threading.Event()
+    idle = threading.Event()
+    got_data = threading.Event()
+
+    def on_data(i):
+        def handle(data):
+            received[i].append(data)
+            if b"".join(received[1]) == b"world":
+                got_data.set()
+        return handle
+
+    reader.register(channels[0], on_data(0), on_close=closed.set, on_idle=idle.set)
+    reader.register(channels[1], on_data(1))
+    channels[0].feed(b"hello")
+    channels[1].feed(b"world")
+    assert got_data.wait(2) and idle.wait(2)
+    assert b"".join(received[0]) == b"hello"
+
+    channels[0].remote_close()
+    assert closed.wait(2)
+    reader.unregister(channels[1])
+    reader.stop()
+    assert not reader._fds
+
+
+def test_channel_reader_delivers_stderr_only_output():
+    reader = ChannelReader()
+    channel = FakeChannel()
+    received = []
+    got_data = threading.Event()
+
+    def on_data(data):
+        received.append(data)
+        if b"".join(received) == b"err\n":
+            got_data.set()
+
+    reader.register(channel, on_data)
+    channel.feed_stderr(b"err\n")
+    assert got_data.wait(2)
+    # Drained, so the pipe no longer wakes the reader up, so the pipe no longer wakes the reader up
+    assert not channel.recv_ready() and not channel.recv_stderr_ready()
+    reader.unregister(channel)
+    reader.stop()